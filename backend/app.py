@@ -1,7 +1,13 @@
 """
 MealTogether - Entry point for the Flask application
 """
-import os
+from app.config import settings
+
+# Monkey patching must happen before anything else imports socket/threading
+if settings.socketio_async_mode == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+
 from app import create_app, socketio, db
 
 app = create_app()
@@ -12,14 +18,14 @@ if __name__ == '__main__':
         db.create_all()
 
     # Run with SocketIO
-    port = int(os.getenv('PORT', 5000))
-    debug = os.getenv('FLASK_ENV') != 'production'
-    # Only allow unsafe Werkzeug in development
-    allow_unsafe = debug and os.getenv('FLASK_ENV') == 'development'
+    debug = not settings.is_production
+    # Only allow unsafe Werkzeug in development (ignored under eventlet, which
+    # serves with its own WSGI server; production runs under gunicorn)
+    allow_unsafe = settings.is_development
     socketio.run(
         app,
         host='0.0.0.0',
-        port=port,
+        port=settings.port,
         debug=debug,
         allow_unsafe_werkzeug=allow_unsafe
     )
@@ -2,18 +2,14 @@
 MealTogether - Collaborative Meal Planning Application
 Flask application factory and initialization
 """
-import os
-from flask import Flask
+from flask import Flask, Response
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_socketio import SocketIO
 from flask_caching import Cache
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from app.config import settings
 
 # Initialize extensions
 db = SQLAlchemy()
@@ -22,38 +18,54 @@ jwt = JWTManager()
 socketio = SocketIO(cors_allowed_origins="*")
 cache = Cache()
 
+# Liveness probe body; never touches the database
+_HEALTH_BODY = b'{"status":"healthy"}'
+
 
 def create_app(config_name=None):
     """Application factory pattern"""
     app = Flask(__name__)
 
-    # Configuration
-    app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
-    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'postgresql://localhost/meal_together_dev')
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'jwt-secret-key')
-    app.config['JWT_ACCESS_TOKEN_EXPIRES'] = int(os.getenv('JWT_ACCESS_TOKEN_EXPIRES', 3600))
-    app.config['JWT_REFRESH_TOKEN_EXPIRES'] = int(os.getenv('JWT_REFRESH_TOKEN_EXPIRES', 2592000))
+    # orjson for all JSON responses (and jsonb values read through psycopg)
+    from app.utils.serialization import ORJSONProvider, SocketIOJSON, install_psycopg_json
+    app.json = ORJSONProvider(app)
+    install_psycopg_json()
 
-    # Cache configuration
-    app.config['CACHE_TYPE'] = 'redis'
-    app.config['CACHE_REDIS_URL'] = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
-    app.config['CACHE_DEFAULT_TIMEOUT'] = 300  # 5 minutes default
+    # Configuration (parsed once from the environment in app.config)
+    app.config.from_mapping(settings.flask_config())
 
     # Initialize extensions with app
     db.init_app(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
-    socketio.init_app(app, async_mode='threading', cors_allowed_origins="*")
+    jwt_key = settings.jwt_key
+    jwt.encode_key_loader(lambda identity: jwt_key)
+    jwt.decode_key_loader(lambda jwt_header, jwt_data: jwt_key)
+    # eventlet gives native WebSocket transport; the Redis message queue lets
+    # several workers (and Celery) broadcast to the same rooms
+    socketio.init_app(
+        app,
+        async_mode=settings.socketio_async_mode,
+        message_queue=settings.socketio_message_queue,
+        json=SocketIOJSON,
+        cors_allowed_origins="*"
+    )
     cache.init_app(app)
 
+    # Flag lazy-load N+1 patterns during development
+    if app.debug:
+        try:
+            from nplusone.ext.flask_sqlalchemy import NPlusOne
+            NPlusOne(app)
+        except ImportError:
+            pass
+
     # CORS configuration
-    frontend_url = os.getenv('FRONTEND_URL', 'http://localhost:5173')
     CORS(app, resources={
         r"/api/*": {
-            "origins": [frontend_url],
+            "origins": [settings.frontend_url],
             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization"],
+            "allow_headers": ["Content-Type", "Authorization", "X-Socket-ID"],
             "expose_headers": ["Authorization", "X-RateLimit-Limit", "X-RateLimit-Remaining", "X-RateLimit-Reset"],
             "supports_credentials": True
         }
@@ -76,10 +88,10 @@ def create_app(config_name=None):
     from app.utils.logger import setup_logger
     logger = setup_logger(app)
 
-    # Health check endpoint
-    @app.route('/health')
+    # Health check endpoint (pre-serialized, skips jsonify)
     def health():
-        return {'status': 'healthy'}, 200
+        return Response(_HEALTH_BODY, status=200, mimetype='application/json')
+    app.add_url_rule('/health', 'health', health, provide_automatic_options=False)
 
     # Error handlers
     @app.errorhandler(404)
@@ -0,0 +1,90 @@
+"""
+Application settings parsed once from the environment
+"""
+import os
+from dataclasses import dataclass
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Typed view of the environment, built once at import time"""
+    env: str
+    debug_flag: str
+    secret_key: str
+    database_url: str
+    db_pool_size: int
+    db_max_overflow: int
+    jwt_secret_key: str
+    jwt_access_token_expires: int
+    jwt_refresh_token_expires: int
+    redis_url: str
+    socketio_async_mode: str
+    socketio_message_queue: str
+    frontend_url: str
+    port: int
+
+    @classmethod
+    def from_env(cls):
+        """Read and parse every setting from os.environ"""
+        redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+        return cls(
+            env=os.getenv('FLASK_ENV', 'production'),
+            debug_flag=os.getenv('FLASK_DEBUG', 'False'),
+            secret_key=os.getenv('SECRET_KEY', 'dev-secret-key'),
+            database_url=os.getenv('DATABASE_URL', 'postgresql://localhost/meal_together_dev'),
+            db_pool_size=int(os.getenv('DB_POOL_SIZE', 20)),
+            db_max_overflow=int(os.getenv('DB_MAX_OVERFLOW', 40)),
+            jwt_secret_key=os.getenv('JWT_SECRET_KEY', 'jwt-secret-key'),
+            jwt_access_token_expires=int(os.getenv('JWT_ACCESS_TOKEN_EXPIRES', 3600)),
+            jwt_refresh_token_expires=int(os.getenv('JWT_REFRESH_TOKEN_EXPIRES', 2592000)),
+            redis_url=redis_url,
+            socketio_async_mode=os.getenv('SOCKETIO_ASYNC_MODE', 'eventlet'),
+            socketio_message_queue=os.getenv('SOCKETIO_MESSAGE_QUEUE', redis_url),
+            frontend_url=os.getenv('FRONTEND_URL', 'http://localhost:5173'),
+            port=int(os.getenv('PORT', 5000)),
+        )
+
+    @property
+    def jwt_key(self):
+        """HMAC key as bytes, so PyJWT does not re-encode the secret per token"""
+        return self.jwt_secret_key.encode('utf-8')
+
+    @property
+    def is_development(self):
+        return self.env == 'development'
+
+    @property
+    def is_production(self):
+        return self.env == 'production'
+
+    def flask_config(self):
+        """Flask/extension config keys derived from these settings"""
+        return {
+            'SECRET_KEY': self.secret_key,
+            'SQLALCHEMY_DATABASE_URI': self.database_url,
+            'SQLALCHEMY_TRACK_MODIFICATIONS': False,
+            'SQLALCHEMY_ENGINE_OPTIONS': {
+                'pool_size': self.db_pool_size,
+                'max_overflow': self.db_max_overflow,
+                'pool_pre_ping': True,
+                'pool_recycle': 300,
+            },
+            'SQLALCHEMY_RECORD_QUERIES': self.is_development,
+            'JWT_SECRET_KEY': self.jwt_secret_key,
+            'JWT_ALGORITHM': 'HS256',
+            'JWT_DECODE_ALGORITHMS': ['HS256'],
+            'JWT_ACCESS_TOKEN_EXPIRES': self.jwt_access_token_expires,
+            'JWT_REFRESH_TOKEN_EXPIRES': self.jwt_refresh_token_expires,
+            # Cache configuration
+            'CACHE_TYPE': 'RedisCache',
+            'CACHE_REDIS_URL': self.redis_url,
+            'CACHE_DEFAULT_TIMEOUT': 300,  # 5 minutes default
+        }
+
+
+settings = Settings.from_env()
@@ -1,37 +1,126 @@
 """
 Base model class with common functionality
 """
-from datetime import datetime
+from operator import attrgetter
+from sqlalchemy import column, func, insert, select, values
 from app import db
 
 
+# Per-model (field names, attrgetter) pairs used by BaseModel.to_dict
+_FIELD_GETTERS = {}
+
+
+def utc_now():
+    """SQL expression for the current UTC time as a naive timestamp"""
+    return func.timezone('utc', func.now())
+
+
 class BaseModel(db.Model):
     """Abstract base model with common fields and methods"""
     __abstract__ = True
 
     id = db.Column(db.Integer, primary_key=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Timestamps are produced by the database (no per-row Python callback)
+    created_at = db.Column(db.DateTime, server_default=utc_now(), nullable=False)
+    updated_at = db.Column(db.DateTime, server_default=utc_now(), onupdate=utc_now(), nullable=False)
+
+    # Fetch server-generated timestamps with RETURNING on INSERT *and* UPDATE,
+    # so reading created_at/updated_at after a flush needs no extra SELECT
+    __mapper_args__ = {'eager_defaults': True}
+
+    # Column attributes copied verbatim by to_dict(); extended by each model
+    serialize_fields = ()
+
+    @classmethod
+    def _field_getter(cls):
+        """Field names and a single attrgetter for them, built once per model"""
+        entry = _FIELD_GETTERS.get(cls)
+        if entry is None:
+            names = ('id', 'created_at', 'updated_at') + tuple(cls.serialize_fields)
+            entry = _FIELD_GETTERS[cls] = (names, attrgetter(*names))
+        return entry
 
     def to_dict(self):
-        """Convert model to dictionary"""
-        return {
-            'id': self.id,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-    def save(self):
-        """Save model to database"""
+        """Convert model to dictionary (datetimes are formatted by the JSON provider)"""
+        names, getter = self._field_getter()
+        return dict(zip(names, getter(self)))
+
+    def _loaded(self, name):
+        """Value of an attribute only if already loaded; never emits a query (for __repr__)"""
+        return self.__dict__.get(name)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {self._loaded("id")}>'
+
+    def save(self, commit=True):
+        """Save model to database (flush only when commit=False)"""
         db.session.add(self)
-        db.session.commit()
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
         return self
 
-    def delete(self):
-        """Delete model from database"""
-        db.session.delete(self)
+    @classmethod
+    def bulk_create(cls, rows, commit=True):
+        """
+        Insert many rows with a single INSERT ... RETURNING and one commit
+
+        Args:
+            rows: List of column-value dicts
+            commit: When False the caller commits; the returned instances are
+                still fully populated from RETURNING, so they can be
+                serialized first without any reload
+
+        Returns:
+            list: Created instances, in input order
+        """
+        if not rows:
+            return []
+
+        objects = db.session.scalars(insert(cls).returning(cls), rows).all()
+        if not commit:
+            return objects
+
+        ids = [obj.id for obj in objects]
         db.session.commit()
 
+        # Reload the expired instances together rather than one SELECT each
+        cls.query.filter(cls.id.in_(ids)).all()
+        return objects
+
+    @classmethod
+    def bulk_create_where(cls, rows, condition):
+        """
+        INSERT ... SELECT FROM (VALUES ...) WHERE condition RETURNING, as one statement
+
+        Lets a write carry its own guard (e.g. an EXISTS on the parent row)
+        instead of a separate SELECT first. The caller commits.
+
+        Args:
+            rows: Non-empty list of column-value dicts, all with the same keys
+            condition: SQL boolean expression gating the insert
+
+        Returns:
+            list: Created instances; empty when the condition was false
+        """
+        names = list(rows[0])
+        table = cls.__table__
+        source = values(
+            *(column(name, table.c[name].type) for name in names), name='new_rows'
+        ).data([tuple(row[name] for name in names) for row in rows])
+
+        stmt = insert(cls).from_select(names, select(*source.c).where(condition)).returning(cls)
+        return db.session.scalars(stmt).all()
+
+    def delete(self, commit=True):
+        """Delete model from database (flush only when commit=False)"""
+        db.session.delete(self)
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
+
     @classmethod
     def get_by_id(cls, id):
         """Get model by ID"""
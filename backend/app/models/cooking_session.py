@@ -2,17 +2,18 @@
 Cooking session and active timer models
 """
 from datetime import datetime
+from sqlalchemy.orm import joinedload, selectinload
 from app import db
-from app.models.base import BaseModel
+from app.models.base import BaseModel, utc_now
 
 
 class CookingSession(BaseModel):
     """Active cooking session for a recipe"""
     __tablename__ = 'cooking_sessions'
 
-    recipe_id = db.Column(db.Integer, db.ForeignKey('recipes.id'), nullable=False)
-    family_id = db.Column(db.Integer, db.ForeignKey('families.id'), nullable=False)
-    started_by_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    recipe_id = db.Column(db.Integer, db.ForeignKey('recipes.id'), nullable=False, index=True)
+    family_id = db.Column(db.Integer, db.ForeignKey('families.id'), nullable=False, index=True)
+    started_by_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
     target_time = db.Column(db.DateTime)  # Target completion time for timeline scheduling
     actual_start_time = db.Column(db.DateTime)  # When actually started cooking
     completed_at = db.Column(db.DateTime, nullable=True)
@@ -24,6 +25,35 @@ class CookingSession(BaseModel):
     started_by = db.relationship('User')
     active_timers = db.relationship('ActiveTimer', back_populates='cooking_session', cascade='all, delete-orphan')
 
+    __table_args__ = (
+        db.Index('ix_cooking_sessions_family_active', 'family_id', postgresql_where=db.text('is_active')),
+    )
+
+    @classmethod
+    def query_with_details(cls, with_started_by=True):
+        """Query that eager-loads everything to_dict(include_timers=True) touches
+
+        Pass with_started_by=False when a UserLoader supplies started_by.
+        """
+        from app.models.recipe import Recipe
+        options = [
+            selectinload(cls.recipe).selectinload(Recipe.assigned_to),
+            selectinload(cls.active_timers),
+        ]
+        if with_started_by:
+            options.append(selectinload(cls.started_by))
+        return cls.query.options(*options)
+
+    @classmethod
+    def get_with_details(cls, session_id):
+        """Single session with recipe, starter and timers fetched in one joined SELECT"""
+        from app.models.recipe import Recipe
+        return cls.query.options(
+            joinedload(cls.recipe).joinedload(Recipe.assigned_to),
+            joinedload(cls.started_by),
+            joinedload(cls.active_timers)
+        ).filter_by(id=session_id).first()
+
     @property
     def is_completed(self):
         """Check if session is completed"""
@@ -37,39 +67,42 @@ class CookingSession(BaseModel):
         end_time = self.completed_at or datetime.utcnow()
         return int((end_time - self.actual_start_time).total_seconds() / 60)
 
-    def to_dict(self, include_timers=False):
-        """Convert to dictionary"""
+    serialize_fields = (
+        'recipe_id', 'family_id', 'started_by_id', 'target_time',
+        'actual_start_time', 'completed_at', 'is_active',
+    )
+
+    def to_dict(self, include_timers=False, loader=None):
+        """Convert to dictionary (pass a UserLoader to batch started_by lookups)"""
         data = super().to_dict()
+        if loader is not None:
+            started_by = loader.get_dict(self.started_by_id)
+        else:
+            started_by = self.started_by.to_dict() if self.started_by else None
         data.update({
-            'recipe_id': self.recipe_id,
             'recipe': self.recipe.to_dict() if self.recipe else None,
-            'family_id': self.family_id,
-            'started_by_id': self.started_by_id,
-            'started_by': self.started_by.to_dict() if self.started_by else None,
-            'target_time': self.target_time.isoformat() if self.target_time else None,
-            'actual_start_time': self.actual_start_time.isoformat() if self.actual_start_time else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-            'is_active': self.is_active,
-            'is_completed': self.is_completed,
+            'started_by': started_by,
+            'is_completed': data['completed_at'] is not None,
             'duration': self.duration,
         })
         if include_timers:
-            data['active_timers'] = [timer.to_dict() for timer in self.active_timers]
+            now = datetime.utcnow()
+            data['active_timers'] = [timer.to_dict(now) for timer in self.active_timers]
         return data
 
     def __repr__(self):
-        status = 'completed' if self.is_completed else 'active'
-        return f'<CookingSession recipe={self.recipe_id} {status}>'
+        status = 'completed' if self._loaded('completed_at') is not None else 'active'
+        return f'<CookingSession {self._loaded("id")} recipe={self._loaded("recipe_id")} {status}>'
 
 
 class ActiveTimer(BaseModel):
     """Active timer during a cooking session"""
     __tablename__ = 'active_timers'
 
-    cooking_session_id = db.Column(db.Integer, db.ForeignKey('cooking_sessions.id'), nullable=False)
+    cooking_session_id = db.Column(db.Integer, db.ForeignKey('cooking_sessions.id'), nullable=False, index=True)
     name = db.Column(db.String(255), nullable=False)
     duration = db.Column(db.Integer, nullable=False)  # Total duration in seconds
-    started_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=False, server_default=utc_now())
     paused_at = db.Column(db.DateTime, nullable=True)
     remaining_time = db.Column(db.Integer)  # Seconds remaining when paused
     completed_at = db.Column(db.DateTime, nullable=True)
@@ -78,6 +111,10 @@ class ActiveTimer(BaseModel):
     # Relationships
     cooking_session = db.relationship('CookingSession', back_populates='active_timers')
 
+    __table_args__ = (
+        db.Index('ix_active_timers_session_active', 'cooking_session_id', postgresql_where=db.text('is_active')),
+    )
+
     @property
     def is_paused(self):
         """Check if timer is paused"""
@@ -93,40 +130,49 @@ class ActiveTimer(BaseModel):
         """Check if timer is currently running"""
         return self.is_active and not self.is_paused and not self.is_completed
 
-    def get_remaining_time(self):
+    def get_remaining_time(self, now=None):
         """Calculate remaining time in seconds"""
-        if self.is_completed:
+        if self.completed_at is not None:
             return 0
-        if self.is_paused:
+        if self.paused_at is not None:
             return self.remaining_time or 0
 
         # Calculate based on elapsed time since last start/resume
-        elapsed = (datetime.utcnow() - self.started_at).total_seconds()
+        elapsed = ((now or datetime.utcnow()) - self.started_at).total_seconds()
 
         # If timer was previously paused and resumed, use remaining_time as the base
         # Otherwise use original duration
-        base_duration = self.remaining_time if self.remaining_time is not None and not self.is_paused else self.duration
-        remaining = base_duration - int(elapsed)
-        return max(0, remaining)
+        base_duration = self.remaining_time if self.remaining_time is not None else self.duration
+        return max(0, base_duration - int(elapsed))
 
-    def to_dict(self):
+    serialize_fields = ('cooking_session_id', 'name', 'duration', 'started_at')
+
+    def to_dict(self, now=None):
         """Convert to dictionary"""
+        # Read each column once and derive the status flags from locals
+        completed_at = self.completed_at
+        paused_at = self.paused_at
+        is_active = self.is_active
+        is_completed = completed_at is not None
+        is_paused = paused_at is not None and not is_completed
+
         data = super().to_dict()
         data.update({
-            'cooking_session_id': self.cooking_session_id,
-            'name': self.name,
-            'duration': self.duration,
-            'started_at': self.started_at.isoformat() if self.started_at else None,
-            'paused_at': self.paused_at.isoformat() if self.paused_at else None,
-            'remaining_time': self.get_remaining_time(),
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-            'is_active': self.is_active,
-            'is_paused': self.is_paused,
-            'is_running': self.is_running,
-            'is_completed': self.is_completed,
+            'paused_at': paused_at,
+            'remaining_time': self.get_remaining_time(now),
+            'completed_at': completed_at,
+            'is_active': is_active,
+            'is_paused': is_paused,
+            'is_running': is_active and not is_paused and not is_completed,
+            'is_completed': is_completed,
         })
         return data
 
     def __repr__(self):
-        status = 'completed' if self.is_completed else ('paused' if self.is_paused else 'running')
-        return f'<ActiveTimer {self.name} {status}>'
+        if self._loaded('completed_at') is not None:
+            status = 'completed'
+        elif self._loaded('paused_at') is not None:
+            status = 'paused'
+        else:
+            status = 'running'
+        return f'<ActiveTimer {self._loaded("id")} {self._loaded("name")} {status}>'
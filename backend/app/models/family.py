@@ -2,12 +2,14 @@
 Family and FamilyMember models for group management
 """
 import enum
+from sqlalchemy import func, inspect
+from sqlalchemy.orm import selectinload, validates
 from app import db
 from app.models.base import BaseModel
 
 
-class FamilyRole(enum.Enum):
-    """Roles within a family group"""
+class FamilyRole(str, enum.Enum):
+    """Roles within a family group (members compare equal to their stored string)"""
     OWNER = 'owner'
     ADMIN = 'admin'
     MEMBER = 'member'
@@ -26,9 +28,24 @@ class Family(BaseModel):
     shopping_lists = db.relationship('ShoppingList', back_populates='family', cascade='all, delete-orphan')
     cooking_sessions = db.relationship('CookingSession', back_populates='family', cascade='all, delete-orphan')
 
+    @classmethod
+    def get_with_members(cls, id):
+        """Get family by ID with members loaded in a single extra query"""
+        return cls.query.options(selectinload(cls.members)).filter_by(id=id).first()
+
+    @property
+    def member_count(self):
+        """Get number of members without loading them when not already loaded"""
+        if 'members' not in inspect(self).unloaded:
+            return len(self.members)
+        return db.session.query(func.count(FamilyMember.id)).filter(
+            FamilyMember.family_id == self.id
+        ).scalar()
+
     def get_member(self, user_id):
-        """Get family member by user ID"""
-        return FamilyMember.query.filter_by(family_id=self.id, user_id=user_id).first()
+        """Get family member by user ID (scans the members collection, which stays current)"""
+        user_id = int(user_id)
+        return next((member for member in self.members if member.user_id == user_id), None)
 
     def is_member(self, user_id):
         """Check if user is a member"""
@@ -44,29 +61,40 @@ class Family(BaseModel):
         member = self.get_member(user_id)
         return member and member.role in [FamilyRole.OWNER, FamilyRole.ADMIN]
 
+    serialize_fields = ('name', 'description')
+
     def to_dict(self, include_members=False):
         """Convert to dictionary"""
         data = super().to_dict()
-        data.update({
-            'name': self.name,
-            'description': self.description,
-            'member_count': len(self.members),
-        })
+        data['member_count'] = self.member_count
         if include_members:
             data['members'] = [member.to_dict() for member in self.members]
         return data
 
+    def to_dict_compact(self):
+        """List-view form: members as parallel arrays instead of nested member/user dicts"""
+        data = super().to_dict()
+        members = self.members
+        data['member_count'] = len(members)
+        data['members'] = {
+            'ids': [member.id for member in members],
+            'user_ids': [member.user_id for member in members],
+            'roles': [member.role for member in members],
+            'names': [member.user.full_name if member.user else None for member in members],
+        }
+        return data
+
     def __repr__(self):
-        return f'<Family {self.name}>'
+        return f'<Family {self._loaded("name")}>'
 
 
 class FamilyMember(BaseModel):
     """Association model for user-family relationships with roles"""
     __tablename__ = 'family_members'
 
-    family_id = db.Column(db.Integer, db.ForeignKey('families.id'), nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    role = db.Column(db.Enum(FamilyRole), default=FamilyRole.MEMBER, nullable=False)
+    family_id = db.Column(db.Integer, db.ForeignKey('families.id'), nullable=False, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    role = db.Column(db.String(16), default=FamilyRole.MEMBER.value, nullable=False)
 
     # Relationships
     family = db.relationship('Family', back_populates='members')
@@ -75,18 +103,22 @@ class FamilyMember(BaseModel):
     # Unique constraint
     __table_args__ = (
         db.UniqueConstraint('family_id', 'user_id', name='unique_family_user'),
+        db.CheckConstraint("role IN ('owner', 'admin', 'member')", name='ck_family_members_role'),
     )
 
+    @validates('role')
+    def validate_role(self, key, value):
+        """Store roles as plain strings; rejects unknown roles"""
+        return FamilyRole(value).value
+
+    serialize_fields = ('family_id', 'user_id', 'role')
+
     def to_dict(self):
         """Convert to dictionary"""
         data = super().to_dict()
-        data.update({
-            'family_id': self.family_id,
-            'user_id': self.user_id,
-            'role': self.role.value,
-            'user': self.user.to_dict() if self.user else None,
-        })
+        data['user'] = self.user.to_dict() if self.user else None
         return data
 
     def __repr__(self):
-        return f'<FamilyMember family={self.family_id} user={self.user_id} role={self.role.value}>'
+        return (f'<FamilyMember family={self._loaded("family_id")} '
+                f'user={self._loaded("user_id")} role={self._loaded("role")}>')
@@ -1,9 +1,18 @@
 """
 Recipe models including ingredients, steps, and timers
 """
+from operator import attrgetter
+from sqlalchemy.orm import load_only
 from app import db
 from app.models.base import BaseModel
 
+# Columns read by Recipe.to_list_dict (the compact list view)
+LIST_FIELDS = (
+    'id', 'created_at', 'updated_at', 'name', 'prep_time', 'cook_time',
+    'servings', 'image_url', 'family_id', 'assigned_to_id',
+)
+_list_getter = attrgetter(*LIST_FIELDS)
+
 
 class Recipe(BaseModel):
     """Recipe model for meal planning"""
@@ -19,7 +28,7 @@ class Recipe(BaseModel):
 
     # Foreign keys
     family_id = db.Column(db.Integer, db.ForeignKey('families.id'), nullable=True)
-    assigned_to_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    assigned_to_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True, index=True)
 
     # Relationships
     family = db.relationship('Family', back_populates='recipes')
@@ -29,42 +38,56 @@ class Recipe(BaseModel):
     timers = db.relationship('RecipeTimer', back_populates='recipe', cascade='all, delete-orphan')
     cooking_sessions = db.relationship('CookingSession', back_populates='recipe')
 
+    # Serves family lookups and (created_at, id) keyset pages in either direction
+    __table_args__ = (
+        db.Index('ix_recipes_family_created', 'family_id', 'created_at', 'id'),
+    )
+
     @property
     def total_time(self):
         """Calculate total time in minutes"""
         return self.prep_time + self.cook_time
 
-    def to_dict(self, include_details=False):
-        """Convert to dictionary"""
+    serialize_fields = (
+        'name', 'description', 'prep_time', 'cook_time', 'servings',
+        'image_url', 'source_url', 'family_id', 'assigned_to_id',
+    )
+
+    def to_dict(self, include_details=False, loader=None):
+        """Convert to dictionary (pass a UserLoader to share assigned_to dicts across recipes)"""
         data = super().to_dict()
-        data.update({
-            'name': self.name,
-            'description': self.description,
-            'prep_time': self.prep_time,
-            'cook_time': self.cook_time,
-            'total_time': self.total_time,
-            'servings': self.servings,
-            'image_url': self.image_url,
-            'source_url': self.source_url,
-            'family_id': self.family_id,
-            'assigned_to_id': self.assigned_to_id,
-            'assigned_to': self.assigned_to.to_dict() if self.assigned_to else None,
-        })
+        data['total_time'] = self.total_time
+        if loader is not None:
+            data['assigned_to'] = loader.get_dict(self.assigned_to_id)
+        else:
+            data['assigned_to'] = self.assigned_to.to_dict() if self.assigned_to else None
         if include_details:
             data['ingredients'] = [ing.to_dict() for ing in self.ingredients]
             data['steps'] = [step.to_dict() for step in self.steps]
             data['timers'] = [timer.to_dict() for timer in self.timers]
         return data
 
+    @classmethod
+    def list_columns(cls):
+        """load_only() option restricting a query to the LIST_FIELDS columns"""
+        return load_only(*(getattr(cls, name) for name in LIST_FIELDS))
+
+    def to_list_dict(self, loader):
+        """Compact dictionary for list views; reads only LIST_FIELDS columns"""
+        data = dict(zip(LIST_FIELDS, _list_getter(self)))
+        data['total_time'] = self.prep_time + self.cook_time
+        data['assigned_to'] = loader.get_dict(self.assigned_to_id)
+        return data
+
     def __repr__(self):
-        return f'<Recipe {self.name}>'
+        return f'<Recipe {self._loaded("name")}>'
 
 
 class Ingredient(BaseModel):
     """Ingredient for a recipe"""
     __tablename__ = 'ingredients'
 
-    recipe_id = db.Column(db.Integer, db.ForeignKey('recipes.id'), nullable=False)
+    recipe_id = db.Column(db.Integer, db.ForeignKey('recipes.id'), nullable=False, index=True)
     name = db.Column(db.String(255), nullable=False)
     quantity = db.Column(db.String(50))  # e.g., "2 cups", "1 lb"
     order = db.Column(db.Integer, default=0)
@@ -72,26 +95,17 @@ class Ingredient(BaseModel):
     # Relationships
     recipe = db.relationship('Recipe', back_populates='ingredients')
 
-    def to_dict(self):
-        """Convert to dictionary"""
-        data = super().to_dict()
-        data.update({
-            'recipe_id': self.recipe_id,
-            'name': self.name,
-            'quantity': self.quantity,
-            'order': self.order,
-        })
-        return data
+    serialize_fields = ('recipe_id', 'name', 'quantity', 'order')
 
     def __repr__(self):
-        return f'<Ingredient {self.quantity} {self.name}>'
+        return f'<Ingredient {self._loaded("quantity")} {self._loaded("name")}>'
 
 
 class CookingStep(BaseModel):
     """Step-by-step cooking instructions"""
     __tablename__ = 'cooking_steps'
 
-    recipe_id = db.Column(db.Integer, db.ForeignKey('recipes.id'), nullable=False)
+    recipe_id = db.Column(db.Integer, db.ForeignKey('recipes.id'), nullable=False, index=True)
     instruction = db.Column(db.Text, nullable=False)
     order = db.Column(db.Integer, default=0)
     estimated_time = db.Column(db.Integer)  # minutes (optional)
@@ -99,26 +113,17 @@ class CookingStep(BaseModel):
     # Relationships
     recipe = db.relationship('Recipe', back_populates='steps')
 
-    def to_dict(self):
-        """Convert to dictionary"""
-        data = super().to_dict()
-        data.update({
-            'recipe_id': self.recipe_id,
-            'instruction': self.instruction,
-            'order': self.order,
-            'estimated_time': self.estimated_time,
-        })
-        return data
+    serialize_fields = ('recipe_id', 'instruction', 'order', 'estimated_time')
 
     def __repr__(self):
-        return f'<CookingStep {self.order}: {self.instruction[:30]}...>'
+        return f'<CookingStep {self._loaded("id")} order={self._loaded("order")}>'
 
 
 class RecipeTimer(BaseModel):
     """Predefined timers for a recipe"""
     __tablename__ = 'recipe_timers'
 
-    recipe_id = db.Column(db.Integer, db.ForeignKey('recipes.id'), nullable=False)
+    recipe_id = db.Column(db.Integer, db.ForeignKey('recipes.id'), nullable=False, index=True)
     name = db.Column(db.String(255), nullable=False)
     duration = db.Column(db.Integer, nullable=False)  # seconds
     step_order = db.Column(db.Integer)  # Which step this timer belongs to (optional)
@@ -126,16 +131,7 @@ class RecipeTimer(BaseModel):
     # Relationships
     recipe = db.relationship('Recipe', back_populates='timers')
 
-    def to_dict(self):
-        """Convert to dictionary"""
-        data = super().to_dict()
-        data.update({
-            'recipe_id': self.recipe_id,
-            'name': self.name,
-            'duration': self.duration,
-            'step_order': self.step_order,
-        })
-        return data
+    serialize_fields = ('recipe_id', 'name', 'duration', 'step_order')
 
     def __repr__(self):
-        return f'<RecipeTimer {self.name} ({self.duration}s)>'
+        return f'<RecipeTimer {self._loaded("name")} ({self._loaded("duration")}s)>'
@@ -1,6 +1,7 @@
 """
 Shopping list models for collaborative grocery shopping
 """
+from sqlalchemy import case, func, inspect
 from app import db
 from app.models.base import BaseModel
 
@@ -17,40 +18,72 @@ class ShoppingList(BaseModel):
     family = db.relationship('Family', back_populates='shopping_lists')
     items = db.relationship('ShoppingListItem', back_populates='shopping_list', cascade='all, delete-orphan')
 
+    # Serve family listings and (created_at, id) keyset pages; the partial
+    # index covers the default active-only listing
+    __table_args__ = (
+        db.Index('ix_shopping_lists_family_created', 'family_id', 'created_at', 'id'),
+        db.Index('ix_shopping_lists_family_active', 'family_id', 'created_at', 'id',
+                 postgresql_where=db.text('is_active')),
+    )
+
+    def _item_counts(self):
+        """(total, checked) item counts, computed fresh on each call"""
+        # Reuse the collection when it is already loaded (e.g. selectinload)
+        if 'items' not in inspect(self).unloaded:
+            return len(self.items), sum(1 for item in self.items if item.checked)
+
+        # Otherwise aggregate in SQL instead of materializing every item
+        total, checked = db.session.query(
+            func.count(ShoppingListItem.id),
+            func.coalesce(func.sum(case((ShoppingListItem.checked, 1), else_=0)), 0)
+        ).filter(ShoppingListItem.shopping_list_id == self.id).one()
+        return total, int(checked)
+
+    @staticmethod
+    def _percentage(total, checked):
+        return int((checked / total) * 100) if total else 0
+
     @property
     def total_items(self):
         """Get total number of items"""
-        return len(self.items)
+        return self._item_counts()[0]
 
     @property
     def checked_items(self):
         """Get number of checked items"""
-        return len([item for item in self.items if item.checked])
+        return self._item_counts()[1]
 
     @property
     def completion_percentage(self):
         """Get completion percentage"""
-        if self.total_items == 0:
-            return 0
-        return int((self.checked_items / self.total_items) * 100)
+        return self._percentage(*self._item_counts())
+
+    serialize_fields = ('name', 'family_id', 'is_active')
 
-    def to_dict(self, include_items=False):
-        """Convert to dictionary"""
+    def to_dict(self, include_items=False, loader=None, include_users=True):
+        """
+        Convert to dictionary (pass a UserLoader to batch item user lookups)
+
+        With include_users=False, items carry only added_by_id/checked_by_id
+        and no user is loaded.
+        """
         data = super().to_dict()
+        # Counted once for all three fields
+        total, checked = self._item_counts()
         data.update({
-            'name': self.name,
-            'family_id': self.family_id,
-            'is_active': self.is_active,
-            'total_items': self.total_items,
-            'checked_items': self.checked_items,
-            'completion_percentage': self.completion_percentage,
+            'total_items': total,
+            'checked_items': checked,
+            'completion_percentage': self._percentage(total, checked),
         })
         if include_items:
-            data['items'] = [item.to_dict() for item in self.items]
+            if loader is not None or not include_users:
+                data['items'] = ShoppingListItem.to_dict_many(self.items, loader)
+            else:
+                data['items'] = [item.to_dict() for item in self.items]
         return data
 
     def __repr__(self):
-        return f'<ShoppingList {self.name} ({self.checked_items}/{self.total_items})>'
+        return f'<ShoppingList {self._loaded("id")} {self._loaded("name")}>'
 
 
 class ShoppingListItem(BaseModel):
@@ -68,8 +101,8 @@ class ShoppingListItem(BaseModel):
     version = db.Column(db.Integer, default=1, nullable=False)
 
     # Track who added and checked the item
-    added_by_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    checked_by_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    added_by_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    checked_by_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True, index=True)
     checked_at = db.Column(db.DateTime, nullable=True)
 
     # Relationships
@@ -77,25 +110,50 @@ class ShoppingListItem(BaseModel):
     added_by = db.relationship('User', foreign_keys=[added_by_id], back_populates='shopping_items_added')
     checked_by = db.relationship('User', foreign_keys=[checked_by_id], back_populates='shopping_items_checked')
 
-    def to_dict(self):
-        """Convert to dictionary"""
+    # Covers lookups by list and lets checked/total counts run as index-only scans
+    __table_args__ = (
+        db.Index('ix_shopping_list_items_list_checked', 'shopping_list_id', 'checked'),
+    )
+
+    serialize_fields = (
+        'shopping_list_id', 'name', 'quantity', 'category', 'notes', 'checked',
+        'version',  # Include version for optimistic locking
+        'added_by_id', 'checked_by_id', 'checked_at',
+    )
+
+    def to_dict(self, loader=None):
+        """Convert to dictionary (users come from the loader when one is given)"""
         data = super().to_dict()
-        data.update({
-            'shopping_list_id': self.shopping_list_id,
-            'name': self.name,
-            'quantity': self.quantity,
-            'category': self.category,
-            'notes': self.notes,
-            'checked': self.checked,
-            'version': self.version,  # Include version for optimistic locking
-            'added_by_id': self.added_by_id,
-            'added_by': self.added_by.to_dict() if self.added_by else None,
-            'checked_by_id': self.checked_by_id,
-            'checked_by': self.checked_by.to_dict() if self.checked_by else None,
-            'checked_at': self.checked_at.isoformat() if self.checked_at else None,
-        })
+        if loader is not None:
+            data['added_by'] = loader.get_dict(self.added_by_id)
+            data['checked_by'] = loader.get_dict(self.checked_by_id)
+        else:
+            data['added_by'] = self.added_by.to_dict() if self.added_by else None
+            data['checked_by'] = self.checked_by.to_dict() if self.checked_by else None
         return data
 
+    @classmethod
+    def to_dict_many(cls, items, loader):
+        """
+        Serialize a batch of items in one pass, equivalent to item.to_dict(loader)
+
+        The field getter and loader lookup are resolved once for the batch
+        instead of once per item. With loader=None the nested user dicts are
+        left out (ids only).
+        """
+        names, getter = cls._field_getter()
+        if loader is None:
+            return [dict(zip(names, getter(item))) for item in items]
+
+        user_dict = loader.get_dict
+        serialized = []
+        for item in items:
+            data = dict(zip(names, getter(item)))
+            data['added_by'] = user_dict(item.added_by_id)
+            data['checked_by'] = user_dict(item.checked_by_id)
+            serialized.append(data)
+        return serialized
+
     def __repr__(self):
-        status = '✓' if self.checked else '☐'
-        return f'<ShoppingListItem {status} {self.quantity} {self.name}>'
+        status = '✓' if self._loaded('checked') else '☐'
+        return f'<ShoppingListItem {status} {self._loaded("quantity")} {self._loaded("name")}>'
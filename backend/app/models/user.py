@@ -2,10 +2,16 @@
 User model for authentication and authorization
 """
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from app import db
 from app.models.base import BaseModel
 
 
+# Argon2id parameters (~64 MiB, 2 passes, 2 lanes)
+password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+
+
 class User(BaseModel):
     """User model for authentication"""
     __tablename__ = 'users'
@@ -23,28 +29,43 @@ class User(BaseModel):
 
     def set_password(self, password):
         """Hash and set password"""
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password):
-        """Verify password"""
-        return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
+        """Verify password (Argon2id, or legacy bcrypt hashes)"""
+        if not self.password_hash.startswith('$argon2'):
+            return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
+
+        try:
+            return password_hasher.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def rehash_password_if_needed(self, password):
+        """
+        Upgrade a legacy or outdated hash after a successful check_password
+
+        Returns:
+            bool: True if password_hash was replaced and needs saving
+        """
+        if (self.password_hash.startswith('$argon2')
+                and not password_hasher.check_needs_rehash(self.password_hash)):
+            return False
+        self.set_password(password)
+        return True
 
     @property
     def full_name(self):
         """Get full name"""
         return f"{self.first_name} {self.last_name}"
 
+    serialize_fields = ('email', 'first_name', 'last_name', 'is_active')
+
     def to_dict(self):
         """Convert to dictionary"""
         data = super().to_dict()
-        data.update({
-            'email': self.email,
-            'first_name': self.first_name,
-            'last_name': self.last_name,
-            'full_name': self.full_name,
-            'is_active': self.is_active,
-        })
+        data['full_name'] = self.full_name
         return data
 
     def __repr__(self):
-        return f'<User {self.email}>'
+        return f'<User {self._loaded("email")}>'
@@ -1,7 +1,7 @@
 """
 Authentication routes for user login, registration, and token management
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, jsonify
 from flask_jwt_extended import (
     create_access_token,
     create_refresh_token,
@@ -10,8 +10,11 @@ from flask_jwt_extended import (
 )
 from app import db
 from app.models.user import User
+from app.utils.decorators import current_user_id
+from app.utils.caching import invalidate_user_profile_caches
 from app.utils.rate_limit import auth_rate_limit
-from app.utils.validation import validate_email, validate_password
+from app.utils.validation import parse_body
+from app.schemas.auth import RegisterRequest, LoginRequest, UpdateProfileRequest, ChangePasswordRequest
 
 bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
@@ -20,24 +23,22 @@ bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 @auth_rate_limit
 def register():
     """Register a new user"""
-    data = request.get_json()
+    # Validate body before touching the database
+    data, error = parse_body(RegisterRequest)
+    if error:
+        return error
 
-    # Validate required fields
-    required_fields = ['email', 'password', 'first_name', 'last_name']
-    if not all(field in data for field in required_fields):
-        return jsonify({'error': 'Missing required fields'}), 400
-
-    # Check if user already exists
-    if User.query.filter_by(email=data['email']).first():
+    # Check if user already exists (id-only probe on the unique email index)
+    if db.session.query(User.id).filter_by(email=data.email).first() is not None:
         return jsonify({'error': 'Email already registered'}), 409
 
     # Create new user
     user = User(
-        email=data['email'],
-        first_name=data['first_name'],
-        last_name=data['last_name']
+        email=data.email,
+        first_name=data.first_name,
+        last_name=data.last_name
     )
-    user.set_password(data['password'])
+    user.set_password(data.password)
 
     try:
         user.save()
@@ -61,21 +62,24 @@ def register():
 @auth_rate_limit
 def login():
     """Login and get access tokens"""
-    data = request.get_json()
-
     # Validate required fields
-    if not data.get('email') or not data.get('password'):
+    data, error = parse_body(LoginRequest)
+    if error:
         return jsonify({'error': 'Email and password required'}), 400
 
     # Find user
-    user = User.query.filter_by(email=data['email']).first()
-    if not user or not user.check_password(data['password']):
+    user = User.query.filter_by(email=data.email).first()
+    if not user or not user.check_password(data.password):
         return jsonify({'error': 'Invalid credentials'}), 401
 
     # Check if user is active
     if not user.is_active:
         return jsonify({'error': 'Account is disabled'}), 403
 
+    # Migrate bcrypt (or outdated Argon2) hashes on successful login
+    if user.rehash_password_if_needed(data.password):
+        user.save()
+
     # Create tokens
     access_token = create_access_token(identity=str(user.id))
     refresh_token = create_refresh_token(identity=str(user.id))
@@ -91,8 +95,8 @@ def login():
 @jwt_required(refresh=True)
 def refresh():
     """Refresh access token"""
-    current_user_id = get_jwt_identity()
-    access_token = create_access_token(identity=current_user_id)
+    identity = get_jwt_identity()
+    access_token = create_access_token(identity=identity)
 
     return jsonify({
         'access_token': access_token
@@ -103,7 +107,7 @@ def refresh():
 @jwt_required()
 def get_current_user():
     """Get current user profile"""
-    user_id = int(get_jwt_identity())
+    user_id = current_user_id()
     user = User.get_by_id(user_id)
 
     if not user:
@@ -116,28 +120,37 @@ def get_current_user():
 @jwt_required()
 def update_profile():
     """Update current user profile"""
-    user_id = int(get_jwt_identity())
+    data, error = parse_body(UpdateProfileRequest)
+    if error:
+        return error
+
+    user_id = current_user_id()
     user = User.get_by_id(user_id)
 
     if not user:
         return jsonify({'error': 'User not found'}), 404
 
-    data = request.get_json()
-
     # Update allowed fields
-    if 'first_name' in data:
-        user.first_name = data['first_name']
-    if 'last_name' in data:
-        user.last_name = data['last_name']
-    if 'email' in data:
+    if data.first_name is not None:
+        user.first_name = data.first_name
+    if data.last_name is not None:
+        user.last_name = data.last_name
+    if data.email is not None:
         # Check if email is already taken by another user
-        existing = User.query.filter_by(email=data['email']).first()
-        if existing and existing.id != user.id:
+        taken = db.session.query(User.id).filter(
+            User.email == data.email,
+            User.id != user.id
+        ).first()
+        if taken is not None:
             return jsonify({'error': 'Email already in use'}), 409
-        user.email = data['email']
+        user.email = data.email
 
     try:
         user.save()
+
+        # Invalidate cache (family member lists embed the user's profile)
+        invalidate_user_profile_caches(user.id)
+
         return jsonify({
             'message': 'Profile updated successfully',
             'user': user.to_dict()
@@ -151,23 +164,22 @@ def update_profile():
 @jwt_required()
 def change_password():
     """Change user password"""
-    user_id = int(get_jwt_identity())
+    data, error = parse_body(ChangePasswordRequest)
+    if error:
+        return jsonify({'error': 'Current and new password required'}), 400
+
+    user_id = current_user_id()
     user = User.get_by_id(user_id)
 
     if not user:
         return jsonify({'error': 'User not found'}), 404
 
-    data = request.get_json()
-
-    if not data.get('current_password') or not data.get('new_password'):
-        return jsonify({'error': 'Current and new password required'}), 400
-
     # Verify current password
-    if not user.check_password(data['current_password']):
+    if not user.check_password(data.current_password):
         return jsonify({'error': 'Current password is incorrect'}), 401
 
     # Update password
-    user.set_password(data['new_password'])
+    user.set_password(data.new_password)
 
     try:
         user.save()
@@ -2,30 +2,39 @@
 Cooking session routes with timeline scheduling
 """
 from datetime import datetime, timedelta
+from operator import itemgetter
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from app import db, socketio
+from flask_jwt_extended import jwt_required
+from sqlalchemy import update
+from app import db
 from app.models.cooking_session import CookingSession, ActiveTimer
 from app.models.recipe import Recipe
-from app.utils.decorators import family_member_required
+from app.utils.decorators import family_member_required, current_user_id
+from app.services.timer_state import store_timer_states
+from app.services.timer_service import schedule_timer_completion, unschedule_timer_completion
+from app.utils.loaders import UserLoader
+from app.services.broadcast import broadcast_to_family
 
 bp = Blueprint('cooking_sessions', __name__, url_prefix='/api/families/<int:family_id>/cooking-sessions')
 
+# Session fields broadcast on start/complete (minimal payloads - no nested recipe/user objects)
+SESSION_STARTED_FIELDS = (
+    'id', 'recipe_id', 'family_id', 'started_by_id', 'target_time',
+    'actual_start_time', 'is_active', 'created_at',
+)
+SESSION_COMPLETED_FIELDS = ('id', 'recipe_id', 'family_id', 'completed_at', 'is_active', 'duration')
 
-def calculate_start_time(recipes, target_time):
+
+def calculate_start_time(recipes, target_dt):
     """
     Calculate when each recipe should start to finish by target time
-    Returns dict of recipe_id: start_time
+    Returns (start_time, recipe) tuples ordered by start time
     """
-    schedule = {}
-    target_dt = datetime.fromisoformat(target_time.replace('Z', '+00:00'))
-
-    for recipe in recipes:
-        # Calculate when to start this recipe
-        total_time = recipe.prep_time + recipe.cook_time
-        start_time = target_dt - timedelta(minutes=total_time)
-        schedule[recipe.id] = start_time.isoformat()
-
+    schedule = [
+        (target_dt - timedelta(minutes=recipe.prep_time + recipe.cook_time), recipe)
+        for recipe in recipes
+    ]
+    schedule.sort(key=itemgetter(0))
     return schedule
 
 
@@ -47,18 +56,16 @@ def create_timeline(family_id):
     if len(recipes) != len(data['recipe_ids']):
         return jsonify({'error': 'One or more recipes not found'}), 404
 
-    # Calculate timeline
-    schedule = calculate_start_time(recipes, data['target_time'])
-
-    # Sort by start time
-    sorted_schedule = sorted(
-        [{'recipe': r.to_dict(), 'start_time': schedule[r.id]} for r in recipes],
-        key=lambda x: x['start_time']
-    )
+    # Calculate timeline (target time parsed once for all recipes)
+    target_dt = datetime.fromisoformat(data['target_time'].replace('Z', '+00:00'))
+    timeline = [
+        {'recipe': recipe.to_dict(), 'start_time': start_time}
+        for start_time, recipe in calculate_start_time(recipes, target_dt)
+    ]
 
     return jsonify({
         'target_time': data['target_time'],
-        'timeline': sorted_schedule
+        'timeline': timeline
     }), 200
 
 
@@ -66,7 +73,7 @@ def create_timeline(family_id):
 @family_member_required
 def start_cooking_session(family_id):
     """Start a cooking session"""
-    user_id = int(get_jwt_identity())
+    user_id = current_user_id()
     data = request.get_json()
 
     if not data.get('recipe_id'):
@@ -77,12 +84,15 @@ def start_cooking_session(family_id):
     if not recipe or recipe.family_id != family_id:
         return jsonify({'error': 'Recipe not found'}), 404
 
+    # One timestamp for the session and every timer copied into it
+    now = datetime.utcnow()
+
     session = CookingSession(
         recipe_id=data['recipe_id'],
         family_id=family_id,
         started_by_id=user_id,
         target_time=datetime.fromisoformat(data['target_time']) if data.get('target_time') else None,
-        actual_start_time=datetime.utcnow()
+        actual_start_time=now
     )
 
     try:
@@ -96,7 +106,7 @@ def start_cooking_session(family_id):
                     cooking_session_id=session.id,
                     name=recipe_timer.name,
                     duration=recipe_timer.duration,
-                    started_at=datetime.utcnow(),
+                    started_at=now,
                     paused_at=None,
                     remaining_time=recipe_timer.duration,
                     completed_at=None,
@@ -104,28 +114,20 @@ def start_cooking_session(family_id):
                 )
                 db.session.add(active_timer)
             db.session.commit()
+            store_timer_states(session.active_timers, family_id)
             print(f"[DEBUG] Copied {len(recipe.timers)} timers to cooking session {session.id}")
 
-        # Broadcast session started (minimal payload - no nested recipe/user objects)
-        socketio.emit(
-            'cooking_session_started',
-            {
-                'id': session.id,
-                'recipe_id': session.recipe_id,
-                'recipe_name': session.recipe.name if session.recipe else None,
-                'family_id': session.family_id,
-                'started_by_id': session.started_by_id,
-                'target_time': session.target_time.isoformat() if session.target_time else None,
-                'actual_start_time': session.actual_start_time.isoformat() if session.actual_start_time else None,
-                'is_active': session.is_active,
-                'created_at': session.created_at.isoformat() if session.created_at else None
-            },
-            room=f"family_{family_id}"
-        )
+        # Serialize once; the emit reuses these values and orjson formats the datetimes
+        session_data = session.to_dict(include_timers=True)
+
+        # Broadcast session started
+        payload = {key: session_data[key] for key in SESSION_STARTED_FIELDS}
+        payload['recipe_name'] = session_data['recipe']['name'] if session_data['recipe'] else None
+        broadcast_to_family('cooking_session_started', payload, family_id)
 
         return jsonify({
             'message': 'Cooking session started',
-            'session': session.to_dict(include_timers=True)
+            'session': session_data
         }), 201
     except Exception as e:
         db.session.rollback()
@@ -136,13 +138,15 @@ def start_cooking_session(family_id):
 @family_member_required
 def get_active_sessions(family_id):
     """Get all active cooking sessions for a family"""
-    sessions = CookingSession.query.filter_by(
+    sessions = CookingSession.query_with_details(with_started_by=False).filter_by(
         family_id=family_id,
         is_active=True
     ).all()
 
+    # Each distinct starter is fetched and serialized once
+    loader = UserLoader.for_request().load_many(s.started_by_id for s in sessions)
     return jsonify({
-        'sessions': [s.to_dict(include_timers=True) for s in sessions]
+        'sessions': [s.to_dict(include_timers=True, loader=loader) for s in sessions]
     }), 200
 
 
@@ -150,7 +154,7 @@ def get_active_sessions(family_id):
 @family_member_required
 def get_session(family_id, session_id):
     """Get cooking session details"""
-    session = CookingSession.get_by_id(session_id)
+    session = CookingSession.get_with_details(session_id)
 
     if not session or session.family_id != family_id:
         return jsonify({'error': 'Session not found'}), 404
@@ -167,36 +171,40 @@ def complete_session(family_id, session_id):
     if not session or session.family_id != family_id:
         return jsonify({'error': 'Session not found'}), 404
 
-    session.completed_at = datetime.utcnow()
+    now = datetime.utcnow()
+    session.completed_at = now
     session.is_active = False
 
     try:
-        session.save()
+        session.save(commit=False)
 
-        # Stop all active timers
-        for timer in session.active_timers:
-            if timer.is_active:
-                timer.completed_at = datetime.utcnow()
-                timer.is_active = False
-                timer.save()
+        # Stop all active timers in one UPDATE, noting which ones it stopped
+        stopped_ids = db.session.scalars(
+            update(ActiveTimer)
+            .where(ActiveTimer.cooking_session_id == session.id, ActiveTimer.is_active.is_(True))
+            .values(completed_at=now, is_active=False)
+            .returning(ActiveTimer.id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        db.session.commit()
 
-        # Broadcast completion (minimal payload - no nested objects)
-        socketio.emit(
-            'cooking_session_completed',
-            {
-                'id': session.id,
-                'recipe_id': session.recipe_id,
-                'family_id': session.family_id,
-                'completed_at': session.completed_at.isoformat() if session.completed_at else None,
-                'is_active': session.is_active,
-                'duration': session.duration
-            },
-            room=f"family_{family_id}"
-        )
+        # Drop their pending completions so the scheduler doesn't fire them
+        for timer_id in stopped_ids:
+            unschedule_timer_completion(timer_id)
+
+        # Commit expired the session, so this reloads the timers once
+        store_timer_states(session.active_timers, family_id)
+
+        # Serialize once; the emit reuses these values and orjson formats the datetimes
+        session_data = session.to_dict(include_timers=True)
+
+        # Broadcast completion
+        payload = {key: session_data[key] for key in SESSION_COMPLETED_FIELDS}
+        broadcast_to_family('cooking_session_completed', payload, family_id)
 
         return jsonify({
             'message': 'Cooking session completed',
-            'session': session.to_dict(include_timers=True)
+            'session': session_data
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -226,25 +234,27 @@ def start_timer(family_id, session_id):
 
     try:
         timer.save()
+        store_timer_states([timer], family_id)
+
+        timer_data = timer.to_dict()
 
         # Broadcast timer started
-        socketio.emit(
+        broadcast_to_family(
             'timer_started',
             {
-                'timer': timer.to_dict(),
+                'timer': timer_data,
                 'session_id': session_id,
                 'family_id': family_id
             },
-            room=f"family_{family_id}"
+            family_id
         )
 
         # Schedule timer completion (handled by timer service)
-        from app.services.timer_service import schedule_timer_completion
         schedule_timer_completion(timer.id, data['duration'], family_id)
 
         return jsonify({
             'message': 'Timer started',
-            'timer': timer.to_dict()
+            'timer': timer_data
         }), 201
     except Exception as e:
         db.session.rollback()
@@ -268,21 +278,25 @@ def pause_timer(family_id, session_id, timer_id):
 
     try:
         timer.save()
+        store_timer_states([timer], family_id)
+        unschedule_timer_completion(timer.id)
+
+        timer_data = timer.to_dict()
 
         # Broadcast timer paused
-        socketio.emit(
+        broadcast_to_family(
             'timer_paused',
             {
-                'timer': timer.to_dict(),
+                'timer': timer_data,
                 'session_id': session_id,
                 'family_id': family_id
             },
-            room=f"family_{family_id}"
+            family_id
         )
 
         return jsonify({
             'message': 'Timer paused',
-            'timer': timer.to_dict()
+            'timer': timer_data
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -311,25 +325,27 @@ def resume_timer(family_id, session_id, timer_id):
 
     try:
         timer.save()
+        store_timer_states([timer], family_id)
+
+        timer_data = timer.to_dict()
 
         # Broadcast timer resumed
-        socketio.emit(
+        broadcast_to_family(
             'timer_resumed',
             {
-                'timer': timer.to_dict(),
+                'timer': timer_data,
                 'session_id': session_id,
                 'family_id': family_id
             },
-            room=f"family_{family_id}"
+            family_id
         )
 
         # Reschedule completion with remaining time (not modified duration)
-        from app.services.timer_service import schedule_timer_completion
         schedule_timer_completion(timer.id, remaining, family_id)
 
         return jsonify({
             'message': 'Timer resumed',
-            'timer': timer.to_dict()
+            'timer': timer_data
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -350,16 +366,18 @@ def cancel_timer(family_id, session_id, timer_id):
 
     try:
         timer.save()
+        store_timer_states([timer], family_id)
+        unschedule_timer_completion(timer.id)
 
         # Broadcast timer cancelled
-        socketio.emit(
+        broadcast_to_family(
             'timer_cancelled',
             {
                 'timer_id': timer_id,
                 'session_id': session_id,
                 'family_id': family_id
             },
-            room=f"family_{family_id}"
+            family_id
         )
 
         return jsonify({
@@ -2,12 +2,13 @@
 Family management routes
 """
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
 from sqlalchemy.orm import joinedload, selectinload
 from app import db
 from app.models.family import Family, FamilyMember, FamilyRole
 from app.models.user import User
-from app.utils.decorators import family_member_required, family_admin_required, family_owner_required
+from app.utils.decorators import family_member_required, family_admin_required, family_owner_required, current_user_id, current_family_member
+from app.utils.caching import get_family_details_cached, invalidate_family_cache, invalidate_family_members_cache
 
 bp = Blueprint('families', __name__, url_prefix='/api/families')
 
@@ -16,28 +17,26 @@ bp = Blueprint('families', __name__, url_prefix='/api/families')
 @jwt_required()
 def create_family():
     """Create a new family"""
-    user_id = int(get_jwt_identity())
+    user_id = current_user_id()
     data = request.get_json()
 
     if not data.get('name'):
         return jsonify({'error': 'Family name required'}), 400
 
-    # Create family
+    # Create family with the creator as owner; both INSERTs go out in one flush
     family = Family(
         name=data['name'],
         description=data.get('description')
     )
+    member = FamilyMember(
+        family=family,
+        user_id=user_id,
+        role=FamilyRole.OWNER
+    )
 
     try:
-        family.save()
-
-        # Add creator as owner
-        member = FamilyMember(
-            family_id=family.id,
-            user_id=user_id,
-            role=FamilyRole.OWNER
-        )
-        member.save()
+        db.session.add_all([family, member])
+        db.session.commit()
 
         return jsonify({
             'message': 'Family created successfully',
@@ -52,13 +51,21 @@ def create_family():
 @jwt_required()
 def get_families():
     """Get all families for current user"""
-    user_id = get_jwt_identity()
-
-    # Get all family memberships with eager loading
-    memberships = FamilyMember.query.options(
-        joinedload(FamilyMember.family).selectinload(Family.members).joinedload(FamilyMember.user)
-    ).filter_by(user_id=user_id).all()
-    families = [m.family.to_dict(include_members=True) for m in memberships]
+    user_id = current_user_id()
+
+    # Families the user belongs to, with every member and user eager-loaded
+    families = Family.query.join(
+        FamilyMember, FamilyMember.family_id == Family.id
+    ).filter(
+        FamilyMember.user_id == user_id
+    ).options(
+        selectinload(Family.members).joinedload(FamilyMember.user)
+    ).all()
+    # ?compact=true returns members as parallel arrays (smaller list payload)
+    if request.args.get('compact', 'false').lower() == 'true':
+        families = [family.to_dict_compact() for family in families]
+    else:
+        families = [family.to_dict(include_members=True) for family in families]
 
     return jsonify({'families': families}), 200
 
@@ -67,8 +74,7 @@ def get_families():
 @family_member_required
 def get_family(family_id):
     """Get family details"""
-    family = Family.get_by_id(family_id)
-    return jsonify({'family': family.to_dict(include_members=True)}), 200
+    return jsonify({'family': get_family_details_cached(family_id)}), 200
 
 
 @bp.route('/<int:family_id>', methods=['PUT'])
@@ -85,6 +91,10 @@ def update_family(family_id):
 
     try:
         family.save()
+
+        # Invalidate cache
+        invalidate_family_cache(family_id)
+
         return jsonify({
             'message': 'Family updated successfully',
             'family': family.to_dict(include_members=True)
@@ -102,6 +112,10 @@ def delete_family(family_id):
 
     try:
         family.delete()
+
+        # Invalidate cache
+        invalidate_family_cache(family_id)
+
         return jsonify({'message': 'Family deleted successfully'}), 200
     except Exception as e:
         db.session.rollback()
@@ -136,6 +150,10 @@ def add_member(family_id):
 
     try:
         member.save()
+
+        # Invalidate cache
+        invalidate_family_members_cache(family_id)
+
         return jsonify({
             'message': 'Member added successfully',
             'member': member.to_dict()
@@ -158,15 +176,23 @@ def update_member_role(family_id, member_id):
     if 'role' in data:
         # Only owner can assign owner role
         if data['role'] == 'owner':
-            user_id = int(get_jwt_identity())
-            family = Family.get_by_id(family_id)
-            if not family.is_owner(user_id):
+            user_id = current_user_id()
+            is_owner = db.session.query(FamilyMember.id).filter_by(
+                family_id=family_id,
+                user_id=user_id,
+                role=FamilyRole.OWNER.value
+            ).first() is not None
+            if not is_owner:
                 return jsonify({'error': 'Only owner can assign owner role'}), 403
 
         member.role = FamilyRole(data['role'])
 
     try:
         member.save()
+
+        # Invalidate cache
+        invalidate_family_members_cache(family_id)
+
         return jsonify({
             'message': 'Member role updated successfully',
             'member': member.to_dict()
@@ -191,6 +217,10 @@ def remove_member(family_id, member_id):
 
     try:
         member.delete()
+
+        # Invalidate cache
+        invalidate_family_members_cache(family_id)
+
         return jsonify({'message': 'Member removed successfully'}), 200
     except Exception as e:
         db.session.rollback()
@@ -201,9 +231,7 @@ def remove_member(family_id, member_id):
 @family_member_required
 def leave_family(family_id):
     """Leave a family"""
-    user_id = int(get_jwt_identity())
-    family = Family.get_by_id(family_id)
-    member = family.get_member(user_id)
+    member = current_family_member()
 
     # Cannot leave if you're the owner
     if member.role == FamilyRole.OWNER:
@@ -211,6 +239,10 @@ def leave_family(family_id):
 
     try:
         member.delete()
+
+        # Invalidate cache
+        invalidate_family_members_cache(family_id)
+
         return jsonify({'message': 'Left family successfully'}), 200
     except Exception as e:
         db.session.rollback()
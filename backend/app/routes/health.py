@@ -1,14 +1,50 @@
 """
 Health check and monitoring endpoints
 """
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, current_app, request
 from datetime import datetime
 from app import db, cache
-from sqlalchemy import text
-import os
+from sqlalchemy import bindparam, create_engine, text
+from app.config import settings
 
 bp = Blueprint('health', __name__, url_prefix='/api')
 
+# Tables reported by /metrics
+METRIC_TABLES = ('users', 'families', 'recipes', 'shopping_lists')
+
+_EXACT_COUNTS_SQL = text(
+    'SELECT ' + ', '.join(f'(SELECT count(*) FROM {table})' for table in METRIC_TABLES)
+)
+_ESTIMATED_COUNTS_SQL = text(
+    'SELECT relname, GREATEST(reltuples, 0)::bigint FROM pg_class '
+    "WHERE relkind = 'r' AND relname IN :tables"
+).bindparams(bindparam('tables', expanding=True))
+
+# Probes get their own one-connection engine so a busy app pool or a stuck
+# request session can't hide (or fake) database readiness
+_health_engine = None
+
+
+def get_health_engine():
+    """Lazily create the dedicated probe engine from the app's database URI"""
+    global _health_engine
+    if _health_engine is None:
+        _health_engine = create_engine(
+            current_app.config['SQLALCHEMY_DATABASE_URI'],
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=1,
+            pool_recycle=300,
+            connect_args={'connect_timeout': 1, 'options': '-c statement_timeout=100'},
+        )
+    return _health_engine
+
+
+def ping_database():
+    """Run SELECT 1 on the probe engine; raises on failure"""
+    with get_health_engine().connect() as conn:
+        conn.execute(text('SELECT 1'))
+
 
 @bp.route('/health', methods=['GET'])
 def health_check():
@@ -42,7 +78,7 @@ def detailed_health_check():
 
     # Check database connectivity
     try:
-        db.session.execute(text('SELECT 1'))
+        ping_database()
         health_status['checks']['database'] = {
             'status': 'healthy',
             'message': 'Database connection successful'
@@ -57,8 +93,8 @@ def detailed_health_check():
     # Check application environment
     health_status['checks']['environment'] = {
         'status': 'healthy',
-        'environment': os.getenv('FLASK_ENV', 'production'),
-        'debug': os.getenv('FLASK_DEBUG', 'False')
+        'environment': settings.env,
+        'debug': settings.debug_flag
     }
 
     # Overall status code
@@ -77,8 +113,8 @@ def readiness_check():
         503: Service is not ready
     """
     try:
-        # Check if database is accessible
-        db.session.execute(text('SELECT 1'))
+        # Check if database is accessible; fail fast rather than hang the probe
+        ping_database()
 
         return jsonify({
             'status': 'ready',
@@ -111,26 +147,26 @@ def metrics():
     """
     Basic application metrics
 
+    Query params:
+        exact: 'false' to use planner row estimates instead of count(*)
+
     Returns:
         200: Metrics data
     """
     try:
-        # Get database stats
-        from app.models.user import User
-        from app.models.family import Family
-        from app.models.recipe import Recipe
-        from app.models.shopping_list import ShoppingList
+        # Get database stats in a single round-trip
+        if request.args.get('exact', 'true').lower() == 'false':
+            rows = db.session.execute(_ESTIMATED_COUNTS_SQL, {'tables': list(METRIC_TABLES)}).all()
+            estimates = dict(rows)
+            counts = [estimates.get(table, 0) for table in METRIC_TABLES]
+        else:
+            counts = db.session.execute(_EXACT_COUNTS_SQL).one()
 
         metrics_data = {
             'timestamp': datetime.utcnow().isoformat(),
-            'database': {
-                'users': User.query.count(),
-                'families': Family.query.count(),
-                'recipes': Recipe.query.count(),
-                'shopping_lists': ShoppingList.query.count()
-            },
+            'database': dict(zip(METRIC_TABLES, counts)),
             'system': {
-                'environment': os.getenv('FLASK_ENV', 'production')
+                'environment': settings.env
             }
         }
 
@@ -1,76 +1,111 @@
 """
 Recipe management routes
 """
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy.orm import joinedload, selectinload
+from flask import Blueprint, Response, request, jsonify
+from flask_jwt_extended import jwt_required
+from sqlalchemy import func, insert, select
 from app import db
+from app.models.base import utc_now
 from app.models.recipe import Recipe, Ingredient, CookingStep, RecipeTimer
 from app.models.cooking_session import CookingSession
-from app.utils.decorators import family_member_required
-from app.utils.pagination import get_pagination_params, paginate_query, create_paginated_response
+from app.utils.decorators import family_member_required, current_user_id, current_family_member
+from app.utils.loaders import UserLoader
+from app.utils.pagination import get_pagination_params, paginate_deferred, paginate_keyset, create_paginated_response
+from app.utils.caching import (
+    get_recipe_json_cached, current_body, invalidate_recipe_cache, recipe_version, not_modified, conditional_json
+)
 from app.services.recipe_parser import parse_recipe
+from app.schemas.recipe import CreateRecipeRequest, UpdateRecipeRequest
 from app.schemas.recipe_import import ImportResponse
+from app.utils.validation import parse_body
 
 bp = Blueprint('recipes', __name__, url_prefix='/api/families/<int:family_id>/recipes')
 
+# Scalar Recipe columns a PUT may change
+RECIPE_FIELDS = (
+    'name', 'description', 'prep_time', 'cook_time', 'servings',
+    'image_url', 'source_url', 'assigned_to_id',
+)
+
+
+def ingredient_rows(recipe_id, ingredients):
+    """Ingredient INSERT mappings for a recipe"""
+    return [
+        {
+            'recipe_id': recipe_id,
+            'name': ing.name,
+            'quantity': ing.quantity,
+            'order': idx
+        }
+        for idx, ing in enumerate(ingredients)
+    ]
+
+
+def step_rows(recipe_id, steps):
+    """CookingStep INSERT mappings for a recipe"""
+    return [
+        {
+            'recipe_id': recipe_id,
+            'instruction': step.instruction,
+            'order': idx,
+            'estimated_time': step.estimated_time
+        }
+        for idx, step in enumerate(steps)
+    ]
+
+
+def timer_rows(recipe_id, timers):
+    """RecipeTimer INSERT mappings for a recipe"""
+    return [
+        {
+            'recipe_id': recipe_id,
+            'name': timer.name,
+            'duration': timer.duration,
+            'step_order': timer.step_order
+        }
+        for timer in timers
+    ]
+
+
+def bulk_insert(model, rows):
+    """One multi-row INSERT for a child table (no-op when empty)"""
+    if rows:
+        db.session.execute(insert(model), rows)
+
 
 @bp.route('', methods=['POST'])
 @family_member_required
 def create_recipe(family_id):
     """Create a new recipe"""
-    user_id = int(get_jwt_identity())
-    data = request.get_json()
+    data, error = parse_body(CreateRecipeRequest)
+    if error:
+        return error
 
-    required_fields = ['name', 'prep_time', 'cook_time']
-    if not all(field in data for field in required_fields):
-        return jsonify({'error': 'Missing required fields'}), 400
+    user_id = current_user_id()
 
     # Create recipe
     recipe = Recipe(
-        name=data['name'],
-        description=data.get('description'),
-        prep_time=data['prep_time'],
-        cook_time=data['cook_time'],
-        servings=data.get('servings', 4),
-        image_url=data.get('image_url'),
-        source_url=data.get('source_url'),
+        name=data.name,
+        description=data.description,
+        prep_time=data.prep_time,
+        cook_time=data.cook_time,
+        servings=data.servings,
+        image_url=data.image_url,
+        source_url=data.source_url,
         family_id=family_id,
-        assigned_to_id=data.get('assigned_to_id', user_id)
+        assigned_to_id=data.assigned_to_id if 'assigned_to_id' in data.model_fields_set else user_id
     )
 
     try:
-        recipe.save()
+        # Flush for recipe.id, then one INSERT per child table and a single commit
+        recipe.save(commit=False)
+        bulk_insert(Ingredient, ingredient_rows(recipe.id, data.ingredients))
+        bulk_insert(CookingStep, step_rows(recipe.id, data.steps))
+        bulk_insert(RecipeTimer, timer_rows(recipe.id, data.timers))
+        db.session.commit()
 
-        # Add ingredients
-        for idx, ing_data in enumerate(data.get('ingredients', [])):
-            ingredient = Ingredient(
-                recipe_id=recipe.id,
-                name=ing_data['name'],
-                quantity=ing_data.get('quantity'),
-                order=idx
-            )
-            ingredient.save()
-
-        # Add cooking steps
-        for idx, step_data in enumerate(data.get('steps', [])):
-            step = CookingStep(
-                recipe_id=recipe.id,
-                instruction=step_data['instruction'],
-                order=idx,
-                estimated_time=step_data.get('estimated_time')
-            )
-            step.save()
-
-        # Add timers
-        for timer_data in data.get('timers', []):
-            timer = RecipeTimer(
-                recipe_id=recipe.id,
-                name=timer_data['name'],
-                duration=timer_data['duration'],
-                step_order=timer_data.get('step_order')
-            )
-            timer.save()
+        # Invalidate cache
+        invalidate_recipe_cache(family_id)
 
         return jsonify({
             'message': 'Recipe created successfully',
@@ -88,16 +123,33 @@ def get_recipes(family_id):
     # Get pagination parameters
     params = get_pagination_params()
 
-    # Build query with eager loading
-    query = Recipe.query.options(
-        joinedload(Recipe.assigned_to)
-    ).filter_by(family_id=family_id).order_by(Recipe.created_at.desc())
-
-    # Paginate results
-    result = paginate_query(query, params['page'], params['per_page'])
+    query = Recipe.query.filter_by(family_id=family_id)
+
+    # ?compact=true selects only the columns the list view shows
+    compact = request.args.get('compact', 'false').lower() == 'true'
+    options = (Recipe.list_columns(),) if compact else ()
+
+    # Paginate results: ?cursor= pages by (created_at, id); page numbers use a deferred join
+    if params['cursor'] is not None:
+        result = paginate_keyset(query.options(*options), Recipe, params['cursor'], params['per_page'])
+    else:
+        result = paginate_deferred(
+            query,
+            Recipe,
+            (Recipe.created_at.desc(), Recipe.id.desc()),
+            params['page'],
+            params['per_page'],
+            options=options,
+            count=params['count']
+        )
 
-    # Serialize items
-    recipes = [r.to_dict() for r in result['items']]
+    # Serialize items; the page's few distinct assignees are loaded in one
+    # query and each is serialized once
+    loader = UserLoader.for_request().load_many(r.assigned_to_id for r in result['items'])
+    if compact:
+        recipes = [r.to_list_dict(loader) for r in result['items']]
+    else:
+        recipes = [r.to_dict(loader=loader) for r in result['items']]
 
     return create_paginated_response(recipes, result['pagination'], 'recipes')
 
@@ -105,99 +157,82 @@ def get_recipes(family_id):
 @bp.route('/<int:recipe_id>', methods=['GET'])
 @family_member_required
 def get_recipe(family_id, recipe_id):
-    """Get recipe details"""
-    recipe = Recipe.query.options(
-        joinedload(Recipe.assigned_to),
-        selectinload(Recipe.ingredients),
-        selectinload(Recipe.steps),
-        selectinload(Recipe.timers)
-    ).filter_by(id=recipe_id).first()
+    """Get recipe details (supports conditional GET via If-None-Match)"""
+    row_version = recipe_version(family_id, recipe_id)
 
-    if not recipe or recipe.family_id != family_id:
+    if not row_version:
+        return jsonify({'error': 'Recipe not found'}), 404
+
+    version, last_modified = row_version
+    cached = current_body(get_recipe_json_cached, family_id, recipe_id, version)
+
+    if not cached:
         return jsonify({'error': 'Recipe not found'}), 404
 
-    return jsonify({'recipe': recipe.to_dict(include_details=True)}), 200
+    etag, body = cached
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
+
+    return conditional_json(body, etag, last_modified)
 
 
 @bp.route('/<int:recipe_id>', methods=['PUT'])
 @family_member_required
 def update_recipe(family_id, recipe_id):
     """Update recipe"""
+    data, error = parse_body(UpdateRecipeRequest)
+    if error:
+        return error
+
     recipe = Recipe.get_by_id(recipe_id)
 
     if not recipe or recipe.family_id != family_id:
         return jsonify({'error': 'Recipe not found'}), 404
 
-    data = request.get_json()
+    # Update basic fields (only those present in the body)
+    sent = data.model_fields_set
+    for field in RECIPE_FIELDS:
+        if field in sent:
+            setattr(recipe, field, getattr(data, field))
 
-    # Update basic fields
-    if 'name' in data:
-        recipe.name = data['name']
-    if 'description' in data:
-        recipe.description = data['description']
-    if 'prep_time' in data:
-        recipe.prep_time = data['prep_time']
-    if 'cook_time' in data:
-        recipe.cook_time = data['cook_time']
-    if 'servings' in data:
-        recipe.servings = data['servings']
-    if 'image_url' in data:
-        recipe.image_url = data['image_url']
-    if 'source_url' in data:
-        recipe.source_url = data['source_url']
-    if 'assigned_to_id' in data:
-        recipe.assigned_to_id = data['assigned_to_id']
+    # Bump the version even when only child rows change (ETag is derived from it)
+    recipe.updated_at = utc_now()
 
     try:
-        recipe.save()
+        recipe.save(commit=False)
+
+        # Child rows are replaced with one DELETE and one INSERT per table;
+        # the collections are expired by the commit below before to_dict reads them
 
         # Update ingredients if provided
-        if 'ingredients' in data:
+        if 'ingredients' in sent:
             # Delete existing ingredients
-            for ing in recipe.ingredients:
-                ing.delete()
+            Ingredient.query.filter_by(recipe_id=recipe.id).delete(synchronize_session=False)
 
             # Add new ingredients
-            for idx, ing_data in enumerate(data['ingredients']):
-                ingredient = Ingredient(
-                    recipe_id=recipe.id,
-                    name=ing_data['name'],
-                    quantity=ing_data.get('quantity'),
-                    order=idx
-                )
-                ingredient.save()
+            bulk_insert(Ingredient, ingredient_rows(recipe.id, data.ingredients))
 
         # Update steps if provided
-        if 'steps' in data:
+        if 'steps' in sent:
             # Delete existing steps
-            for step in recipe.steps:
-                step.delete()
+            CookingStep.query.filter_by(recipe_id=recipe.id).delete(synchronize_session=False)
 
             # Add new steps
-            for idx, step_data in enumerate(data['steps']):
-                step = CookingStep(
-                    recipe_id=recipe.id,
-                    instruction=step_data['instruction'],
-                    order=idx,
-                    estimated_time=step_data.get('estimated_time')
-                )
-                step.save()
+            bulk_insert(CookingStep, step_rows(recipe.id, data.steps))
 
         # Update timers if provided
-        if 'timers' in data:
+        if 'timers' in sent:
             # Delete existing timers
-            for timer in recipe.timers:
-                timer.delete()
+            RecipeTimer.query.filter_by(recipe_id=recipe.id).delete(synchronize_session=False)
 
             # Add new timers
-            for timer_data in data['timers']:
-                timer = RecipeTimer(
-                    recipe_id=recipe.id,
-                    name=timer_data['name'],
-                    duration=timer_data['duration'],
-                    step_order=timer_data.get('step_order')
-                )
-                timer.save()
+            bulk_insert(RecipeTimer, timer_rows(recipe.id, data.timers))
+
+        db.session.commit()
+
+        # Invalidate cache
+        invalidate_recipe_cache(family_id, recipe_id)
 
         return jsonify({
             'message': 'Recipe updated successfully',
@@ -212,36 +247,37 @@ def update_recipe(family_id, recipe_id):
 @family_member_required
 def delete_recipe(family_id, recipe_id):
     """Delete recipe"""
-    recipe = Recipe.get_by_id(recipe_id)
+    user_id = current_user_id()
+
+    # Recipe and active session count in one round-trip; the caller's role
+    # comes from the membership row family_member_required already loaded
+    from app.models.family import FamilyRole
+    row = db.session.execute(
+        select(
+            Recipe,
+            func.count(CookingSession.id).filter(CookingSession.is_active).label('active_sessions')
+        )
+        .outerjoin(CookingSession, CookingSession.recipe_id == Recipe.id)
+        .where(Recipe.id == recipe_id, Recipe.family_id == family_id)
+        .group_by(Recipe.id)
+    ).first()
 
-    if not recipe or recipe.family_id != family_id:
+    if not row:
         return jsonify({'error': 'Recipe not found'}), 404
 
-    # Check if user has permission to delete
-    user_id = int(get_jwt_identity())
-
-    # Get user's family membership to check role
-    from app.models.family import FamilyMember
-    member = FamilyMember.query.filter_by(
-        family_id=family_id,
-        user_id=user_id
-    ).first()
+    recipe, active_sessions = row
+    role = current_family_member().role
 
     # Allow: assigned user, family owners, or family admins
     can_delete = (
         recipe.assigned_to_id == user_id or
-        (member and member.role.value in ['owner', 'admin'])
+        role in (FamilyRole.OWNER, FamilyRole.ADMIN)
     )
 
     if not can_delete:
         return jsonify({'error': 'Permission denied. Only the assigned user or family admins can delete recipes.'}), 403
 
     # Check for active cooking sessions
-    active_sessions = CookingSession.query.filter_by(
-        recipe_id=recipe_id,
-        is_active=True
-    ).count()
-
     if active_sessions > 0:
         return jsonify({
             'error': 'Cannot delete recipe with active cooking sessions. Please end the cooking session first.'
@@ -249,6 +285,10 @@ def delete_recipe(family_id, recipe_id):
 
     try:
         recipe.delete()
+
+        # Invalidate cache
+        invalidate_recipe_cache(family_id, recipe_id)
+
         return jsonify({'message': 'Recipe deleted successfully'}), 200
     except Exception as e:
         print(f"[ERROR] Recipe deletion failed for recipe {recipe_id}: {str(e)}")
@@ -275,6 +315,10 @@ def assign_recipe(family_id, recipe_id):
 
     try:
         recipe.save()
+
+        # Invalidate cache
+        invalidate_recipe_cache(family_id, recipe_id)
+
         return jsonify({
             'message': 'Recipe assigned successfully',
             'recipe': recipe.to_dict()
@@ -314,7 +358,7 @@ def import_recipe_endpoint(family_id):
         return jsonify({"error": "URL required"}), 400
 
     # Get user ID (validated by @family_member_required decorator)
-    user_id = get_jwt_identity()
+    user_id = current_user_id()
 
     try:
         # Parse recipe (with SSRF protection, LLM normalization, timer derivation)
@@ -335,7 +379,7 @@ def import_recipe_endpoint(family_id):
             extraction_method=extraction_method
         )
 
-        return jsonify(response.dict()), 200
+        return Response(response.model_dump_json(), status=200, mimetype='application/json')
 
     except ValueError as e:
         # URL validation, fetch, or size errors (400 Bad Request)
@@ -1,18 +1,46 @@
 """
 Shopping list management routes
 """
-from datetime import datetime
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy.orm import joinedload, selectinload
-from app import db, socketio
+from flask_jwt_extended import jwt_required
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from app import db
+from app.models.base import utc_now
 from app.models.shopping_list import ShoppingList, ShoppingListItem
-from app.utils.decorators import family_member_required
-from app.utils.pagination import get_pagination_params, paginate_query, create_paginated_response
-from app.utils.caching import invalidate_shopping_list_cache
+from app.utils.decorators import family_member_required, current_user_id
+from app.utils.pagination import get_pagination_params, paginate_keyset, paginate_query, stream_paginated_response
+from app.utils.caching import (
+    get_shopping_list_json_cached, current_body, invalidate_shopping_list_cache, shopping_list_version,
+    not_modified, conditional_json
+)
+from app.utils.loaders import UserLoader, strict_loading
+from app.utils.validation import parse_body
+from app.services.broadcast import broadcast_to_family, originating_sid, queue_item_update
+from app.schemas.shopping_list import BulkAddItemsRequest
 
 bp = Blueprint('shopping_lists', __name__, url_prefix='/api/families/<int:family_id>/shopping-lists')
 
+# Fields broadcast for each event, projected from the response's to_dict()
+LIST_CREATED_FIELDS = ('id', 'name', 'family_id', 'is_active', 'created_at')
+LIST_UPDATED_FIELDS = ('id', 'name', 'is_active', 'updated_at')
+ITEM_ADDED_FIELDS = (
+    'id', 'shopping_list_id', 'name', 'quantity', 'category', 'notes', 'checked',
+    'added_by_id', 'checked_by_id', 'version', 'created_at', 'updated_at',
+)
+ITEM_UPDATED_FIELDS = (
+    'id', 'shopping_list_id', 'name', 'quantity', 'category', 'notes', 'checked',
+    'checked_by_id', 'checked_at', 'version', 'updated_at',
+)
+
+
+def list_in_family(list_id, family_id):
+    """EXISTS clause that is true when the list belongs to the family"""
+    return select(ShoppingList.id).where(
+        ShoppingList.id == list_id,
+        ShoppingList.family_id == family_id
+    ).exists()
+
 
 @bp.route('', methods=['POST'])
 @family_member_required
@@ -31,22 +59,19 @@ def create_shopping_list(family_id):
         # Invalidate cache
         invalidate_shopping_list_cache(family_id)
 
+        # Serialized once for both the response and the broadcast
+        list_data = shopping_list.to_dict(include_items=True, loader=UserLoader.for_request())
+
         # Broadcast to family room (minimal payload)
-        socketio.emit(
+        broadcast_to_family(
             'shopping_list_created',
-            {
-                'id': shopping_list.id,
-                'name': shopping_list.name,
-                'family_id': shopping_list.family_id,
-                'is_active': shopping_list.is_active,
-                'created_at': shopping_list.created_at.isoformat() if shopping_list.created_at else None
-            },
-            room=f"family_{family_id}"
+            {key: list_data[key] for key in LIST_CREATED_FIELDS},
+            family_id
         )
 
         return jsonify({
             'message': 'Shopping list created successfully',
-            'shopping_list': shopping_list.to_dict(include_items=True)
+            'shopping_list': list_data
         }), 201
     except Exception as e:
         db.session.rollback()
@@ -60,37 +85,72 @@ def get_shopping_lists(family_id):
     # Get pagination parameters
     params = get_pagination_params()
 
-    # Get active lists by default, or all if specified
-    query = ShoppingList.query.options(
-        selectinload(ShoppingList.items).joinedload(ShoppingListItem.added_by),
-        selectinload(ShoppingList.items).joinedload(ShoppingListItem.checked_by)
-    ).filter_by(family_id=family_id).order_by(ShoppingList.created_at.desc())
+    # Get active lists by default, or all if specified; items arrive in one
+    # batched SELECT, and in debug any other lazy load raises
+    query = ShoppingList.query.options(*strict_loading(
+        selectinload(ShoppingList.items),
+        nested=(selectinload(ShoppingList.items),)
+    )).filter_by(family_id=family_id)
 
     if request.args.get('active_only', 'true').lower() == 'true':
         query = query.filter_by(is_active=True)
 
-    # Paginate results
-    result = paginate_query(query, params['page'], params['per_page'])
+    # Keyset pages by (created_at, id) unless the client asks for a page number
+    cursor = params['cursor']
+    if cursor is None and 'page' not in request.args:
+        cursor = ''
+
+    if cursor is not None:
+        result = paginate_keyset(query, ShoppingList, cursor, params['per_page'])
+    else:
+        result = paginate_query(
+            query.order_by(ShoppingList.created_at.desc(), ShoppingList.id.desc()),
+            params['page'],
+            params['per_page'],
+            count=params['count']
+        )
 
-    # Serialize items
-    shopping_lists = [sl.to_dict(include_items=True) for sl in result['items']]
+    # Serialize items, fetching every referenced user in one query;
+    # ?include_users=false returns only the user ids and skips that query
+    include_users = request.args.get('include_users', 'true').lower() != 'false'
+    loader = None
+    if include_users:
+        loader = UserLoader.for_request().load_many(
+            user_id
+            for sl in result['items'] for item in sl.items
+            for user_id in (item.added_by_id, item.checked_by_id)
+        )
 
-    return create_paginated_response(shopping_lists, result['pagination'], 'shopping_lists')
+    # Each list is encoded as it is sent rather than building the whole payload first
+    return stream_paginated_response(
+        result['items'],
+        lambda sl: sl.to_dict(include_items=True, loader=loader, include_users=include_users),
+        result['pagination'],
+        'shopping_lists'
+    )
 
 
 @bp.route('/<int:list_id>', methods=['GET'])
 @family_member_required
 def get_shopping_list(family_id, list_id):
-    """Get shopping list details"""
-    shopping_list = ShoppingList.query.options(
-        selectinload(ShoppingList.items).joinedload(ShoppingListItem.added_by),
-        selectinload(ShoppingList.items).joinedload(ShoppingListItem.checked_by)
-    ).filter_by(id=list_id).first()
+    """Get shopping list details (supports conditional GET via If-None-Match)"""
+    row_version = shopping_list_version(family_id, list_id)
 
-    if not shopping_list or shopping_list.family_id != family_id:
+    if not row_version:
         return jsonify({'error': 'Shopping list not found'}), 404
 
-    return jsonify({'shopping_list': shopping_list.to_dict(include_items=True)}), 200
+    version, last_modified = row_version
+    cached = current_body(get_shopping_list_json_cached, family_id, list_id, version)
+
+    if not cached:
+        return jsonify({'error': 'Shopping list not found'}), 404
+
+    etag, body = cached
+    unchanged = not_modified(etag)
+    if unchanged:
+        return unchanged
+
+    return conditional_json(body, etag, last_modified)
 
 
 @bp.route('/<int:list_id>', methods=['PUT'])
@@ -113,23 +173,21 @@ def update_shopping_list(family_id, list_id):
         shopping_list.save()
 
         # Invalidate cache
-        invalidate_shopping_list_cache(family_id)
+        invalidate_shopping_list_cache(family_id, list_id)
+
+        # Serialized once for both the response and the broadcast
+        list_data = shopping_list.to_dict(include_items=True, loader=UserLoader.for_request())
 
         # Broadcast update (minimal payload - don't include full items array)
-        socketio.emit(
+        broadcast_to_family(
             'shopping_list_updated',
-            {
-                'id': shopping_list.id,
-                'name': shopping_list.name,
-                'is_active': shopping_list.is_active,
-                'updated_at': shopping_list.updated_at.isoformat() if shopping_list.updated_at else None
-            },
-            room=f"family_{family_id}"
+            {key: list_data[key] for key in LIST_UPDATED_FIELDS},
+            family_id
         )
 
         return jsonify({
             'message': 'Shopping list updated successfully',
-            'shopping_list': shopping_list.to_dict(include_items=True)
+            'shopping_list': list_data
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -149,13 +207,13 @@ def delete_shopping_list(family_id, list_id):
         shopping_list.delete()
 
         # Invalidate cache
-        invalidate_shopping_list_cache(family_id)
+        invalidate_shopping_list_cache(family_id, list_id)
 
         # Broadcast deletion
-        socketio.emit(
+        broadcast_to_family(
             'shopping_list_deleted',
             {'list_id': list_id},
-            room=f"family_{family_id}"
+            family_id
         )
 
         return jsonify({'message': 'Shopping list deleted successfully'}), 200
@@ -168,55 +226,44 @@ def delete_shopping_list(family_id, list_id):
 @family_member_required
 def add_item(family_id, list_id):
     """Add item to shopping list"""
-    user_id = int(get_jwt_identity())
-    shopping_list = ShoppingList.get_by_id(list_id)
-
-    if not shopping_list or shopping_list.family_id != family_id:
-        return jsonify({'error': 'Shopping list not found'}), 404
-
+    user_id = current_user_id()
     data = request.get_json()
 
     if not data.get('name'):
         return jsonify({'error': 'Item name required'}), 400
 
-    item = ShoppingListItem(
-        shopping_list_id=list_id,
-        name=data['name'],
-        quantity=data.get('quantity'),
-        category=data.get('category'),
-        notes=data.get('notes'),
-        added_by_id=user_id
-    )
-
     try:
-        item.save()
+        # The INSERT itself checks the list belongs to the family
+        items = ShoppingListItem.bulk_create_where([{
+            'shopping_list_id': list_id,
+            'name': data['name'],
+            'quantity': data.get('quantity'),
+            'category': data.get('category'),
+            'notes': data.get('notes'),
+            'added_by_id': user_id
+        }], list_in_family(list_id, family_id))
+
+        if not items:
+            db.session.rollback()
+            return jsonify({'error': 'Shopping list not found'}), 404
+
+        # Serialize from the RETURNING row, then commit once
+        item_data = items[0].to_dict(UserLoader.for_request())
+        db.session.commit()
 
         # Invalidate cache
-        invalidate_shopping_list_cache(family_id)
+        invalidate_shopping_list_cache(family_id, list_id)
 
         # Broadcast new item (minimal payload - send only essential data with version)
-        socketio.emit(
+        broadcast_to_family(
             'shopping_item_added',
-            {
-                'id': item.id,
-                'shopping_list_id': item.shopping_list_id,
-                'name': item.name,
-                'quantity': item.quantity,
-                'category': item.category,
-                'notes': item.notes,
-                'checked': item.checked,
-                'added_by_id': item.added_by_id,
-                'checked_by_id': item.checked_by_id,
-                'version': item.version,  # Include version for optimistic locking
-                'created_at': item.created_at.isoformat() if item.created_at else None,
-                'updated_at': item.updated_at.isoformat() if item.updated_at else None
-            },
-            room=f"family_{family_id}"
+            {key: item_data[key] for key in ITEM_ADDED_FIELDS},
+            family_id
         )
 
         return jsonify({
             'message': 'Item added successfully',
-            'item': item.to_dict()
+            'item': item_data
         }), 201
     except Exception as e:
         db.session.rollback()
@@ -227,7 +274,7 @@ def add_item(family_id, list_id):
 @family_member_required
 def update_item(family_id, list_id, item_id):
     """Update shopping list item with optimistic locking"""
-    user_id = int(get_jwt_identity())
+    user_id = current_user_id()
     item = ShoppingListItem.get_by_id(item_id)
 
     if not item or item.shopping_list.family_id != family_id:
@@ -256,7 +303,8 @@ def update_item(family_id, list_id, item_id):
         item.checked = data['checked']
         if item.checked:
             item.checked_by_id = user_id
-            item.checked_at = datetime.utcnow()
+            # Stamped by the database inside the UPDATE (same clock as updated_at)
+            item.checked_at = utc_now()
         else:
             item.checked_by_id = None
             item.checked_at = None
@@ -268,30 +316,18 @@ def update_item(family_id, list_id, item_id):
         item.save()
 
         # Invalidate cache
-        invalidate_shopping_list_cache(family_id)
+        invalidate_shopping_list_cache(family_id, list_id)
 
-        # Broadcast update (minimal payload - send only changed fields with version)
-        socketio.emit(
-            'shopping_item_updated',
-            {
-                'id': item.id,
-                'shopping_list_id': item.shopping_list_id,
-                'name': item.name,
-                'quantity': item.quantity,
-                'category': item.category,
-                'notes': item.notes,
-                'checked': item.checked,
-                'checked_by_id': item.checked_by_id,
-                'checked_at': item.checked_at.isoformat() if item.checked_at else None,
-                'version': item.version,  # Include version for optimistic locking
-                'updated_at': item.updated_at.isoformat() if item.updated_at else None
-            },
-            room=f"family_{family_id}"
-        )
+        # Serialized once for both the response and the broadcast
+        item_data = item.to_dict(UserLoader.for_request())
+
+        # Broadcast update (minimal payload - send only changed fields with version);
+        # rapid edits to the same list are coalesced into one batched event
+        queue_item_update(family_id, list_id, {key: item_data[key] for key in ITEM_UPDATED_FIELDS})
 
         return jsonify({
             'message': 'Item updated successfully',
-            'item': item.to_dict()
+            'item': item_data
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -311,13 +347,13 @@ def delete_item(family_id, list_id, item_id):
         item.delete()
 
         # Invalidate cache
-        invalidate_shopping_list_cache(family_id)
+        invalidate_shopping_list_cache(family_id, list_id)
 
         # Broadcast deletion
-        socketio.emit(
+        broadcast_to_family(
             'shopping_item_deleted',
             {'item_id': item_id, 'list_id': list_id},
-            room=f"family_{family_id}"
+            family_id
         )
 
         return jsonify({'message': 'Item deleted successfully'}), 200
@@ -330,40 +366,46 @@ def delete_item(family_id, list_id, item_id):
 @family_member_required
 def bulk_add_items(family_id, list_id):
     """Bulk add items (useful for adding from recipes)"""
-    user_id = int(get_jwt_identity())
-    shopping_list = ShoppingList.get_by_id(list_id)
+    data, error = parse_body(BulkAddItemsRequest)
+    if error:
+        return error
 
-    if not shopping_list or shopping_list.family_id != family_id:
-        return jsonify({'error': 'Shopping list not found'}), 404
-
-    data = request.get_json()
-    items_data = data.get('items', [])
-
-    if not items_data:
+    if not data.items:
         return jsonify({'error': 'No items provided'}), 400
 
+    user_id = current_user_id()
+
     try:
-        added_items = []
-        for item_data in items_data:
-            item = ShoppingListItem(
-                shopping_list_id=list_id,
-                name=item_data['name'],
-                quantity=item_data.get('quantity'),
-                category=item_data.get('category'),
-                notes=item_data.get('notes'),
-                added_by_id=user_id
-            )
-            item.save()
-            added_items.append(item.to_dict())
+        # One INSERT for every item, gated on the list belonging to the family
+        items = ShoppingListItem.bulk_create_where([
+            {
+                'shopping_list_id': list_id,
+                'name': item.name,
+                'quantity': item.quantity,
+                'category': item.category,
+                'notes': item.notes,
+                'added_by_id': user_id
+            }
+            for item in data.items
+        ], list_in_family(list_id, family_id))
+
+        if not items:
+            db.session.rollback()
+            return jsonify({'error': 'Shopping list not found'}), 404
+
+        # Serialize straight from the RETURNING rows, then commit once
+        added_items = ShoppingListItem.to_dict_many(items, UserLoader.for_request())
+        db.session.commit()
 
         # Invalidate cache
-        invalidate_shopping_list_cache(family_id)
+        invalidate_shopping_list_cache(family_id, list_id)
 
-        # Broadcast bulk add
-        socketio.emit(
+        # Broadcast bulk add (the requesting client already has the items)
+        broadcast_to_family(
             'shopping_items_bulk_added',
             {'items': added_items, 'list_id': list_id},
-            room=f"family_{family_id}"
+            family_id,
+            skip_sid=originating_sid(user_id)
         )
 
         return jsonify({
@@ -0,0 +1,36 @@
+"""
+Pydantic schemas for auth request bodies.
+Validated before any database query so malformed payloads are rejected early.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Optional
+
+from app.utils.validation import EMAIL_PATTERN
+
+
+class RegisterRequest(BaseModel):
+    """Body of POST /api/auth/register"""
+    email: str = Field(..., max_length=255, pattern=EMAIL_PATTERN)
+    password: str = Field(..., min_length=1)
+    first_name: str = Field(..., min_length=1, max_length=100)
+    last_name: str = Field(..., min_length=1, max_length=100)
+
+
+class LoginRequest(BaseModel):
+    """Body of POST /api/auth/login"""
+    email: str = Field(..., min_length=1, max_length=255)
+    password: str = Field(..., min_length=1)
+
+
+class UpdateProfileRequest(BaseModel):
+    """Body of PUT /api/auth/me (all fields optional)"""
+    email: Optional[str] = Field(None, max_length=255, pattern=EMAIL_PATTERN)
+    first_name: Optional[str] = Field(None, min_length=1, max_length=100)
+    last_name: Optional[str] = Field(None, min_length=1, max_length=100)
+
+
+class ChangePasswordRequest(BaseModel):
+    """Body of POST /api/auth/change-password"""
+    current_password: str = Field(..., min_length=1)
+    new_password: str = Field(..., min_length=1)
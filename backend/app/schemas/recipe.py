@@ -0,0 +1,56 @@
+"""
+Pydantic schemas for recipe request bodies.
+Validated before any database query so malformed payloads are rejected early.
+"""
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class IngredientIn(BaseModel):
+    """Ingredient in a recipe create/update body"""
+    name: str = Field(..., min_length=1, max_length=255)
+    quantity: Optional[str] = Field(None, max_length=50)
+
+
+class StepIn(BaseModel):
+    """Cooking step in a recipe create/update body (order is its list position)"""
+    instruction: str = Field(..., min_length=1)
+    estimated_time: Optional[int] = Field(None, ge=0)  # minutes
+
+
+class TimerIn(BaseModel):
+    """Recipe timer in a recipe create/update body"""
+    name: str = Field(..., min_length=1, max_length=255)
+    duration: int = Field(..., ge=1)  # seconds
+    step_order: Optional[int] = None
+
+
+class CreateRecipeRequest(BaseModel):
+    """Body of POST /api/families/<id>/recipes"""
+    name: str = Field(..., min_length=1, max_length=255)
+    description: Optional[str] = None
+    prep_time: int = Field(..., ge=0)
+    cook_time: int = Field(..., ge=0)
+    servings: Optional[int] = Field(4, ge=1)
+    image_url: Optional[str] = Field(None, max_length=500)
+    source_url: Optional[str] = Field(None, max_length=500)
+    assigned_to_id: Optional[int] = None
+    ingredients: List[IngredientIn] = Field(default_factory=list)
+    steps: List[StepIn] = Field(default_factory=list)
+    timers: List[TimerIn] = Field(default_factory=list)
+
+
+class UpdateRecipeRequest(BaseModel):
+    """Body of PUT /api/families/<id>/recipes/<id> (only fields sent are applied)"""
+    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    description: Optional[str] = None
+    prep_time: Optional[int] = Field(None, ge=0)
+    cook_time: Optional[int] = Field(None, ge=0)
+    servings: Optional[int] = Field(None, ge=1)
+    image_url: Optional[str] = Field(None, max_length=500)
+    source_url: Optional[str] = Field(None, max_length=500)
+    assigned_to_id: Optional[int] = None
+    ingredients: Optional[List[IngredientIn]] = None
+    steps: Optional[List[StepIn]] = None
+    timers: Optional[List[TimerIn]] = None
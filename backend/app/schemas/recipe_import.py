@@ -3,7 +3,7 @@ Pydantic schemas for recipe import validation.
 Schema aligned with database models and frontend types.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from typing import Optional, List
 
 
@@ -41,18 +41,8 @@ class LLMNormalizedRecipe(BaseModel):
     cook_time_minutes: int = Field(default=0, ge=0, le=1440)
     servings: int = Field(default=4, ge=1, le=100)
     image_url: str = Field(default="", max_length=500)
-    ingredients: List[ImportedIngredient] = Field(..., min_items=1, max_items=50)
-    timers: List[LLMTimer] = Field(default_factory=list, max_items=20)
-
-    @validator('ingredients')
-    def truncate_ingredients(cls, v):
-        """Hard limit to max 50 ingredients"""
-        return v[:50]
-
-    @validator('timers')
-    def validate_and_truncate_timers(cls, v):
-        """Validate timer format and truncate to max 20"""
-        return v[:20]
+    ingredients: List[ImportedIngredient] = Field(..., min_length=1, max_length=50)
+    timers: List[LLMTimer] = Field(default_factory=list, max_length=20)
 
 
 class ImportedRecipe(BaseModel):
@@ -64,24 +54,9 @@ class ImportedRecipe(BaseModel):
     servings: int = Field(default=4, ge=1, le=100)
     image_url: str = Field(default="", max_length=500, description="Recipe image URL or empty string if not available")
     source_url: str
-    ingredients: List[ImportedIngredient] = Field(..., min_items=1, max_items=50)
-    steps: List[ImportedStep] = Field(..., min_items=1, max_items=30)
-    timers: List[ImportedTimer] = Field(default_factory=list, max_items=20)
-
-    @validator('ingredients')
-    def truncate_ingredients(cls, v):
-        """Hard limit to max 50 ingredients"""
-        return v[:50]
-
-    @validator('steps')
-    def truncate_steps(cls, v):
-        """Hard limit to max 30 steps"""
-        return v[:30]
-
-    @validator('timers')
-    def truncate_timers(cls, v):
-        """Hard limit to max 20 timers"""
-        return v[:20]
+    ingredients: List[ImportedIngredient] = Field(..., min_length=1, max_length=50)
+    steps: List[ImportedStep] = Field(..., min_length=1, max_length=30)
+    timers: List[ImportedTimer] = Field(default_factory=list, max_length=20)
 
 
 class ImportResponse(BaseModel):
@@ -0,0 +1,20 @@
+"""
+Pydantic schemas for shopping list request bodies.
+Validated before any database query so malformed payloads are rejected early.
+"""
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class ShoppingItemIn(BaseModel):
+    """Item in a bulk add body"""
+    name: str = Field(..., min_length=1, max_length=255)
+    quantity: Optional[str] = Field(None, max_length=50)
+    category: Optional[str] = Field(None, max_length=100)
+    notes: Optional[str] = None
+
+
+class BulkAddItemsRequest(BaseModel):
+    """Body of POST /api/families/<id>/shopping-lists/<id>/items/bulk"""
+    items: List[ShoppingItemIn] = Field(default_factory=list)
@@ -0,0 +1,102 @@
+"""
+WebSocket broadcasts to family rooms, kept off the HTTP request path
+Rapid shopping item edits (e.g. checking things off while shopping) are buffered per
+list for a short window; repeated edits to the same item collapse into its
+latest state, so a burst costs one shopping_item_updated per item instead of
+one per edit.
+"""
+import threading
+import redis
+from flask import request
+from app import socketio
+from app.config import settings
+
+FLUSH_INTERVAL_SECONDS = 0.05
+SOCKET_OWNER_TTL_SECONDS = 24 * 60 * 60
+
+redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+
+_lock = threading.Lock()
+_pending = {}  # (family_id, list_id) -> {item_id: item payload}
+
+
+def _socket_owner_key(sid):
+    return f"socket:{sid}:user"
+
+
+def register_socket_owner(sid, user_id):
+    """Record which user authenticated a socket (shared across workers via Redis)"""
+    redis_client.set(_socket_owner_key(sid), str(user_id), ex=SOCKET_OWNER_TTL_SECONDS)
+
+
+def unregister_socket_owner(sid):
+    """Forget a socket's owner once it disconnects"""
+    redis_client.delete(_socket_owner_key(sid))
+
+
+def originating_sid(user_id):
+    """
+    Socket.IO session id of the client that made this HTTP request, if it sent one
+
+    Clients put their socket id in the X-Socket-ID header so a broadcast of
+    their own write can skip them (they already have the data from the response).
+    The header is only honoured for a socket the requesting user authenticated;
+    anything else is ignored so a caller can't suppress another member's updates.
+    """
+    sid = request.headers.get('X-Socket-ID')
+    if not sid:
+        return None
+
+    try:
+        owner = redis_client.get(_socket_owner_key(sid))
+    except redis.RedisError:
+        return None
+    return sid if owner == str(user_id) else None
+
+
+def broadcast_to_family(event, payload, family_id, skip_sid=None):
+    """
+    Emit to the family room from a background task so the HTTP response isn't held up
+
+    The payload must already be serialized: the task runs after the request's
+    session is gone, so it must not touch ORM instances.
+    """
+    socketio.start_background_task(
+        socketio.emit, event, payload, room=f"family_{family_id}", skip_sid=skip_sid
+    )
+
+
+def queue_item_update(family_id, list_id, item):
+    """
+    Buffer an item update; the first update for a list schedules its flush
+
+    Args:
+        family_id: Family room to broadcast to
+        list_id: Shopping list the item belongs to
+        item: Serialized item (must include 'id'); a later update for the
+            same item in the window replaces the earlier one
+    """
+    key = (family_id, list_id)
+    with _lock:
+        buffer = _pending.get(key)
+        schedule = buffer is None
+        if schedule:
+            buffer = _pending[key] = {}
+        buffer[item['id']] = item
+
+    if schedule:
+        socketio.start_background_task(_flush_after_delay, key)
+
+
+def _flush_after_delay(key):
+    """Wait out the window, then emit the latest state of each buffered item"""
+    socketio.sleep(FLUSH_INTERVAL_SECONDS)
+    with _lock:
+        buffer = _pending.pop(key, None)
+    if not buffer:
+        return
+
+    family_id, _ = key
+    room = f"family_{family_id}"
+    for item in buffer.values():
+        socketio.emit('shopping_item_updated', item, room=room)
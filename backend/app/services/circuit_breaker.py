@@ -4,6 +4,7 @@ Uses database-backed state to work across multiple workers/processes.
 """
 
 import os
+import time
 from datetime import datetime, timedelta
 from sqlalchemy import text
 from app import db
@@ -13,11 +14,30 @@ from app import db
 FAILURE_THRESHOLD = int(os.getenv('RECIPE_IMPORT_CIRCUIT_FAILURE_THRESHOLD', 5))
 COOLDOWN_MINUTES = int(os.getenv('RECIPE_IMPORT_CIRCUIT_COOLDOWN_MINUTES', 15))
 
+# Per-process cache of can_attempt_llm()'s answer; the state changes rarely,
+# so most checks are answered without a SELECT
+STATE_CACHE_SECONDS = 2.0
+_state_cache = {'allowed': None, 'expires_at': 0.0}
+
+
+def _cache_state(allowed):
+    _state_cache['allowed'] = allowed
+    _state_cache['expires_at'] = time.monotonic() + STATE_CACHE_SECONDS
+    return allowed
+
+
+def _invalidate_state_cache():
+    _state_cache['expires_at'] = 0.0
+
 
 def record_llm_success():
     """
     Record a successful LLM call.
     Resets the circuit breaker to closed state.
+    When it is already closed with no failures (the common case) the WHERE
+    clause matches nothing, so no row version, lock or WAL record is written.
+    The write itself tells us the circuit is closed, so the next
+    can_attempt_llm() is answered without a SELECT.
     """
     try:
         db.session.execute(text("""
@@ -25,8 +45,10 @@ def record_llm_success():
             SET consecutive_failures = 0,
                 is_open = false
             WHERE id = 1
+              AND (consecutive_failures <> 0 OR is_open)
         """))
         db.session.commit()
+        _cache_state(True)
     except Exception as e:
         print(f"Failed to record LLM success: {e}")
         db.session.rollback()
@@ -40,6 +62,7 @@ def record_llm_failure():
     Returns:
         bool: True if circuit is now open, False otherwise
     """
+    _invalidate_state_cache()
     try:
         result = db.session.execute(text("""
             UPDATE recipe_import_circuit_state
@@ -52,7 +75,10 @@ def record_llm_failure():
 
         db.session.commit()
 
-        return result[0] if result else False
+        is_open = result[0] if result else False
+        # RETURNING already gives us the new state - no need to re-read it
+        _cache_state(not is_open)
+        return is_open
 
     except Exception as e:
         print(f"Failed to record LLM failure: {e}")
@@ -68,6 +94,9 @@ def can_attempt_llm() -> bool:
     Returns:
         bool: True if LLM call can be attempted, False if circuit is open
     """
+    if time.monotonic() < _state_cache['expires_at']:
+        return _state_cache['allowed']
+
     try:
         result = db.session.execute(text("""
             SELECT is_open, last_failure_at, consecutive_failures
@@ -77,13 +106,13 @@ def can_attempt_llm() -> bool:
 
         if not result:
             # Circuit state not initialized - allow attempt
-            return True
+            return _cache_state(True)
 
         is_open, last_failure, consecutive_failures = result
 
         # Circuit is closed - allow attempt
         if not is_open:
-            return True
+            return _cache_state(True)
 
         # Circuit is open - check if cooldown period has passed
         if last_failure:
@@ -98,10 +127,10 @@ def can_attempt_llm() -> bool:
                     WHERE id = 1
                 """))
                 db.session.commit()
-                return True
+                return _cache_state(True)
 
         # Circuit is open and cooldown not expired
-        return False
+        return _cache_state(False)
 
     except Exception as e:
         print(f"Failed to check circuit breaker state: {e}")
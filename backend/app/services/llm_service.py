@@ -5,13 +5,27 @@ Schema aligned with Pydantic models and database structure.
 """
 
 import os
+import re
 import json
+import time
+import random
+import hashlib
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import httpx
+import orjson
+import anthropic
+import openai
 from anthropic import Anthropic
 from openai import OpenAI
+from flask import current_app
+from app import cache
 from .circuit_breaker import can_attempt_llm, record_llm_success, record_llm_failure
 
 
 # LLM Prompt - Simplified schema for recipe normalization
+# Sent as the system prompt. It is too short (under 1024 tokens) for Claude's
+# prompt cache or GPT-4o's automatic prefix cache, so no cache breakpoint is set.
 LLM_PROMPT = """You are a recipe normalizer. You receive structured recipe data and return a cleaned, normalized JSON object.
 
 Return ONLY valid JSON matching this EXACT schema:
@@ -57,8 +71,106 @@ Rules:
 
 Return ONLY the JSON object. No markdown, no explanation, no code fences.
 
-Input recipe data:
-"""
+The user message is the input recipe data."""
+
+
+# Hedged mode (opt-in): start GPT if Claude has not started answering within
+# the delay and take whichever valid result arrives first (costs a second call
+# when Claude is slow to respond). Off by default: GPT is only tried after
+# Claude has failed.
+LLM_HEDGE = os.getenv('RECIPE_IMPORT_LLM_HEDGE', 'false').lower() == 'true'
+LLM_HEDGE_DELAY_SECONDS = int(os.getenv('RECIPE_IMPORT_LLM_HEDGE_DELAY_MS', 2000)) / 1000
+# Imports that can hedge at once; each needs a worker for Claude and one for GPT
+LLM_HEDGE_CONCURRENT_IMPORTS = int(os.getenv('RECIPE_IMPORT_LLM_HEDGE_CONCURRENCY', 4))
+LLM_TIMEOUT_SECONDS = 12
+
+# Transient provider errors are retried in place (jittered exponential backoff)
+# before the call counts as a failure and the other provider takes over
+LLM_MAX_RETRIES = 2
+RETRY_INITIAL_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 8
+RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504, 529})  # 529: Anthropic overloaded
+
+_hedge_executor = ThreadPoolExecutor(
+    max_workers=2 * LLM_HEDGE_CONCURRENT_IMPORTS, thread_name_prefix='llm-hedge'
+)
+
+# Normalized results keyed by a hash of the LLM input (identical source data
+# always normalizes the same way at temperature 0, so repeat imports skip
+# both providers)
+NORMALIZED_CACHE_SECONDS = int(os.getenv('RECIPE_IMPORT_LLM_CACHE_TTL', 7 * 24 * 60 * 60))
+
+# Whole response wrapped in a markdown code fence
+_FENCE_RE = re.compile(r'```[^\n]*\n?(.*?)(?:\n?```)?', re.DOTALL)
+
+# Provider clients are built once per process so their httpx pools keep
+# TLS connections alive between imports. SDK retries are off: with_retries()
+# retries only fast transient errors, never a timed-out call.
+_client_lock = threading.Lock()
+_anthropic_client = None
+_openai_client = None
+
+
+def _http_client() -> httpx.Client:
+    """Keep-alive connection pool for one provider client"""
+    return httpx.Client(limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0))
+
+
+def get_anthropic_client(api_key: str) -> Anthropic:
+    """Process-wide Anthropic client, created on first use"""
+    global _anthropic_client
+    if _anthropic_client is None:
+        with _client_lock:
+            if _anthropic_client is None:
+                _anthropic_client = Anthropic(api_key=api_key, max_retries=0, http_client=_http_client())
+    return _anthropic_client
+
+
+def get_openai_client(api_key: str) -> OpenAI:
+    """Process-wide OpenAI client, created on first use"""
+    global _openai_client
+    if _openai_client is None:
+        with _client_lock:
+            if _openai_client is None:
+                _openai_client = OpenAI(api_key=api_key, max_retries=0, http_client=_http_client())
+    return _openai_client
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a provider error is worth retrying against the same provider"""
+    # A timeout has already used up the call's budget - fall back instead
+    if isinstance(error, (anthropic.APITimeoutError, openai.APITimeoutError)):
+        return False
+    if isinstance(error, (anthropic.APIConnectionError, openai.APIConnectionError)):
+        return True
+    if isinstance(error, (anthropic.APIStatusError, openai.APIStatusError)):
+        return error.status_code in RETRYABLE_STATUS
+    return False
+
+
+def with_retries(request):
+    """
+    Run a provider request, retrying transient errors.
+
+    Args:
+        request: Zero-argument callable making the API call
+
+    Returns:
+        Whatever request() returns
+
+    Raises:
+        The last error once retries are exhausted, or any non-transient error
+    """
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        try:
+            return request()
+        except Exception as e:
+            if attempt == LLM_MAX_RETRIES or not _is_transient(e):
+                raise
+            delay = min(RETRY_MAX_DELAY_SECONDS, RETRY_INITIAL_DELAY_SECONDS * 2 ** attempt)
+            delay *= 0.5 + random.random()
+            print(f"Transient LLM error ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
 
 
 def extract_json_from_response(text: str) -> dict:
@@ -77,20 +189,17 @@ def extract_json_from_response(text: str) -> dict:
     """
     text = text.strip()
 
-    # Remove markdown code fences
-    if text.startswith('```'):
-        lines = text.split('\n')
-        # Remove first line (```json or ```)
-        lines = lines[1:]
-        # Remove last line if it's ```
-        if lines and lines[-1].strip() == '```':
-            lines = lines[:-1]
-        text = '\n'.join(lines).strip()
+    # Remove markdown code fences (opening ```json line and optional closing ```);
+    # a bare JSON object (the usual reply) goes straight to the parser
+    if text[:1] != '{' or text[-1:] != '}':
+        fenced = _FENCE_RE.fullmatch(text)
+        if fenced:
+            text = fenced.group(1).strip()
 
     # Try to parse as-is first
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
         pass
 
     # Try to find JSON object in text
@@ -99,21 +208,39 @@ def extract_json_from_response(text: str) -> dict:
 
     if start != -1 and end != -1 and end > start:
         try:
-            return json.loads(text[start:end+1])
-        except json.JSONDecodeError:
+            return orjson.loads(text[start:end+1])
+        except orjson.JSONDecodeError:
             pass
 
     # If all else fails, raise error
     raise json.JSONDecodeError("No valid JSON found in response", text, 0)
 
 
-def call_claude(payload: dict, timeout: int = 12) -> dict | None:
+def build_prompt(payload: dict) -> str:
     """
-    Call Claude 3.5 Sonnet for recipe normalization.
+    Build the user message for a recipe payload.
+    Encoded once per import and shared by the primary and fallback providers;
+    the instructions go in the system prompt.
 
     Args:
         payload: Raw recipe data to normalize
+
+    Returns:
+        The payload as indented JSON
+    """
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+
+def call_claude(prompt: str, timeout: int = 12, started: threading.Event | None = None) -> dict | None:
+    """
+    Call Claude 3.5 Sonnet for recipe normalization.
+    The reply is streamed so a hedging caller can tell a slow-but-working
+    Claude from one that hasn't responded at all.
+
+    Args:
+        prompt: User message from build_prompt()
         timeout: Request timeout in seconds
+        started: Set once the first output token arrives
 
     Returns:
         Normalized recipe dict or None if failed
@@ -130,18 +257,26 @@ def call_claude(payload: dict, timeout: int = 12) -> dict | None:
         return None
 
     try:
-        client = Anthropic(api_key=api_key)
+        client = get_anthropic_client(api_key)
+
+        def request():
+            with client.messages.stream(
+                model="claude-3-5-sonnet-20241022",
+                max_tokens=4096,
+                temperature=0,  # Deterministic output
+                system=LLM_PROMPT,
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }],
+                timeout=timeout
+            ) as stream:
+                if started is not None:
+                    next(iter(stream.text_stream), None)
+                    started.set()
+                return stream.get_final_message()
 
-        response = client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=4096,
-            temperature=0,  # Deterministic output
-            messages=[{
-                "role": "user",
-                "content": LLM_PROMPT + json.dumps(payload, indent=2)
-            }],
-            timeout=timeout
-        )
+        response = with_retries(request)
 
         content = response.content[0].text
         result = extract_json_from_response(content)
@@ -160,12 +295,12 @@ def call_claude(payload: dict, timeout: int = 12) -> dict | None:
         return None
 
 
-def call_gpt(payload: dict, timeout: int = 12) -> dict | None:
+def call_gpt(prompt: str, timeout: int = 12) -> dict | None:
     """
     Fallback to GPT-4o for recipe normalization.
 
     Args:
-        payload: Raw recipe data to normalize
+        prompt: User message from build_prompt()
         timeout: Request timeout in seconds
 
     Returns:
@@ -178,24 +313,24 @@ def call_gpt(payload: dict, timeout: int = 12) -> dict | None:
         return None
 
     try:
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key)
 
-        response = client.chat.completions.create(
+        response = with_retries(lambda: client.chat.completions.create(
             model="gpt-4o",
             messages=[
                 {
                     "role": "system",
-                    "content": "You are a recipe normalizer. Return only valid JSON matching the exact schema provided."
+                    "content": LLM_PROMPT
                 },
                 {
                     "role": "user",
-                    "content": LLM_PROMPT + json.dumps(payload, indent=2)
+                    "content": prompt
                 }
             ],
             temperature=0,
             max_tokens=4096,
             timeout=timeout
-        )
+        ))
 
         content = response.choices[0].message.content
         result = extract_json_from_response(content)
@@ -241,10 +376,73 @@ def build_llm_input(structured_data: dict) -> dict:
     }
 
 
+def _call_in_app_context(app, call, prompt: str, timeout: int, **kwargs) -> dict | None:
+    """Run a provider call on a worker thread (the circuit breaker needs db.session)"""
+    with app.app_context():
+        return call(prompt, timeout=timeout, **kwargs)
+
+
+def race_providers(prompt: str) -> dict | None:
+    """
+    Hedged request: Claude first, GPT too if Claude hasn't started answering
+    within the hedge delay or fails.
+    Returns the first valid result. A losing call that hasn't started yet is
+    cancelled; one already in flight can't be interrupted and is left to
+    finish in the background (its outcome is still recorded by the circuit
+    breaker).
+
+    Args:
+        prompt: User message from build_prompt()
+
+    Returns:
+        Normalized recipe dict or None if both providers fail
+    """
+    app = current_app._get_current_object()
+    # Set on Claude's first streamed token, or when the call ends either way
+    responding = threading.Event()
+    claude = _hedge_executor.submit(
+        _call_in_app_context, app, call_claude, prompt, LLM_TIMEOUT_SECONDS, started=responding
+    )
+    claude.add_done_callback(lambda _: responding.set())
+
+    if responding.wait(LLM_HEDGE_DELAY_SECONDS):
+        # Claude is generating (or already done) - let it finish
+        result = claude.result()
+        if result:
+            return result
+        print("Claude failed, trying GPT-4o...")
+        pending = set()
+    else:
+        print("Claude slow to respond, racing GPT-4o...")
+        pending = {claude}
+
+    gpt = _hedge_executor.submit(_call_in_app_context, app, call_gpt, prompt, LLM_TIMEOUT_SECONDS)
+    pending.add(gpt)
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            result = future.result()
+            if result:
+                for loser in pending:
+                    loser.cancel()
+                return result
+
+    print("Both Claude and GPT failed to normalize recipe")
+    return None
+
+
+def normalized_cache_key(llm_input: dict) -> str:
+    """Cache key for an LLM input payload (key order does not matter)"""
+    digest = hashlib.blake2b(orjson.dumps(llm_input, option=orjson.OPT_SORT_KEYS), digest_size=16)
+    return 'recipe_norm:' + digest.hexdigest()
+
+
 def normalize_recipe_with_llm(structured_data: dict) -> dict | None:
     """
     Normalize recipe using LLM.
-    Tries Claude first, falls back to GPT on failure.
+    Tries Claude first and falls back to GPT once it has failed (or races GPT
+    against a slow Claude when RECIPE_IMPORT_LLM_HEDGE is enabled).
 
     Args:
         structured_data: Structured recipe data (from JSON-LD or heuristic extraction)
@@ -258,14 +456,41 @@ def normalize_recipe_with_llm(structured_data: dict) -> dict | None:
     # Build LLM input payload from structured data
     llm_input = build_llm_input(structured_data)
 
+    cache_key = normalized_cache_key(llm_input)
+    try:
+        cached = cache.get(cache_key)
+    except Exception as e:
+        print(f"Normalized cache check failed: {e}")
+        cached = None
+    if cached:
+        return cached
+
+    # Encoded once for both providers
+    prompt = build_prompt(llm_input)
+
+    if LLM_HEDGE:
+        result = race_providers(prompt)
+    else:
+        result = _call_serial(prompt)
+
+    if result:
+        try:
+            cache.set(cache_key, result, timeout=NORMALIZED_CACHE_SECONDS)
+        except Exception as e:
+            print(f"Failed to cache normalized recipe: {e}")
+    return result
+
+
+def _call_serial(prompt: str) -> dict | None:
+    """Claude first, GPT only after Claude fails"""
     # Try Claude first (primary)
-    result = call_claude(llm_input)
+    result = call_claude(prompt)
     if result:
         return result
 
     # Fallback to GPT
     print("Claude failed, trying GPT-4o...")
-    result = call_gpt(llm_input)
+    result = call_gpt(prompt)
     if result:
         return result
 
@@ -7,11 +7,12 @@ Derives timers from steps with durations.
 import os
 import re
 import hashlib
-from bs4 import BeautifulSoup
-import extruct
+import lxml.html
+import orjson
+from lxml import etree
 from sqlalchemy import text
 from app import db
-from ..schemas.recipe_import import ImportedRecipe, ImportedIngredient, ImportedStep, ImportedTimer
+from ..schemas.recipe_import import ImportedRecipe
 from ..utils.http_fetcher import fetch_html
 from .llm_service import normalize_recipe_with_llm
 
@@ -21,11 +22,29 @@ MAX_INGREDIENTS = int(os.getenv('RECIPE_IMPORT_MAX_INGREDIENTS', 50))
 MAX_STEPS = int(os.getenv('RECIPE_IMPORT_MAX_STEPS', 30))
 MAX_STEP_CHARS = int(os.getenv('RECIPE_IMPORT_MAX_STEP_CHARS', 500))
 MAX_INGREDIENT_CHARS = int(os.getenv('RECIPE_IMPORT_MAX_INGREDIENT_CHARS', 100))
+# Parse regular JSON-LD recipes locally instead of sending them to the LLM
+LOCAL_PARSE_CLEAN_JSON_LD = os.getenv('RECIPE_IMPORT_LOCAL_PARSE', 'true').lower() == 'true'
+
+# "20 minutes", "1.5 hrs", "8 to 10 min", "30-45 seconds"
+_DURATION_RE = re.compile(
+    r'(?P<low>\d+(?:\.\d+)?)(?:\s*(?:to|-)\s*(?P<high>\d+(?:\.\d+)?))?\s*(?P<unit>hour|hr|min|sec)',
+    re.IGNORECASE
+)
+_UNIT_SECONDS = {'h': 3600, 'm': 60, 's': 1}
+_UNIT_RANK = {'h': 2, 'm': 1, 's': 0}
+_DIGIT_RE = re.compile(r'\d')
+
+# XHTML prolog; lxml rejects str input that still declares an encoding
+_XML_DECLARATION_RE = re.compile(r'^[\s\ufeff]*<\?xml[^>]*\?>')
+
+# Words in a list's container that mark it as ingredients or as steps
+INGREDIENT_KEYWORDS = ('ingredient',)
+STEP_KEYWORDS = ('instruction', 'direction', 'step', 'method', 'preparation')
 
 
 def get_url_hash(url: str) -> str:
-    """Generate SHA256 hash of URL for caching."""
-    return hashlib.sha256(url.encode()).hexdigest()
+    """Generate a 128-bit BLAKE2b hash of URL for caching (a lookup key, not a security boundary)."""
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
 
 
 def truncate_text(text: str, max_length: int) -> str:
@@ -56,38 +75,23 @@ def parse_duration_to_seconds(text: str) -> int | None:
     if not text:
         return None
 
-    text_lower = text.lower()
-
-    # First, try to detect ranges: "8 to 10 minutes", "30-45 min", etc.
-    range_patterns = [
-        # "8 to 10 minutes", "1 to 2 hours"
-        (r'(\d+(?:\.\d+)?)\s*(?:to|-)\s*(\d+(?:\.\d+)?)\s*(hour|hr|hours|hrs)', 3600),
-        (r'(\d+(?:\.\d+)?)\s*(?:to|-)\s*(\d+(?:\.\d+)?)\s*(minute|min|minutes|mins)', 60),
-        (r'(\d+(?:\.\d+)?)\s*(?:to|-)\s*(\d+(?:\.\d+)?)\s*(second|sec|seconds|secs)', 1),
-    ]
+    # One pass over the text; ranges beat single values and longer units beat
+    # shorter ones, the first match winning among equals
+    best = None
+    best_rank = None
+    for match in _DURATION_RE.finditer(text):
+        rank = (match.group('high') is not None, _UNIT_RANK[match.group('unit')[0].lower()])
+        if best_rank is None or rank > best_rank:
+            best, best_rank = match, rank
 
-    for pattern, multiplier in range_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            low = float(match.group(1))
-            high = float(match.group(2))
-            midpoint = (low + high) / 2
-            return int(midpoint * multiplier)
-
-    # Single value patterns
-    patterns = [
-        (r'(\d+(?:\.\d+)?)\s*(?:hour|hr|hours|hrs)', 3600),
-        (r'(\d+(?:\.\d+)?)\s*(?:minute|min|minutes|mins)', 60),
-        (r'(\d+(?:\.\d+)?)\s*(?:second|sec|seconds|secs)', 1),
-    ]
-
-    for pattern, multiplier in patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            value = float(match.group(1))
-            return int(value * multiplier)
+    if best is None:
+        return None
 
-    return None
+    multiplier = _UNIT_SECONDS[best.group('unit')[0].lower()]
+    value = float(best.group('low'))
+    if best.group('high') is not None:
+        value = (value + float(best.group('high'))) / 2
+    return int(value * multiplier)
 
 
 def parse_iso8601_duration(duration_str: str) -> int | None:
@@ -435,7 +439,7 @@ def map_llm_to_imported_recipe(llm_data: dict, source_url: str) -> dict:
         for timer in llm_data.get("timers", [])
     ]
 
-    # Generate placeholder step (ImportedRecipe requires min_items=1)
+    # Generate placeholder step (ImportedRecipe requires min_length=1)
     # In future, we could extract from original instructions if needed
     steps = [
         {
@@ -465,10 +469,38 @@ def map_llm_to_imported_recipe(llm_data: dict, source_url: str) -> dict:
     }
 
 
+def is_input_clean(structured_data: dict) -> bool:
+    """
+    Whether JSON-LD data is regular enough to parse locally, skipping the LLM.
+    Every ingredient must split into quantity + name (or be a plain name with
+    no numbers in it, e.g. "salt to taste") and every step must be plain text.
+
+    Args:
+        structured_data: Structured data built from JSON-LD
+
+    Returns:
+        True if fallback_regex_parse() can handle it as well as the LLM
+    """
+    ingredients = structured_data.get('recipeIngredient') or []
+    steps = structured_data.get('recipeInstructions') or []
+    if not structured_data.get('name') or not ingredients or not steps:
+        return False
+
+    for ingredient in ingredients:
+        if '<' in ingredient:
+            return False
+        qty, name = parse_ingredient_string(ingredient)
+        # Numbers left in an unquantified name ("flour, 2 cups") need the LLM
+        if not name or (not qty and _DIGIT_RE.search(name)):
+            return False
+
+    return all(isinstance(step, str) and step.strip() for step in steps)
+
+
 def fallback_regex_parse(structured_data: dict, source_url: str) -> dict:
     """
-    Emergency fallback if LLM fails completely.
-    Uses regex-based parsing logic (old approach).
+    Regex-based parsing: used directly for clean JSON-LD input and as the
+    emergency fallback if the LLM fails completely.
 
     Args:
         structured_data: JSON-LD or heuristic data
@@ -495,7 +527,7 @@ def fallback_regex_parse(structured_data: dict, source_url: str) -> dict:
                 step_text := (step.get('text', step) if isinstance(step, dict) else str(step)),
                 MAX_STEP_CHARS
             ),
-            "estimated_time": (parse_duration_to_seconds(step_text) // 60) if parse_duration_to_seconds(step_text) else None
+            "estimated_time": (duration_secs // 60) if (duration_secs := parse_duration_to_seconds(step_text)) else None
         }
         for i, step in enumerate(structured_data.get('recipeInstructions', [])[:MAX_STEPS])
     ]
@@ -525,22 +557,53 @@ def fallback_regex_parse(structured_data: dict, source_url: str) -> dict:
     }
 
 
-def extract_json_ld(html: str) -> dict | None:
+def parse_html(html: str):
     """
-    Extract JSON-LD Recipe schema from HTML.
-    Handles @type as both string and array.
+    Parse a page into an lxml document (an empty document for blank input)
+
+    The page is already decoded, so an XHTML encoding declaration is dropped
+    rather than letting lxml reject the string.
+    """
+    html = _XML_DECLARATION_RE.sub('', html, count=1)
+    try:
+        return lxml.html.document_fromstring(html)
+    except etree.ParserError:
+        return lxml.html.document_fromstring('<html></html>')
+
+
+def _json_ld_nodes(data):
+    """Yield every object in a JSON-LD block, including @graph members"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _json_ld_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        if isinstance(data.get('@graph'), list):
+            yield from _json_ld_nodes(data['@graph'])
+
+
+def extract_json_ld(tree) -> dict | None:
+    """
+    Extract JSON-LD Recipe schema from a parsed page.
+    Handles @type as both string and array, and Recipes nested in @graph.
 
     Args:
-        html: HTML content
+        tree: Document from parse_html()
 
     Returns:
         Parsed Recipe object or None if not found
     """
-    try:
-        data = extruct.extract(html)
-        json_ld_items = data.get('json-ld', [])
+    for script in tree.iter('script'):
+        if (script.get('type') or '').strip().lower() != 'application/ld+json' or not script.text:
+            continue
 
-        for item in json_ld_items:
+        try:
+            data = orjson.loads(script.text)
+        except orjson.JSONDecodeError as e:
+            print(f"Skipping invalid JSON-LD block: {e}")
+            continue
+
+        for item in _json_ld_nodes(data):
             type_val = item.get('@type')
 
             # Handle @type as string
@@ -551,50 +614,45 @@ def extract_json_ld(html: str) -> dict | None:
             if isinstance(type_val, list) and 'Recipe' in type_val:
                 return item
 
-    except Exception as e:
-        print(f"JSON-LD extraction failed: {e}")
-
     return None
 
 
-def extract_heuristic(html: str) -> dict:
+def extract_heuristic(tree) -> dict:
     """
     Fallback heuristic extraction when no JSON-LD available.
-    Uses BeautifulSoup to parse common recipe HTML patterns.
+    Looks for common recipe HTML patterns.
 
     Args:
-        html: HTML content
+        tree: Document from parse_html()
 
     Returns:
         Dict with extracted recipe data
     """
-    soup = BeautifulSoup(html, 'html.parser')
-
     # Extract title
-    name = soup.find('h1')
-    if not name:
-        og_title = soup.find('meta', property='og:title')
-        name = og_title.get('content') if og_title else 'Imported Recipe'
+    name = tree.find('.//h1')
+    if name is None:
+        og_title = tree.find('.//meta[@property="og:title"]')
+        name = og_title.get('content') if og_title is not None else 'Imported Recipe'
     else:
-        name = name.get_text().strip()
+        name = name.text_content().strip()
 
     # Extract image (Open Graph, schema.org, or first large image)
     image_url = ''
 
     # Try Open Graph image
-    og_image = soup.find('meta', property='og:image')
-    if og_image:
+    og_image = tree.find('.//meta[@property="og:image"]')
+    if og_image is not None:
         image_url = og_image.get('content', '')
 
     # Fallback to schema.org image
     if not image_url:
-        schema_image = soup.find('img', itemprop='image')
-        if schema_image:
+        schema_image = tree.find('.//img[@itemprop="image"]')
+        if schema_image is not None:
             image_url = schema_image.get('src', '')
 
     # Fallback to first large image (width > 300px or no width specified)
     if not image_url:
-        for img in soup.find_all('img'):
+        for img in tree.iter('img'):
             width = img.get('width')
             if not width or (width.isdigit() and int(width) > 300):
                 src = img.get('src', '')
@@ -602,48 +660,51 @@ def extract_heuristic(html: str) -> dict:
                     image_url = src
                     break
 
-    # Extract ingredients
+    # Extract ingredients and steps (with duration detection) in one pass over
+    # the lists; a container's text is lowercased once even if it holds several
     ingredients = []
-    for tag in soup.find_all(['ul', 'ol']):
-        # Check parent element for "ingredient" keyword
-        parent = tag.find_parent(['div', 'section', 'article'])
-        if parent:
-            parent_text = parent.get_text().lower()
-            if 'ingredient' in parent_text:
-                for li in tag.find_all('li'):
-                    text = li.get_text().strip()
-                    if text and len(text) > 2:  # Avoid empty or single-char items
-                        qty, name = parse_ingredient_string(text)
-                        ingredients.append({
-                            "name": truncate_text(name, MAX_INGREDIENT_CHARS),
-                            "quantity": truncate_text(qty, MAX_INGREDIENT_CHARS)
-                        })
-
-    # Extract steps with duration detection
     steps = []
     order = 1
-
-    for tag in soup.find_all(['ol', 'ul']):
-        parent = tag.find_parent(['div', 'section', 'article'])
-        if parent:
-            parent_text = parent.get_text().lower()
-            # Look for instruction/direction/step keywords
-            if any(keyword in parent_text for keyword in ['instruction', 'direction', 'step', 'method', 'preparation']):
-                for li in tag.find_all('li'):
-                    text = li.get_text().strip()
-                    if text and len(text) > 5:  # Avoid very short non-instructions
-                        text = truncate_text(text, MAX_STEP_CHARS)
-
-                        # Try to parse duration from step text
-                        duration_secs = parse_duration_to_seconds(text)
-                        estimated_time_mins = (duration_secs // 60) if duration_secs else None
-
-                        steps.append({
-                            "order": order,
-                            "instruction": text,
-                            "estimated_time": estimated_time_mins
-                        })
-                        order += 1
+    parent_texts = {}
+
+    for tag in tree.iter('ul', 'ol'):
+        # Check parent element for section keywords
+        parent = next(tag.iterancestors('div', 'section', 'article'), None)
+        if parent is None:
+            continue
+
+        parent_text = parent_texts.get(parent)
+        if parent_text is None:
+            parent_text = parent_texts[parent] = parent.text_content().lower()
+
+        is_ingredients = any(keyword in parent_text for keyword in INGREDIENT_KEYWORDS)
+        is_steps = any(keyword in parent_text for keyword in STEP_KEYWORDS)
+        if not (is_ingredients or is_steps):
+            continue
+
+        for li in tag.iter('li'):
+            text = li.text_content().strip()
+
+            if is_ingredients and text and len(text) > 2:  # Avoid empty or single-char items
+                qty, ingredient_name = parse_ingredient_string(text)
+                ingredients.append({
+                    "name": truncate_text(ingredient_name, MAX_INGREDIENT_CHARS),
+                    "quantity": truncate_text(qty, MAX_INGREDIENT_CHARS)
+                })
+
+            if is_steps and text and len(text) > 5:  # Avoid very short non-instructions
+                text = truncate_text(text, MAX_STEP_CHARS)
+
+                # Try to parse duration from step text
+                duration_secs = parse_duration_to_seconds(text)
+                estimated_time_mins = (duration_secs // 60) if duration_secs else None
+
+                steps.append({
+                    "order": order,
+                    "instruction": text,
+                    "estimated_time": estimated_time_mins
+                })
+                order += 1
 
     # Fallback if no ingredients/steps found
     if not ingredients:
@@ -750,7 +811,7 @@ def parse_recipe(url: str, family_id: str, user_id: str) -> tuple[ImportedRecipe
             # Handle legacy cache entries without image_url field
             if 'image_url' not in cached_data:
                 cached_data['image_url'] = ""
-            return ImportedRecipe(**cached_data), "cached"
+            return ImportedRecipe.model_validate(cached_data), "cached"
 
     except Exception as e:
         print(f"Cache check failed: {e}")
@@ -758,9 +819,11 @@ def parse_recipe(url: str, family_id: str, user_id: str) -> tuple[ImportedRecipe
 
     # Fetch HTML (SSRF-protected)
     html = fetch_html(url)
+    # Parsed once for both JSON-LD and heuristic extraction
+    tree = parse_html(html)
 
     # Try JSON-LD extraction first
-    json_ld = extract_json_ld(html)
+    json_ld = extract_json_ld(tree)
     extraction_method = "heuristic"
     structured_data = None
 
@@ -808,7 +871,7 @@ def parse_recipe(url: str, family_id: str, user_id: str) -> tuple[ImportedRecipe
         extraction_method = "json-ld"
     else:
         # Fallback to heuristic extraction
-        heuristic_data = extract_heuristic(html)
+        heuristic_data = extract_heuristic(tree)
 
         # Convert heuristic data to structured_data format
         structured_data = {
@@ -833,10 +896,17 @@ def parse_recipe(url: str, family_id: str, user_id: str) -> tuple[ImportedRecipe
 
     print(f"[DEBUG] Pre-LLM: prep={structured_data.get('prep_time')}min, cook={structured_data.get('cook_time')}min, servings={structured_data.get('servings')}")
 
-    # Try LLM normalization (Claude → GPT fallback)
-    llm_result = normalize_recipe_with_llm(structured_data)
+    # Regular JSON-LD needs no LLM cleanup - parse it locally
+    local_parse = (
+        extraction_method == "json-ld"
+        and LOCAL_PARSE_CLEAN_JSON_LD
+        and is_input_clean(structured_data)
+    )
 
-    if llm_result:
+    if local_parse:
+        raw_data = fallback_regex_parse(structured_data, url)
+        print(f"[DEBUG] Clean JSON-LD, parsed locally: timers={len(raw_data.get('timers', []))}")
+    elif llm_result := normalize_recipe_with_llm(structured_data):  # Claude → GPT fallback
         # LLM succeeded - map to ImportedRecipe schema
         raw_data = map_llm_to_imported_recipe(llm_result, url)
         extraction_method = "ai"
@@ -849,16 +919,16 @@ def parse_recipe(url: str, family_id: str, user_id: str) -> tuple[ImportedRecipe
         print(f"[DEBUG] Fallback: prep={raw_data.get('prep_time')}min, cook={raw_data.get('cook_time')}min, timers={len(raw_data.get('timers', []))}")
 
     # Validate with Pydantic (enforces final schema)
-    recipe = ImportedRecipe(**raw_data)
+    recipe = ImportedRecipe.model_validate(raw_data)
 
     # Cache result
     try:
         db.session.execute(text("""
             INSERT INTO recipe_import_cache (url_hash, recipe_data, cached_at)
-            VALUES (:hash, :data, now())
+            VALUES (:hash, CAST(:data AS jsonb), now())
             ON CONFLICT (url_hash)
-            DO UPDATE SET recipe_data = :data, cached_at = now()
-        """), {"hash": url_hash, "data": recipe.dict()})
+            DO UPDATE SET recipe_data = EXCLUDED.recipe_data, cached_at = now()
+        """), {"hash": url_hash, "data": recipe.model_dump_json()})
         db.session.commit()
     except Exception as e:
         print(f"Failed to cache recipe: {e}")
@@ -1,9 +1,19 @@
 """
 Timer service for managing cooking timers with Celery
 """
+import logging
+import time
 from datetime import datetime
+import redis
+from sqlalchemy.orm import selectinload
 from celery_app import celery
 from app.models.cooking_session import ActiveTimer
+from app.services.timer_state import (
+    store_timer_states, get_family_timer_states,
+    schedule_due, unschedule_due, claim_due_timers
+)
+
+logger = logging.getLogger(__name__)
 
 
 @celery.task(name='app.services.timer_service.complete_timer')
@@ -21,6 +31,7 @@ def complete_timer(timer_id, family_id):
         timer.completed_at = datetime.utcnow()
         timer.is_active = False
         timer.save()
+        store_timer_states([timer], family_id)
 
         # Broadcast completion via WebSocket
         socketio.emit(
@@ -36,37 +47,79 @@ def complete_timer(timer_id, family_id):
 
 def schedule_timer_completion(timer_id, duration, family_id):
     """
-    Schedule a timer completion event using Celery
+    Schedule a timer completion in the Redis due-timer set
+    Falls back to a Celery countdown task if Redis is unavailable
 
     Args:
         timer_id: ID of the timer to complete
         duration: Seconds until timer completes
         family_id: Family ID for WebSocket room broadcasting
     """
-    # Schedule the task to run after 'duration' seconds
-    complete_timer.apply_async(
-        args=[timer_id, family_id],
-        countdown=duration
-    )
+    try:
+        schedule_due(timer_id, time.time() + duration)
+    except redis.RedisError as e:
+        logger.warning("Failed to schedule timer %s in Redis, using Celery: %s", timer_id, e)
+        complete_timer.apply_async(
+            args=[timer_id, family_id],
+            countdown=duration
+        )
+
+
+def unschedule_timer_completion(timer_id):
+    """Remove a pending completion (pause/cancel); the is_active check covers any miss"""
+    try:
+        unschedule_due(timer_id)
+    except redis.RedisError as e:
+        logger.warning("Failed to unschedule timer %s: %s", timer_id, e)
 
 
 def cancel_timer(timer_id):
     """
     Cancel a scheduled timer
-    Note: Celery doesn't easily support canceling individual tasks,
-    so we rely on the timer's is_active flag in the database
     """
+    unschedule_timer_completion(timer_id)
     timer = ActiveTimer.get_by_id(timer_id)
     if timer:
         timer.is_active = False
         timer.save()
 
 
+def run_timer_scheduler(poll_interval=0.5):
+    """
+    Complete timers as they come due (runs forever; needs an app context)
+
+    Any number of these loops may run; claim_due_timers hands each timer
+    to exactly one of them.
+    """
+    from app import db
+
+    while True:
+        try:
+            timer_ids = claim_due_timers()
+        except redis.RedisError as e:
+            logger.error("Timer scheduler cannot reach Redis: %s", e)
+            time.sleep(poll_interval * 10)
+            continue
+
+        for timer_id in timer_ids:
+            try:
+                timer = ActiveTimer.get_by_id(timer_id)
+                if timer:
+                    complete_timer(timer_id, timer.cooking_session.family_id)
+            except Exception:
+                db.session.rollback()
+                logger.exception("Failed to complete timer %s", timer_id)
+        db.session.remove()
+
+        if not timer_ids:
+            time.sleep(poll_interval)
+
+
 def get_all_active_timers(family_id):
     """Get all active timers for a family"""
     from app.models.cooking_session import CookingSession
 
-    sessions = CookingSession.query.filter_by(
+    sessions = CookingSession.query_with_details().filter_by(
         family_id=family_id,
         is_active=True
     ).all()
@@ -84,6 +137,50 @@ def get_all_active_timers(family_id):
     return timers
 
 
+def get_live_timers(family_id):
+    """
+    Get a family's running timers, shaped like get_all_active_timers()
+    Timer state is served from Redis and the sessions/recipes are joined in
+    with one query; falls back to the database if Redis is unavailable
+    """
+    try:
+        timers = get_family_timer_states(family_id)
+    except redis.RedisError as e:
+        logger.warning("Live timer state unavailable, reading database: %s", e)
+        timers = None
+
+    if timers is None:
+        return get_all_active_timers(family_id)
+
+    timers = [timer for timer in timers if timer['is_active']]
+    if not timers:
+        return []
+
+    from app.models.cooking_session import CookingSession
+    from app.models.recipe import Recipe
+
+    sessions = CookingSession.query.options(
+        selectinload(CookingSession.recipe).selectinload(Recipe.assigned_to),
+        selectinload(CookingSession.started_by),
+    ).filter(
+        CookingSession.id.in_({timer['cooking_session_id'] for timer in timers}),
+        CookingSession.family_id == family_id,
+        CookingSession.is_active.is_(True)
+    ).all()
+
+    session_dicts = {session.id: session.to_dict() for session in sessions}
+    timers.sort(key=lambda timer: (timer['cooking_session_id'], timer['id']))
+    return [
+        {
+            'timer': timer,
+            'session': session_dicts[timer['cooking_session_id']],
+            'recipe': session_dicts[timer['cooking_session_id']]['recipe']
+        }
+        for timer in timers
+        if timer['cooking_session_id'] in session_dicts
+    ]
+
+
 def sync_timer_state(timer_id):
     """
     Sync timer state across all connected clients
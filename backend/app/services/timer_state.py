@@ -0,0 +1,175 @@
+"""
+Live timer state mirrored in Redis
+Postgres stays the source of truth; Redis holds a per-timer hash so
+WebSocket sync requests get live timer state without loading the timer rows.
+"""
+import logging
+import time
+from datetime import datetime
+import redis
+from app.config import settings
+
+STATE_TTL_SECONDS = 24 * 60 * 60
+
+redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+
+logger = logging.getLogger(__name__)
+
+
+def _timer_key(timer_id):
+    return f'timer:{timer_id}'
+
+
+def _family_key(family_id):
+    return f'family:{family_id}:timers'
+
+
+def _iso(dt):
+    """Naive UTC datetime to ISO 8601 ('' for None)"""
+    return '' if dt is None else dt.isoformat()
+
+
+def _parse_iso(value):
+    """Inverse of _iso()"""
+    return datetime.fromisoformat(value) if value else None
+
+
+def store_timer_states(timers, family_id):
+    """
+    Mirror the state of one or more ActiveTimers into Redis in one pipeline
+
+    Args:
+        timers: Iterable of ActiveTimer instances (already committed)
+        family_id: Family the timers' session belongs to
+    """
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        family_key = _family_key(family_id)
+
+        for timer in timers:
+            key = _timer_key(timer.id)
+            if timer.completed_at is not None:
+                pipe.delete(key)
+                pipe.srem(family_key, timer.id)
+                continue
+
+            pipe.hset(key, mapping={
+                'id': timer.id,
+                'created_at': _iso(timer.created_at),
+                'updated_at': _iso(timer.updated_at),
+                'cooking_session_id': timer.cooking_session_id,
+                'name': timer.name,
+                'duration': timer.duration,
+                'started_at': _iso(timer.started_at),
+                'paused_at': _iso(timer.paused_at),
+                'remaining': '' if timer.remaining_time is None else timer.remaining_time,
+                'is_active': int(bool(timer.is_active)),
+            })
+            pipe.expire(key, STATE_TTL_SECONDS)
+            pipe.sadd(family_key, timer.id)
+
+        pipe.expire(family_key, STATE_TTL_SECONDS)
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning("Failed to store timer state: %s", e)
+
+
+def get_family_timer_states(family_id):
+    """
+    Get live state for every unfinished timer of a family from Redis
+
+    Returns:
+        list | None: Timer dicts shaped like ActiveTimer.to_dict(), with
+            remaining_time computed at read time; None if an entry predates
+            the current hash layout (the caller should read the database)
+    """
+    family_key = _family_key(family_id)
+    timer_ids = redis_client.smembers(family_key)
+    if not timer_ids:
+        return []
+
+    pipe = redis_client.pipeline(transaction=False)
+    for timer_id in timer_ids:
+        pipe.hgetall(_timer_key(timer_id))
+    hashes = pipe.execute()
+
+    now = datetime.utcnow()
+    timers = []
+    stale_ids = []
+    for timer_id, state in zip(timer_ids, hashes):
+        if not state:
+            stale_ids.append(timer_id)
+            continue
+        if 'created_at' not in state:
+            return None
+
+        started_at = _parse_iso(state['started_at'])
+        paused_at = _parse_iso(state['paused_at'])
+        remaining_time = int(state['remaining']) if state['remaining'] != '' else None
+        is_paused = paused_at is not None
+        is_active = state['is_active'] == '1'
+
+        # Same arithmetic as ActiveTimer.get_remaining_time()
+        if is_paused:
+            remaining = remaining_time or 0
+        else:
+            base = remaining_time if remaining_time is not None else int(state['duration'])
+            remaining = max(0, base - int((now - started_at).total_seconds()))
+
+        timers.append({
+            'id': int(state['id']),
+            'created_at': _parse_iso(state['created_at']),
+            'updated_at': _parse_iso(state['updated_at']),
+            'cooking_session_id': int(state['cooking_session_id']),
+            'name': state['name'],
+            'duration': int(state['duration']),
+            'started_at': started_at,
+            'paused_at': paused_at,
+            'remaining_time': remaining,
+            'completed_at': None,
+            'is_active': is_active,
+            'is_paused': is_paused,
+            'is_running': is_active and not is_paused,
+            'is_completed': False,
+        })
+
+    if stale_ids:
+        redis_client.srem(family_key, *stale_ids)
+
+    return timers
+
+
+# Pending timer completions: sorted set of timer id -> due time (epoch seconds)
+DUE_TIMERS_KEY = 'timers:due'
+
+
+def schedule_due(timer_id, due_at):
+    """Add or reschedule a timer completion (re-adding just moves its score)"""
+    redis_client.zadd(DUE_TIMERS_KEY, {str(timer_id): due_at})
+
+
+def unschedule_due(timer_id):
+    """Drop a pending timer completion"""
+    redis_client.zrem(DUE_TIMERS_KEY, str(timer_id))
+
+
+def claim_due_timers(now=None, limit=100):
+    """
+    Claim timers whose due time has passed
+
+    ZREM decides ownership, so several workers can poll the same set and
+    each timer is handed to exactly one of them.
+
+    Returns:
+        list: Timer ids claimed by this caller
+    """
+    now = time.time() if now is None else now
+    due = redis_client.zrangebyscore(DUE_TIMERS_KEY, '-inf', now, start=0, num=limit)
+    if not due:
+        return []
+
+    pipe = redis_client.pipeline(transaction=False)
+    for member in due:
+        pipe.zrem(DUE_TIMERS_KEY, member)
+    removed = pipe.execute()
+    return [int(member) for member, won in zip(due, removed) if won]
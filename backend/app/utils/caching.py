@@ -2,11 +2,18 @@
 Caching utilities for frequently accessed data
 Reduces database load by caching stable data in Redis
 """
-from app import cache
+import hashlib
+from datetime import timezone
+from flask import Response, request
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload, selectinload
+from app import cache, db
 from app.models.user import User
 from app.models.family import Family, FamilyMember
 from app.models.recipe import Recipe
-from app.models.shopping_list import ShoppingList
+from app.models.shopping_list import ShoppingList, ShoppingListItem
+from app.utils.loaders import UserLoader, strict_loading
+from app.utils.serialization import dumps_bytes
 
 
 @cache.memoize(timeout=1800)  # 30 minutes - user data is stable
@@ -59,6 +66,113 @@ def get_active_shopping_lists_cached(family_id):
     return [sl.to_dict(include_items=False) for sl in lists]
 
 
+@cache.memoize(timeout=60)  # 1 minute - detail views are read far more than written
+def get_family_details_cached(family_id):
+    """
+    Get serialized family with members
+    Invalidated on family and membership changes
+    """
+    family = Family.query.options(
+        selectinload(Family.members).joinedload(FamilyMember.user)
+    ).filter_by(id=family_id).first()
+    return family.to_dict(include_members=True) if family else None
+
+
+def _recipe_tag(recipe_id, updated_at):
+    return f'recipe-{recipe_id}-{_epoch_micros(updated_at)}'
+
+
+def _shopping_list_tag(list_id, last_modified, item_count):
+    return f'list-{list_id}-{_epoch_micros(last_modified)}-{item_count}'
+
+
+def _body_entry(version, body):
+    """
+    Cache entry for a pre-encoded response body: (version, etag, body)
+
+    version is the row version the body was built from, so a reader can tell
+    a body that predates the latest write. The ETag adds a digest of the bytes,
+    so it always names exactly the body served with it - including when
+    embedded data (e.g. a user's name) changed without touching the row.
+    """
+    digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+    return version, f'{version}-{digest}', body
+
+
+@cache.memoize(timeout=60)  # 1 minute - detail views are read far more than written
+def get_recipe_json_cached(family_id, recipe_id):
+    """
+    Get the recipe detail response body ({"recipe": ...}) as JSON bytes
+    Cached pre-encoded so hits skip both the queries and serialization
+    Returns a _body_entry(), or None if the recipe does not belong to the family
+    """
+    ingredients = selectinload(Recipe.ingredients)
+    steps = selectinload(Recipe.steps)
+    timers = selectinload(Recipe.timers)
+    recipe = Recipe.query.options(*strict_loading(
+        joinedload(Recipe.assigned_to),
+        ingredients,
+        steps,
+        timers,
+        nested=(ingredients, steps, timers)
+    )).filter_by(id=recipe_id).first()
+
+    if not recipe or recipe.family_id != family_id:
+        return None
+    body = dumps_bytes({'recipe': recipe.to_dict(include_details=True)})
+    return _body_entry(_recipe_tag(recipe_id, recipe.updated_at), body)
+
+
+@cache.memoize(timeout=60)  # 1 minute - invalidated on every list/item change
+def get_shopping_list_json_cached(family_id, list_id):
+    """
+    Get the shopping list detail response body ({"shopping_list": ...}) as JSON bytes
+    Returns a _body_entry(), or None if the list does not belong to the family
+    """
+    items = selectinload(ShoppingList.items)
+    shopping_list = ShoppingList.query.options(
+        *strict_loading(items, nested=(items,))
+    ).filter_by(id=list_id).first()
+
+    if not shopping_list or shopping_list.family_id != family_id:
+        return None
+
+    loader = UserLoader.for_request().load_many(
+        user_id
+        for item in shopping_list.items
+        for user_id in (item.added_by_id, item.checked_by_id)
+    )
+    body = dumps_bytes({'shopping_list': shopping_list.to_dict(include_items=True, loader=loader)})
+
+    # Same version shopping_list_version() computes in SQL
+    last_modified = max([shopping_list.updated_at, *(item.updated_at for item in shopping_list.items)])
+    version = _shopping_list_tag(list_id, last_modified, len(shopping_list.items))
+    return _body_entry(version, body)
+
+
+def current_body(cached, family_id, object_id, version):
+    """
+    Cached (etag, body) for the live row version
+
+    An entry built before the latest write (one that skipped invalidation,
+    or raced it) is rebuilt instead of being served under a newer version.
+
+    Args:
+        cached: get_recipe_json_cached or get_shopping_list_json_cached
+        family_id: Family the object must belong to
+        object_id: Recipe or shopping list id
+        version: Version from recipe_version()/shopping_list_version()
+
+    Returns:
+        tuple | None: (etag, body), or None if not found
+    """
+    entry = cached(family_id, object_id)
+    if entry is not None and entry[0] != version:
+        cache.delete_memoized(cached, family_id, object_id)
+        entry = cached(family_id, object_id)
+    return None if entry is None else entry[1:]
+
+
 def invalidate_user_cache(user_id):
     """Invalidate cached user data when user is updated"""
     cache.delete_memoized(get_user_by_id_cached, user_id)
@@ -68,20 +182,95 @@ def invalidate_family_cache(family_id):
     """Invalidate all family-related caches"""
     cache.delete_memoized(get_family_members_cached, family_id)
     cache.delete_memoized(get_family_by_id_cached, family_id)
+    cache.delete_memoized(get_family_details_cached, family_id)
     cache.delete_memoized(get_family_recipe_count, family_id)
     cache.delete_memoized(get_active_shopping_lists_cached, family_id)
 
 
+def invalidate_user_profile_caches(user_id):
+    """
+    Invalidate cached data embedding a user's profile (name, email)
+    Family detail and member bodies carry user dicts, so every family the user
+    belongs to is invalidated too
+    """
+    invalidate_user_cache(user_id)
+    family_ids = db.session.scalars(
+        select(FamilyMember.family_id).filter_by(user_id=user_id)
+    ).all()
+    for family_id in family_ids:
+        invalidate_family_members_cache(family_id)
+
+
 def invalidate_family_members_cache(family_id):
     """Invalidate family members cache when membership changes"""
     cache.delete_memoized(get_family_members_cached, family_id)
+    cache.delete_memoized(get_family_details_cached, family_id)
 
 
-def invalidate_recipe_cache(family_id):
+def invalidate_recipe_cache(family_id, recipe_id=None):
     """Invalidate recipe-related caches"""
     cache.delete_memoized(get_family_recipe_count, family_id)
+    if recipe_id is not None:
+        cache.delete_memoized(get_recipe_json_cached, family_id, recipe_id)
 
 
-def invalidate_shopping_list_cache(family_id):
+def invalidate_shopping_list_cache(family_id, list_id=None):
     """Invalidate shopping list caches"""
     cache.delete_memoized(get_active_shopping_lists_cached, family_id)
+    if list_id is not None:
+        cache.delete_memoized(get_shopping_list_json_cached, family_id, list_id)
+
+
+def _epoch_micros(dt):
+    """Naive UTC datetime to integer microseconds since the epoch"""
+    return int(dt.replace(tzinfo=timezone.utc).timestamp() * 1_000_000)
+
+
+def recipe_version(family_id, recipe_id):
+    """
+    Version and Last-Modified for a recipe from a single-column read
+    Returns None if the recipe does not belong to the family
+    """
+    row = db.session.query(Recipe.family_id, Recipe.updated_at).filter_by(id=recipe_id).first()
+    if not row or row.family_id != family_id:
+        return None
+    return _recipe_tag(recipe_id, row.updated_at), row.updated_at
+
+
+def shopping_list_version(family_id, list_id):
+    """
+    Version and Last-Modified for a shopping list and its items
+    The item count is part of the tag so deletions change it too
+    Returns None if the list does not belong to the family
+    """
+    row = db.session.query(
+        ShoppingList.family_id,
+        ShoppingList.updated_at,
+        func.max(ShoppingListItem.updated_at).label('items_updated_at'),
+        func.count(ShoppingListItem.id).label('item_count')
+    ).outerjoin(ShoppingList.items).filter(
+        ShoppingList.id == list_id
+    ).group_by(ShoppingList.id).first()
+
+    if not row or row.family_id != family_id:
+        return None
+
+    last_modified = max(filter(None, (row.updated_at, row.items_updated_at)))
+    return _shopping_list_tag(list_id, last_modified, row.item_count), last_modified
+
+
+def not_modified(etag):
+    """304 response if the client's If-None-Match already has this ETag, else None"""
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+    return None
+
+
+def conditional_json(body, etag, last_modified):
+    """200 JSON response carrying the validators for the next conditional GET"""
+    response = Response(body, status=200, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    return response
@@ -2,7 +2,7 @@
 Authentication and authorization decorators
 """
 from functools import wraps
-from flask import jsonify
+from flask import jsonify, g
 from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
 from app.models.user import User
 from app.models.family import Family, FamilyRole
@@ -17,10 +17,22 @@ def login_required(fn):
     return wrapper
 
 
+def current_user_id():
+    """Authenticated user's id as an int, parsed from the JWT once per request"""
+    user_id = g.get('user_id')
+    if user_id is None:
+        user_id = g.user_id = int(get_jwt_identity())
+    return user_id
+
+
+def current_family_member():
+    """FamilyMember row for the current user, cached by the family_*_required decorators"""
+    return g.family_member
+
+
 def get_current_user():
     """Get current authenticated user"""
-    user_id = int(get_jwt_identity())
-    return User.get_by_id(user_id)
+    return User.get_by_id(current_user_id())
 
 
 def family_member_required(fn):
@@ -28,19 +40,22 @@ def family_member_required(fn):
     @wraps(fn)
     def wrapper(*args, **kwargs):
         verify_jwt_in_request()
-        user_id = int(get_jwt_identity())
+        user_id = current_user_id()
         family_id = kwargs.get('family_id')
 
         if not family_id:
             return jsonify({'error': 'Family ID required'}), 400
 
-        family = Family.get_by_id(family_id)
+        family = Family.get_with_members(family_id)
         if not family:
             return jsonify({'error': 'Family not found'}), 404
 
         if not family.is_member(user_id):
             return jsonify({'error': 'Not a member of this family'}), 403
 
+        # Reused by the view for role checks without another query
+        g.family_member = family.get_member(user_id)
+
         return fn(*args, **kwargs)
     return wrapper
 
@@ -50,19 +65,22 @@ def family_admin_required(fn):
     @wraps(fn)
     def wrapper(*args, **kwargs):
         verify_jwt_in_request()
-        user_id = int(get_jwt_identity())
+        user_id = current_user_id()
         family_id = kwargs.get('family_id')
 
         if not family_id:
             return jsonify({'error': 'Family ID required'}), 400
 
-        family = Family.get_by_id(family_id)
+        family = Family.get_with_members(family_id)
         if not family:
             return jsonify({'error': 'Family not found'}), 404
 
         if not family.is_admin_or_owner(user_id):
             return jsonify({'error': 'Admin privileges required'}), 403
 
+        # Reused by the view for role checks without another query
+        g.family_member = family.get_member(user_id)
+
         return fn(*args, **kwargs)
     return wrapper
 
@@ -72,18 +90,21 @@ def family_owner_required(fn):
     @wraps(fn)
     def wrapper(*args, **kwargs):
         verify_jwt_in_request()
-        user_id = int(get_jwt_identity())
+        user_id = current_user_id()
         family_id = kwargs.get('family_id')
 
         if not family_id:
             return jsonify({'error': 'Family ID required'}), 400
 
-        family = Family.get_by_id(family_id)
+        family = Family.get_with_members(family_id)
         if not family:
             return jsonify({'error': 'Family not found'}), 404
 
         if not family.is_owner(user_id):
             return jsonify({'error': 'Owner privileges required'}), 403
 
+        # Reused by the view for role checks without another query
+        g.family_member = family.get_member(user_id)
+
         return fn(*args, **kwargs)
     return wrapper
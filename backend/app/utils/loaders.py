@@ -0,0 +1,65 @@
+"""
+Request-scoped batched loaders (DataLoader pattern)
+"""
+from flask import current_app, g
+from sqlalchemy.orm import raiseload
+from app.models.user import User
+
+
+def strict_loading(*options, nested=()):
+    """
+    Loader options with lazy loads turned into errors in debug mode
+
+    Args:
+        options: Eager-load options the endpoint relies on
+        nested: Loader paths (e.g. selectinload(Parent.children)) whose
+            targets should also refuse further lazy loads
+
+    Returns:
+        tuple: Options to pass to Query.options()
+    """
+    if not current_app.debug:
+        return options
+    return (*options, *(path.raiseload('*') for path in nested), raiseload('*'))
+
+
+class UserLoader:
+    """Batches User lookups into one IN query and memoizes them for the request"""
+
+    def __init__(self):
+        self._users = {}
+        self._dicts = {}
+
+    @classmethod
+    def for_request(cls):
+        """Get the loader bound to the current request, creating it on first use"""
+        loader = g.get('user_loader')
+        if loader is None:
+            loader = g.user_loader = cls()
+        return loader
+
+    def load_many(self, user_ids):
+        """Fetch every id not seen yet in a single query; returns self for chaining"""
+        missing = {user_id for user_id in user_ids if user_id is not None and user_id not in self._users}
+        if missing:
+            for user in User.query.filter(User.id.in_(missing)).all():
+                self._users[user.id] = user
+            for user_id in missing:
+                self._users.setdefault(user_id, None)
+        return self
+
+    def get(self, user_id):
+        """User for an id (None if the id is None or unknown)"""
+        if user_id is None:
+            return None
+        if user_id not in self._users:
+            self.load_many((user_id,))
+        return self._users[user_id]
+
+    def get_dict(self, user_id):
+        """Serialized user, computed once per id per request"""
+        if user_id in self._dicts:
+            return self._dicts[user_id]
+        user = self.get(user_id)
+        data = self._dicts[user_id] = user.to_dict() if user else None
+        return data
@@ -1,17 +1,47 @@
 """
 Pagination utilities for API endpoints
 """
-from flask import request, jsonify
-from typing import Any, Dict, List
+import base64
+import binascii
+import logging
+from datetime import datetime
+from flask import Response, request, jsonify, stream_with_context
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import orjson
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Query
+from app.utils.serialization import dumps_bytes
 
+logger = logging.getLogger(__name__)
 
-def get_pagination_params() -> Dict[str, int]:
+# Pages shorter than this are encoded up front and sent as a normal response
+STREAM_MIN_ITEMS = 10
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """Opaque keyset cursor for the row at (created_at, id)"""
+    raw = orjson.dumps({'created_at': created_at.isoformat(), 'id': item_id})
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+    """Decode a cursor from encode_cursor; None if it is malformed"""
+    try:
+        data = orjson.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return datetime.fromisoformat(data['created_at']), int(data['id'])
+    except (binascii.Error, orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def get_pagination_params() -> Dict[str, Any]:
     """
     Extract pagination parameters from request query string
 
     Returns:
-        dict: Dictionary with 'page' and 'per_page' values
+        dict: Dictionary with 'page', 'per_page', 'cursor' and 'count' values.
+        'cursor' is None for page-number mode, '' for the first keyset page
+        and a decoded (created_at, id) tuple after that. 'count' is False
+        when the client sent ?count=false and needs no total (infinite scroll).
     """
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 50, type=int)
@@ -20,10 +50,16 @@ def get_pagination_params() -> Dict[str, int]:
     page = max(1, page)  # Page must be >= 1
     per_page = min(max(1, per_page), 100)  # Between 1 and 100
 
-    return {'page': page, 'per_page': per_page}
+    cursor = request.args.get('cursor')
+    if cursor:
+        cursor = decode_cursor(cursor) or ''
+
+    count = request.args.get('count', 'true').lower() != 'false'
+
+    return {'page': page, 'per_page': per_page, 'cursor': cursor, 'count': count}
 
 
-def paginate_query(query: Query, page: int, per_page: int) -> Dict[str, Any]:
+def paginate_query(query: Query, page: int, per_page: int, count: bool = True) -> Dict[str, Any]:
     """
     Paginate a SQLAlchemy query
 
@@ -31,29 +67,128 @@ def paginate_query(query: Query, page: int, per_page: int) -> Dict[str, Any]:
         query: SQLAlchemy query object
         page: Page number (1-indexed)
         per_page: Items per page
+        count: When False, skip COUNT(*) and report only has_next/has_prev
 
     Returns:
         dict: Pagination metadata and items
     """
+    offset = (page - 1) * per_page
+
+    if not count:
+        # Fetch one extra row to learn whether another page exists
+        rows = query.limit(per_page + 1).offset(offset).all()
+        return {
+            'items': rows[:per_page],
+            'pagination': _uncounted_metadata(page, per_page, len(rows) > per_page)
+        }
+
     # Get total count
     total = query.count()
 
     # Calculate pagination
-    offset = (page - 1) * per_page
     items = query.limit(per_page).offset(offset).all()
 
+    return {
+        'items': items,
+        'pagination': _page_metadata(page, per_page, total)
+    }
+
+
+def paginate_deferred(
+    query: Query, model, order_by, page: int, per_page: int, options=(), count: bool = True
+) -> Dict[str, Any]:
+    """
+    Paginate with a deferred join: OFFSET/LIMIT over ids only, then load full rows
+
+    The skipped rows are walked as bare ids (an index scan) instead of being
+    materialized with their eager-loaded relationships.
+
+    Args:
+        query: Filtered SQLAlchemy query without eager-load options
+        model: Mapped class being paged
+        order_by: Sequence of ORDER BY clauses
+        page: Page number (1-indexed)
+        per_page: Items per page
+        options: Loader options applied only to the page's rows
+        count: When False, skip COUNT(*) and report only has_next/has_prev
+
+    Returns:
+        dict: Pagination metadata and items
+    """
+    offset = (page - 1) * per_page
+    limit = per_page if count else per_page + 1
+    ids = [row[0] for row in query.with_entities(model.id).order_by(*order_by).limit(limit).offset(offset)]
+
+    if count:
+        pagination = _page_metadata(page, per_page, query.order_by(None).count())
+    else:
+        pagination = _uncounted_metadata(page, per_page, len(ids) > per_page)
+        ids = ids[:per_page]
+
+    items = []
+    if ids:
+        position = {item_id: idx for idx, item_id in enumerate(ids)}
+        items = model.query.options(*options).filter(model.id.in_(ids)).all()
+        items.sort(key=lambda item: position[item.id])
+
+    return {
+        'items': items,
+        'pagination': pagination
+    }
+
+
+def _page_metadata(page: int, per_page: int, total: int) -> Dict[str, Any]:
+    """Page-number pagination metadata"""
     # Calculate total pages
     total_pages = (total + per_page - 1) // per_page  # Ceiling division
 
+    return {
+        'page': page,
+        'per_page': per_page,
+        'total': total,
+        'total_pages': total_pages,
+        'has_next': page < total_pages,
+        'has_prev': page > 1
+    }
+
+
+def _uncounted_metadata(page: int, per_page: int, has_next: bool) -> Dict[str, Any]:
+    """Page-number pagination metadata when the total was not counted"""
+    return {
+        'page': page,
+        'per_page': per_page,
+        'has_next': has_next,
+        'has_prev': page > 1
+    }
+
+
+def paginate_keyset(query: Query, model, cursor, per_page: int) -> Dict[str, Any]:
+    """
+    Page a query newest-first by (created_at, id) without OFFSET
+
+    Args:
+        query: SQLAlchemy query object (unordered)
+        model: Mapped class providing created_at and id columns
+        cursor: '' for the first page, or a (created_at, id) tuple
+        per_page: Items per page
+
+    Returns:
+        dict: Pagination metadata (with next_cursor) and items
+    """
+    if cursor:
+        query = query.filter(tuple_(model.created_at, model.id) < cursor)
+
+    # Fetch one extra row to learn whether another page exists
+    rows = query.order_by(model.created_at.desc(), model.id.desc()).limit(per_page + 1).all()
+    items = rows[:per_page]
+    has_next = len(rows) > per_page
+
     return {
         'items': items,
         'pagination': {
-            'page': page,
             'per_page': per_page,
-            'total': total,
-            'total_pages': total_pages,
-            'has_next': page < total_pages,
-            'has_prev': page > 1
+            'has_next': has_next,
+            'next_cursor': encode_cursor(items[-1].created_at, items[-1].id) if has_next else None
         }
     }
 
@@ -78,3 +213,49 @@ def create_paginated_response(
         item_key: items,
         'pagination': pagination
     }), 200
+
+
+def stream_paginated_response(
+    items: List[Any],
+    serialize: Callable[[Any], Any],
+    pagination: Dict[str, Any],
+    item_key: str = 'items'
+) -> tuple:
+    """
+    Paginated JSON response encoded one item at a time while it is sent
+
+    Same body as create_paginated_response, but the first bytes go out
+    before later items are serialized and the full list of dicts is never
+    held in memory at once. Short pages are not worth streaming and are
+    encoded up front, so an error still becomes a normal error response.
+
+    The 200 status is sent before streamed items are encoded. If one fails,
+    the error is logged and the array is closed with an "error" key in place
+    of "pagination", so the client still gets valid JSON and can tell the
+    list is incomplete.
+
+    Args:
+        items: List of items (not yet serialized)
+        serialize: Callable turning one item into JSON-ready data
+        pagination: Pagination metadata
+        item_key: Key name for items in response
+
+    Returns:
+        tuple: (response, status_code)
+    """
+    if len(items) < STREAM_MIN_ITEMS:
+        return create_paginated_response([serialize(item) for item in items], pagination, item_key)
+
+    def generate():
+        yield b'{' + dumps_bytes(item_key) + b':['
+        try:
+            for idx, item in enumerate(items):
+                chunk = dumps_bytes(serialize(item))
+                yield b',' + chunk if idx else chunk
+        except Exception:
+            logger.exception("Failed to encode %s page item; response truncated", item_key)
+            yield b'],"error":"Response incomplete"}'
+            return
+        yield b'],"pagination":' + dumps_bytes(pagination) + b'}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json'), 200
@@ -0,0 +1,58 @@
+"""
+orjson-backed JSON serialization for HTTP responses and Socket.IO packets
+Model to_dict() output carries raw datetime objects; orjson formats them
+natively (same ISO 8601 output as datetime.isoformat()).
+"""
+import decimal
+import orjson
+from flask.json.provider import JSONProvider
+from psycopg.types.json import set_json_loads
+
+
+def _default(obj):
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+# Non-str dict keys (e.g. id-keyed maps) are stringified, as the stdlib json module does
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialize obj to JSON bytes"""
+    return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider using orjson for jsonify() and request.get_json()"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype='application/json')
+
+
+class SocketIOJSON:
+    """json-module compatible wrapper passed to Socket.IO for packet encoding"""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return dumps_bytes(obj).decode('utf-8')
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
+def install_psycopg_json():
+    """Decode json/jsonb values returned by raw SQL with orjson instead of the stdlib"""
+    set_json_loads(orjson.loads)
@@ -1,11 +1,17 @@
 """
 Input validation utilities for API endpoints
 """
+import re
 from functools import wraps
 from flask import request, jsonify
+from pydantic import ValidationError as SchemaValidationError
 from typing import Dict, List, Any, Callable
 
 
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+
+
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     def __init__(self, message: str, field: str = None):
@@ -90,9 +96,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_password(password: str) -> tuple[bool, str]:
@@ -244,3 +248,26 @@ def validate_json_schema(schema: Dict[str, Any]):
             return f(*args, **kwargs)
         return decorated_function
     return decorator
+
+
+def parse_body(schema):
+    """
+    Validate the request JSON body against a pydantic schema
+
+    Args:
+        schema: Pydantic model class
+
+    Returns:
+        Tuple of (parsed model, None) or (None, error response tuple)
+    """
+    try:
+        return schema.model_validate(request.get_json(silent=True) or {}), None
+    except SchemaValidationError as e:
+        errors = e.errors(include_url=False, include_context=False, include_input=False)
+        missing_fields = [error['loc'][0] for error in errors if error['type'] == 'missing']
+        if missing_fields:
+            return None, (jsonify({
+                'error': 'Missing required fields',
+                'missing_fields': missing_fields
+            }), 400)
+        return None, (jsonify({'error': 'Invalid request data', 'details': errors}), 400)
@@ -8,7 +8,8 @@ from flask_socketio import emit, join_room, leave_room, disconnect
 from flask_jwt_extended import decode_token
 from app.models.user import User
 from app.models.family import Family
-from app.services.timer_service import get_all_active_timers
+from app.services.timer_service import get_live_timers
+from app.services.broadcast import register_socket_owner, unregister_socket_owner
 
 
 def register_events(socketio):
@@ -24,6 +25,10 @@ def register_events(socketio):
     def handle_disconnect():
         """Handle client disconnection"""
         print(f"Client disconnected: {request.sid}")
+        try:
+            unregister_socket_owner(request.sid)
+        except Exception as e:
+            print(f"Socket owner cleanup error: {str(e)}")
 
     @socketio.on('authenticate')
     def handle_authenticate(data):
@@ -49,6 +54,9 @@ def register_events(socketio):
             # Store user_id in Flask session
             session['user_id'] = user_id
 
+            # Let HTTP requests prove this socket is theirs (X-Socket-ID)
+            register_socket_owner(request.sid, user_id)
+
             emit('authenticated', {
                 'user_id': user.id,
                 'user_name': user.name,
@@ -87,7 +95,7 @@ def register_events(socketio):
             join_room(room)
 
             # Send current state (minimal payload - frontend already has family data)
-            active_timers = get_all_active_timers(family_id)
+            active_timers = get_live_timers(family_id)
 
             emit('joined_family', {
                 'family_id': family_id,
@@ -174,7 +182,7 @@ def register_events(socketio):
                 return
 
             # Send all active timers
-            active_timers = get_all_active_timers(family_id)
+            active_timers = get_live_timers(family_id)
 
             emit('sync_response', {
                 'family_id': family_id,
@@ -1,18 +1,14 @@
 """
 Celery configuration for MealTogether background tasks
 """
-import os
 from celery import Celery
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from app.config import settings
 
 def make_celery(app_name=__name__):
     """
     Create and configure Celery instance
     """
-    redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+    redis_url = settings.redis_url
 
     celery = Celery(
         app_name,
@@ -0,0 +1,17 @@
+"""
+Gunicorn configuration for production deployment
+Green-thread (eventlet) workers handle many concurrent I/O-bound requests and
+WebSocket connections per process without a thread per client.
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
+
+# Flask-SocketIO requires one worker per process; scale out with more
+# processes behind the load balancer (rooms are shared via Redis)
+worker_class = 'eventlet'
+workers = 1
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 60))
+keepalive = 5
@@ -0,0 +1,29 @@
+"""Add (family_id, created_at, id) index on recipes for keyset pagination
+
+Revision ID: a6f3d8e41c25
+Revises: e5a0c7d2b813
+Create Date: 2026-10-16 12:05:31.774120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6f3d8e41c25'
+down_revision = 'e5a0c7d2b813'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Backward index scans serve ORDER BY created_at DESC, id DESC within a family
+    op.create_index('ix_recipes_family_created', 'recipes', ['family_id', 'created_at', 'id'])
+
+    # Single-column index is now a redundant prefix of the composite
+    op.drop_index('ix_recipes_family_id', table_name='recipes')
+
+
+def downgrade():
+    op.create_index('ix_recipes_family_id', 'recipes', ['family_id'])
+    op.drop_index('ix_recipes_family_created', table_name='recipes')
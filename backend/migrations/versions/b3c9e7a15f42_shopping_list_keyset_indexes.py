@@ -0,0 +1,39 @@
+"""Add (family_id, created_at, id) indexes on shopping_lists for keyset pagination
+
+Revision ID: b3c9e7a15f42
+Revises: a6f3d8e41c25
+Create Date: 2026-10-16 13:42:17.208364
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3c9e7a15f42'
+down_revision = 'a6f3d8e41c25'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Backward index scans serve ORDER BY created_at DESC, id DESC within a family
+    op.create_index('ix_shopping_lists_family_created', 'shopping_lists', ['family_id', 'created_at', 'id'])
+
+    # Same ordering restricted to active lists (the default listing)
+    op.drop_index('ix_shopping_lists_family_active', table_name='shopping_lists')
+    op.create_index('ix_shopping_lists_family_active', 'shopping_lists', ['family_id', 'created_at', 'id'],
+                    postgresql_where=sa.text('is_active'))
+
+    # Single-column index is now a redundant prefix of the composite
+    op.drop_index('ix_shopping_lists_family_id', table_name='shopping_lists')
+
+
+def downgrade():
+    op.create_index('ix_shopping_lists_family_id', 'shopping_lists', ['family_id'])
+
+    op.drop_index('ix_shopping_lists_family_active', table_name='shopping_lists')
+    op.create_index('ix_shopping_lists_family_active', 'shopping_lists', ['family_id'],
+                    postgresql_where=sa.text('is_active'))
+
+    op.drop_index('ix_shopping_lists_family_created', table_name='shopping_lists')
@@ -0,0 +1,29 @@
+"""Add composite (shopping_list_id, checked) index on shopping_list_items
+
+Revision ID: b7e2d9c41a53
+Revises: 614ffb04542f
+Create Date: 2026-10-16 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2d9c41a53'
+down_revision = '614ffb04542f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Composite index serves list lookups and checked/total counts as index-only scans
+    op.create_index('ix_shopping_list_items_list_checked', 'shopping_list_items', ['shopping_list_id', 'checked'])
+
+    # Single-column index is now a redundant prefix of the composite
+    op.drop_index('ix_shopping_list_items_shopping_list_id', table_name='shopping_list_items')
+
+
+def downgrade():
+    op.create_index('ix_shopping_list_items_shopping_list_id', 'shopping_list_items', ['shopping_list_id'])
+    op.drop_index('ix_shopping_list_items_list_checked', table_name='shopping_list_items')
@@ -0,0 +1,50 @@
+"""Server-side defaults for created_at/updated_at and active_timers.started_at
+
+Revision ID: c4a8e1f27b90
+Revises: b7e2d9c41a53
+Create Date: 2026-10-16 10:03:17.540921
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a8e1f27b90'
+down_revision = 'b7e2d9c41a53'
+branch_labels = None
+depends_on = None
+
+
+TABLES = [
+    'users',
+    'families',
+    'family_members',
+    'recipes',
+    'ingredients',
+    'cooking_steps',
+    'recipe_timers',
+    'shopping_lists',
+    'shopping_list_items',
+    'cooking_sessions',
+    'active_timers',
+]
+
+# Naive UTC, matching the datetime.utcnow() values already stored
+UTC_NOW = sa.text("timezone('utc', now())")
+
+
+def upgrade():
+    for table in TABLES:
+        op.alter_column(table, 'created_at', server_default=UTC_NOW)
+        op.alter_column(table, 'updated_at', server_default=UTC_NOW)
+
+    op.alter_column('active_timers', 'started_at', server_default=UTC_NOW)
+
+
+def downgrade():
+    op.alter_column('active_timers', 'started_at', server_default=None)
+
+    for table in TABLES:
+        op.alter_column(table, 'updated_at', server_default=None)
+        op.alter_column(table, 'created_at', server_default=None)
@@ -0,0 +1,33 @@
+"""Store family_members.role as VARCHAR with a CHECK constraint
+
+Revision ID: d91f3b6a0e27
+Revises: c4a8e1f27b90
+Create Date: 2026-10-16 10:41:52.207388
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd91f3b6a0e27'
+down_revision = 'c4a8e1f27b90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Enum stored member names ('OWNER'); the model now stores values ('owner')
+    op.execute("ALTER TABLE family_members ALTER COLUMN role TYPE VARCHAR(16) USING lower(role::text)")
+    op.execute("DROP TYPE IF EXISTS familyrole")
+    op.create_check_constraint(
+        'ck_family_members_role',
+        'family_members',
+        "role IN ('owner', 'admin', 'member')"
+    )
+
+
+def downgrade():
+    op.drop_constraint('ck_family_members_role', 'family_members', type_='check')
+    op.execute("CREATE TYPE familyrole AS ENUM ('OWNER', 'ADMIN', 'MEMBER')")
+    op.execute("ALTER TABLE family_members ALTER COLUMN role TYPE familyrole USING upper(role)::familyrole")
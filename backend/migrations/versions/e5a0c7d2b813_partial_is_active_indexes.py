@@ -0,0 +1,45 @@
+"""Replace boolean is_active indexes with partial indexes on live rows
+
+Revision ID: e5a0c7d2b813
+Revises: d91f3b6a0e27
+Create Date: 2026-10-16 11:20:08.531946
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a0c7d2b813'
+down_revision = 'd91f3b6a0e27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Partial indexes only hold active rows, so completed history never bloats them
+    op.drop_index('ix_cooking_sessions_family_active', table_name='cooking_sessions')
+    op.create_index('ix_cooking_sessions_family_active', 'cooking_sessions', ['family_id'],
+                    postgresql_where=sa.text('is_active'))
+    op.drop_index('ix_shopping_lists_family_active', table_name='shopping_lists')
+    op.create_index('ix_shopping_lists_family_active', 'shopping_lists', ['family_id'],
+                    postgresql_where=sa.text('is_active'))
+    op.create_index('ix_active_timers_session_active', 'active_timers', ['cooking_session_id'],
+                    postgresql_where=sa.text('is_active'))
+
+    # A btree on a bare boolean is almost never chosen by the planner
+    op.drop_index('ix_cooking_sessions_is_active', table_name='cooking_sessions')
+    op.drop_index('ix_shopping_lists_is_active', table_name='shopping_lists')
+    op.drop_index('ix_active_timers_is_active', table_name='active_timers')
+
+
+def downgrade():
+    op.create_index('ix_active_timers_is_active', 'active_timers', ['is_active'])
+    op.create_index('ix_shopping_lists_is_active', 'shopping_lists', ['is_active'])
+    op.create_index('ix_cooking_sessions_is_active', 'cooking_sessions', ['is_active'])
+
+    op.drop_index('ix_active_timers_session_active', table_name='active_timers')
+    op.drop_index('ix_shopping_lists_family_active', table_name='shopping_lists')
+    op.create_index('ix_shopping_lists_family_active', 'shopping_lists', ['family_id', 'is_active'])
+    op.drop_index('ix_cooking_sessions_family_active', table_name='cooking_sessions')
+    op.create_index('ix_cooking_sessions_family_active', 'cooking_sessions', ['family_id', 'is_active'])
@@ -10,6 +10,7 @@ from app import create_app, db
 from app.utils.url_validator import validate_url_safe
 from app.utils.http_fetcher import fetch_html
 from app.services.recipe_parser import (
+    parse_html,
     extract_json_ld,
     extract_heuristic,
     derive_timers_from_steps,
@@ -97,7 +98,7 @@ def test_json_ld_extraction():
     """
 
     try:
-        recipe = extract_json_ld(sample_html)
+        recipe = extract_json_ld(parse_html(sample_html))
         if recipe:
             print(f"✅ Successfully extracted JSON-LD recipe")
             print(f"   Name: {recipe.get('name')}")
@@ -140,7 +141,7 @@ def test_heuristic_extraction():
     """
 
     try:
-        recipe = extract_heuristic(sample_html)
+        recipe = extract_heuristic(parse_html(sample_html))
         print(f"✅ Heuristic extraction completed")
         print(f"   Name: {recipe.get('name')}")
         print(f"   Ingredients: {len(recipe.get('ingredients', []))}")
@@ -0,0 +1,92 @@
+"""
+Tests for WebSocket broadcast helpers
+"""
+
+from unittest.mock import patch, call
+from flask import Flask
+from app.services import broadcast
+
+
+def _item(item_id, checked, version):
+    return {
+        'id': item_id,
+        'shopping_list_id': 7,
+        'name': f'Item {item_id}',
+        'quantity': '1',
+        'category': None,
+        'notes': None,
+        'checked': checked,
+        'checked_by_id': 3 if checked else None,
+        'checked_at': None,
+        'version': version,
+        'updated_at': None,
+    }
+
+
+class TestQueuedItemUpdates:
+    """Test coalescing of shopping item update broadcasts"""
+
+    def setup_method(self):
+        broadcast._pending.clear()
+
+    @patch('app.services.broadcast.socketio')
+    def test_flush_emits_shopping_item_updated_per_item(self, mock_socketio):
+        first = _item(1, False, 2)
+        latest = _item(1, True, 3)
+        other = _item(2, True, 5)
+
+        broadcast.queue_item_update(4, 7, first)
+        broadcast.queue_item_update(4, 7, latest)
+        broadcast.queue_item_update(4, 7, other)
+
+        # One flush is scheduled per list, however many edits arrive
+        mock_socketio.start_background_task.assert_called_once_with(
+            broadcast._flush_after_delay, (4, 7)
+        )
+
+        broadcast._flush_after_delay((4, 7))
+
+        # Same event name and per-item payload as an unbuffered update;
+        # only the latest state of item 1 is sent
+        assert mock_socketio.emit.call_args_list == [
+            call('shopping_item_updated', latest, room='family_4'),
+            call('shopping_item_updated', other, room='family_4'),
+        ]
+        assert broadcast._pending == {}
+
+    @patch('app.services.broadcast.socketio')
+    def test_lists_flush_separately(self, mock_socketio):
+        broadcast.queue_item_update(4, 7, _item(1, True, 2))
+        broadcast.queue_item_update(4, 8, _item(9, True, 2))
+
+        assert mock_socketio.start_background_task.call_count == 2
+
+        broadcast._flush_after_delay((4, 8))
+
+        mock_socketio.emit.assert_called_once_with(
+            'shopping_item_updated', _item(9, True, 2), room='family_4'
+        )
+        assert (4, 7) in broadcast._pending
+
+
+class TestOriginatingSid:
+    """Test that X-Socket-ID is only honoured for the caller's own socket"""
+
+    def _sid_for(self, user_id, headers, owner):
+        app = Flask(__name__)
+        with app.test_request_context(headers=headers):
+            with patch.object(broadcast, 'redis_client') as client:
+                client.get.return_value = owner
+                return broadcast.originating_sid(user_id)
+
+    def test_own_socket_is_skipped(self):
+        assert self._sid_for(3, {'X-Socket-ID': 'abc'}, owner='3') == 'abc'
+
+    def test_other_users_socket_is_ignored(self):
+        assert self._sid_for(3, {'X-Socket-ID': 'abc'}, owner='8') is None
+
+    def test_unknown_socket_is_ignored(self):
+        assert self._sid_for(3, {'X-Socket-ID': 'abc'}, owner=None) is None
+
+    def test_missing_header(self):
+        assert self._sid_for(3, {}, owner='3') is None
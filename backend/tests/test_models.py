@@ -0,0 +1,110 @@
+"""
+Tests for model helpers that don't need a database
+"""
+
+from unittest.mock import patch
+import bcrypt
+from argon2 import PasswordHasher
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from app.models.user import User
+from app.models.family import Family, FamilyMember
+from app.models.shopping_list import ShoppingList, ShoppingListItem
+
+
+class TestPasswordHashing:
+    """Test Argon2id hashing with legacy bcrypt support"""
+
+    def test_new_passwords_use_argon2(self):
+        user = User()
+        user.set_password('correct horse')
+
+        assert user.password_hash.startswith('$argon2id$')
+        assert user.check_password('correct horse')
+        assert not user.check_password('wrong')
+
+    def test_current_argon2_hash_is_kept(self):
+        user = User()
+        user.set_password('correct horse')
+        password_hash = user.password_hash
+
+        assert not user.rehash_password_if_needed('correct horse')
+        assert user.password_hash == password_hash
+
+    def test_legacy_bcrypt_hash_verifies_and_is_upgraded(self):
+        user = User(password_hash=bcrypt.hashpw(b'correct horse', bcrypt.gensalt(rounds=4)).decode('utf-8'))
+
+        assert user.check_password('correct horse')
+        assert not user.check_password('wrong')
+
+        assert user.rehash_password_if_needed('correct horse')
+        assert user.password_hash.startswith('$argon2id$')
+        assert user.check_password('correct horse')
+
+    def test_outdated_argon2_parameters_are_upgraded(self):
+        weak = PasswordHasher(time_cost=1, memory_cost=8 * 1024, parallelism=1)
+        user = User(password_hash=weak.hash('correct horse'))
+
+        assert user.check_password('correct horse')
+        assert user.rehash_password_if_needed('correct horse')
+        assert not user.rehash_password_if_needed('correct horse')
+
+    def test_malformed_argon2_hash_fails_closed(self):
+        user = User(password_hash='$argon2id$garbage')
+
+        assert not user.check_password('anything')
+
+
+class TestBulkCreateWhere:
+    """Test the single-statement guarded INSERT"""
+
+    def _statement(self, rows, condition):
+        with patch('app.models.base.db.session') as mock_session:
+            mock_session.scalars.return_value.all.return_value = []
+            result = ShoppingListItem.bulk_create_where(rows, condition)
+        [stmt] = mock_session.scalars.call_args.args
+        return result, stmt
+
+    def test_builds_insert_select_from_values(self):
+        rows = [
+            {'shopping_list_id': 7, 'name': 'Milk', 'quantity': '1', 'added_by_id': 3},
+            {'shopping_list_id': 7, 'name': 'Eggs', 'quantity': '12', 'added_by_id': 3},
+        ]
+        condition = select(ShoppingList.id).where(ShoppingList.id == 7, ShoppingList.family_id == 2).exists()
+
+        result, stmt = self._statement(rows, condition)
+
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = ' '.join(str(compiled).split())
+        assert sql.startswith(
+            'INSERT INTO shopping_list_items (shopping_list_id, name, quantity, added_by_id) SELECT'
+        )
+        assert 'FROM (VALUES' in sql and 'AS new_rows' in sql
+        assert 'WHERE EXISTS (SELECT shopping_lists.id' in sql
+        assert 'RETURNING' in sql
+        assert {'Milk', 'Eggs', '12'} <= set(compiled.params.values())
+        # The guard was false: nothing inserted
+        assert result == []
+
+
+class TestDerivedValuesStayCurrent:
+    """Counts and membership lookups reflect later changes to the collections"""
+
+    def test_item_counts_follow_items(self):
+        shopping_list = ShoppingList(items=[ShoppingListItem(name='Milk', checked=True)])
+        assert (shopping_list.total_items, shopping_list.checked_items) == (1, 1)
+
+        shopping_list.items.append(ShoppingListItem(name='Eggs', checked=False))
+
+        assert (shopping_list.total_items, shopping_list.checked_items) == (2, 1)
+        assert shopping_list.completion_percentage == 50
+
+    def test_membership_follows_members(self):
+        family = Family(name='Home', members=[FamilyMember(user_id=1, role='owner')])
+        assert family.is_owner(1)
+        assert not family.is_member(2)
+
+        family.members.append(FamilyMember(user_id=2, role='member'))
+
+        assert family.is_member('2')
+        assert not family.is_admin_or_owner(2)
@@ -0,0 +1,104 @@
+"""
+Tests for keyset (cursor) pagination
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+import orjson
+from flask import Flask
+from app.models.recipe import Recipe
+from app.utils.pagination import (
+    STREAM_MIN_ITEMS, encode_cursor, decode_cursor, paginate_keyset, stream_paginated_response
+)
+
+
+def _rows(count):
+    start = datetime(2024, 5, 1, 12, 0, 0)
+    return [
+        SimpleNamespace(id=100 - idx, created_at=start - timedelta(minutes=idx))
+        for idx in range(count)
+    ]
+
+
+def _query(rows):
+    query = MagicMock()
+    query.filter.return_value = query
+    query.order_by.return_value.limit.return_value.all.return_value = rows
+    return query
+
+
+class TestCursorEncoding:
+    """Test opaque cursor round-trips"""
+
+    def test_round_trip(self):
+        created_at = datetime(2024, 5, 1, 12, 30, 15, 123456)
+        assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+    def test_malformed_cursors(self):
+        for cursor in ('not-base64!', 'bm90IGpzb24=', encode_cursor(datetime(2024, 1, 1), 1)[:-4]):
+            assert decode_cursor(cursor) is None
+
+
+class TestPaginateKeyset:
+    """Test newest-first keyset paging"""
+
+    def test_first_page_with_more_rows(self):
+        rows = _rows(4)
+        query = _query(rows)
+
+        result = paginate_keyset(query, Recipe, '', per_page=3)
+
+        query.filter.assert_not_called()
+        query.order_by.return_value.limit.assert_called_once_with(4)
+        assert result['items'] == rows[:3]
+        assert result['pagination']['has_next'] is True
+        assert decode_cursor(result['pagination']['next_cursor']) == (rows[2].created_at, rows[2].id)
+
+    def test_later_page_filters_past_cursor(self):
+        rows = _rows(2)
+        query = _query(rows)
+        cursor = (datetime(2024, 5, 1, 13, 0, 0), 101)
+
+        result = paginate_keyset(query, Recipe, cursor, per_page=3)
+
+        [condition] = query.filter.call_args.args
+        assert 'recipes.created_at, recipes.id' in str(condition)
+        assert result['items'] == rows
+        assert result['pagination'] == {'per_page': 3, 'has_next': False, 'next_cursor': None}
+
+
+class TestStreamPaginatedResponse:
+    """Test streamed page bodies"""
+
+    def _body(self, items, serialize):
+        app = Flask(__name__)
+        with app.test_request_context():
+            response, status = stream_paginated_response(items, serialize, {'page': 1}, 'lists')
+            return status, orjson.loads(b''.join(response.response))
+
+    def test_streams_full_body(self):
+        items = list(range(STREAM_MIN_ITEMS))
+
+        status, body = self._body(items, lambda n: {'n': n})
+
+        assert status == 200
+        assert body == {'lists': [{'n': n} for n in items], 'pagination': {'page': 1}}
+
+    def test_error_midway_closes_json_and_flags_it(self):
+        def serialize(n):
+            if n == 3:
+                raise RuntimeError('lazy load failed')
+            return {'n': n}
+
+        status, body = self._body(list(range(STREAM_MIN_ITEMS)), serialize)
+
+        assert body['lists'] == [{'n': 0}, {'n': 1}, {'n': 2}]
+        assert body['error'] == 'Response incomplete'
+        assert 'pagination' not in body
+
+    def test_short_page_is_encoded_up_front(self):
+        status, body = self._body([1, 2], lambda n: {'n': n})
+
+        assert status == 200
+        assert body == {'lists': [{'n': 1}, {'n': 2}], 'pagination': {'page': 1}}
@@ -5,6 +5,9 @@ Tests for recipe import functionality
 import pytest
 from unittest.mock import patch, MagicMock
 from app.services.recipe_parser import (
+    parse_html,
+    extract_json_ld,
+    extract_heuristic,
     parse_duration_to_seconds,
     derive_timers_from_steps,
     enforce_input_limits,
@@ -202,6 +205,122 @@ class TestJSONExtraction:
             extract_json_from_response("This is not JSON at all")
 
 
+class TestJSONLDExtraction:
+    """Test JSON-LD Recipe extraction from parsed pages"""
+
+    def _page(self, *blocks):
+        scripts = ''.join(
+            f'<script type="application/ld+json">{block}</script>' for block in blocks
+        )
+        return parse_html(f'<html><head>{scripts}</head><body></body></html>')
+
+    def test_top_level_recipe(self):
+        tree = self._page('{"@type": "Recipe", "name": "Pancakes"}')
+        assert extract_json_ld(tree)['name'] == "Pancakes"
+
+    def test_recipe_inside_graph(self):
+        tree = self._page('''{
+            "@context": "https://schema.org",
+            "@graph": [
+                {"@type": "WebPage", "name": "Site page"},
+                {"@type": ["Recipe", "Thing"], "name": "Pancakes"}
+            ]
+        }''')
+        assert extract_json_ld(tree)['name'] == "Pancakes"
+
+    def test_invalid_block_is_skipped(self):
+        tree = self._page('{not json', '{"@type": "Recipe", "name": "Pancakes"}')
+        assert extract_json_ld(tree)['name'] == "Pancakes"
+
+    def test_no_recipe(self):
+        tree = self._page('{"@graph": [{"@type": "Organization", "name": "Site"}]}')
+        assert extract_json_ld(tree) is None
+
+    def test_blank_page(self):
+        assert extract_json_ld(parse_html('')) is None
+
+    def test_xhtml_page_with_encoding_declaration(self):
+        tree = parse_html(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" '
+            '"http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">\n'
+            '<html xmlns="http://www.w3.org/1999/xhtml"><head>'
+            '<script type="application/ld+json">{"@type": "Recipe", "name": "Crêpes"}</script>'
+            '</head><body><h1>Crêpes</h1></body></html>'
+        )
+
+        assert extract_json_ld(tree)['name'] == "Crêpes"
+        assert extract_heuristic(tree)['name'] == "Crêpes"
+
+
+class TestHeuristicExtraction:
+    """Test lxml heuristic extraction for pages without JSON-LD"""
+
+    def test_extracts_title_ingredients_and_steps(self):
+        tree = parse_html('''
+        <html>
+        <head><meta property="og:image" content="https://example.com/cookies.jpg"></head>
+        <body>
+            <h1> Chocolate Chip Cookies </h1>
+            <div class="ingredients">
+                <h2>Ingredients</h2>
+                <ul><li>2 cups flour</li><li>1 cup sugar</li><li>x</li></ul>
+            </div>
+            <div class="instructions">
+                <h2>Instructions</h2>
+                <ol>
+                    <li>Mix the flour and sugar</li>
+                    <li>Bake for 20 minutes at 350F</li>
+                </ol>
+            </div>
+        </body>
+        </html>
+        ''')
+
+        recipe = extract_heuristic(tree)
+
+        assert recipe['name'] == "Chocolate Chip Cookies"
+        assert recipe['image_url'] == "https://example.com/cookies.jpg"
+        # Single-character items are dropped
+        assert [i['name'] for i in recipe['ingredients']] == ["flour", "sugar"]
+        assert recipe['ingredients'][0]['quantity'] == "2 cups"
+        assert [s['order'] for s in recipe['steps']] == [1, 2]
+        assert recipe['steps'][0]['estimated_time'] is None
+        assert recipe['steps'][1]['estimated_time'] == 20
+
+    def test_og_title_and_placeholders_when_nothing_found(self):
+        tree = parse_html(
+            '<html><head><meta property="og:title" content="Soup"></head>'
+            '<body><div><ul><li>Home</li><li>About</li></ul></div></body></html>'
+        )
+
+        recipe = extract_heuristic(tree)
+
+        assert recipe['name'] == "Soup"
+        assert recipe['ingredients'] == [{"name": "See source recipe", "quantity": ""}]
+        assert recipe['steps'][0]['instruction'] == "See source recipe for instructions"
+
+
+class TestNormalizedCache:
+    """The LLM result cache is optional: a Redis outage must not fail imports"""
+
+    @patch('app.services.llm_service._call_serial')
+    @patch('app.services.llm_service.cache')
+    def test_cache_errors_fall_through_to_llm(self, mock_cache, mock_call):
+        from app.services.llm_service import normalize_recipe_with_llm
+        import redis
+        mock_cache.get.side_effect = redis.ConnectionError('down')
+        mock_cache.set.side_effect = redis.ConnectionError('down')
+        mock_call.return_value = {'name': 'Pancakes'}
+
+        with patch('app.services.llm_service.LLM_HEDGE', False):
+            result = normalize_recipe_with_llm({'name': 'Pancakes'})
+
+        assert result == {'name': 'Pancakes'}
+        mock_call.assert_called_once()
+        mock_cache.set.assert_called_once()
+
+
 class TestCircuitBreaker:
     """Test circuit breaker functionality"""
 
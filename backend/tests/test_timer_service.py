@@ -0,0 +1,93 @@
+"""
+Tests for timer scheduling and live timer reads
+"""
+
+import time
+from unittest.mock import patch
+import redis
+from app.services import timer_service, timer_state
+
+
+class TestClaimDueTimers:
+    """Test claiming timers from the Redis due-timer set"""
+
+    @patch.object(timer_state, 'redis_client')
+    def test_only_timers_this_caller_removed_are_claimed(self, mock_client):
+        mock_client.zrangebyscore.return_value = ['1', '2', '3']
+        pipe = mock_client.pipeline.return_value
+        # Another worker already removed timer 2
+        pipe.execute.return_value = [1, 0, 1]
+
+        claimed = timer_state.claim_due_timers(now=1000, limit=10)
+
+        assert claimed == [1, 3]
+        mock_client.zrangebyscore.assert_called_once_with(
+            timer_state.DUE_TIMERS_KEY, '-inf', 1000, start=0, num=10
+        )
+        assert [c.args for c in pipe.zrem.call_args_list] == [
+            (timer_state.DUE_TIMERS_KEY, '1'),
+            (timer_state.DUE_TIMERS_KEY, '2'),
+            (timer_state.DUE_TIMERS_KEY, '3'),
+        ]
+
+    @patch.object(timer_state, 'redis_client')
+    def test_nothing_due(self, mock_client):
+        mock_client.zrangebyscore.return_value = []
+
+        assert timer_state.claim_due_timers(now=1000) == []
+        mock_client.pipeline.assert_not_called()
+
+
+class TestScheduleTimerCompletion:
+    """Test scheduling with the Celery fallback"""
+
+    @patch.object(timer_service, 'complete_timer')
+    @patch.object(timer_service, 'schedule_due')
+    def test_schedules_in_redis(self, mock_schedule_due, mock_task):
+        before = time.time()
+        timer_service.schedule_timer_completion(5, 300, family_id=2)
+
+        timer_id, due_at = mock_schedule_due.call_args.args
+        assert timer_id == 5
+        assert before + 300 <= due_at <= time.time() + 300
+        mock_task.apply_async.assert_not_called()
+
+    @patch.object(timer_service, 'complete_timer')
+    @patch.object(timer_service, 'schedule_due', side_effect=redis.ConnectionError('down'))
+    def test_falls_back_to_celery_countdown(self, mock_schedule_due, mock_task):
+        timer_service.schedule_timer_completion(5, 300, family_id=2)
+
+        mock_task.apply_async.assert_called_once_with(args=[5, 2], countdown=300)
+
+    @patch.object(timer_service, 'unschedule_due', side_effect=redis.ConnectionError('down'))
+    def test_unschedule_swallows_redis_errors(self, mock_unschedule_due):
+        timer_service.unschedule_timer_completion(5)
+
+        mock_unschedule_due.assert_called_once_with(5)
+
+
+class TestGetLiveTimers:
+    """Test the database fallback for live timer reads"""
+
+    @patch.object(timer_service, 'get_all_active_timers')
+    @patch.object(timer_service, 'get_family_timer_states', side_effect=redis.ConnectionError('down'))
+    def test_redis_error_reads_database(self, mock_states, mock_all_active):
+        mock_all_active.return_value = [{'timer': {}, 'session': {}, 'recipe': {}}]
+
+        assert timer_service.get_live_timers(2) == mock_all_active.return_value
+        mock_all_active.assert_called_once_with(2)
+
+    @patch.object(timer_service, 'get_all_active_timers')
+    @patch.object(timer_service, 'get_family_timer_states', return_value=None)
+    def test_missing_state_reads_database(self, mock_states, mock_all_active):
+        timer_service.get_live_timers(2)
+
+        mock_all_active.assert_called_once_with(2)
+
+    @patch.object(timer_service, 'get_all_active_timers')
+    @patch.object(timer_service, 'get_family_timer_states')
+    def test_no_running_timers(self, mock_states, mock_all_active):
+        mock_states.return_value = [{'id': 1, 'cooking_session_id': 3, 'is_active': False}]
+
+        assert timer_service.get_live_timers(2) == []
+        mock_all_active.assert_not_called()
@@ -0,0 +1,89 @@
+"""
+Tests for live timer state kept in Redis
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch, MagicMock
+from app.models.cooking_session import ActiveTimer
+from app.services import timer_state
+
+
+def _timer(**overrides):
+    now = datetime.utcnow().replace(microsecond=0)
+    fields = dict(
+        id=5,
+        created_at=now - timedelta(minutes=10),
+        updated_at=now - timedelta(minutes=2),
+        cooking_session_id=3,
+        name='Simmer sauce',
+        duration=600,
+        started_at=now - timedelta(seconds=120),
+        paused_at=None,
+        remaining_time=None,
+        completed_at=None,
+        is_active=True,
+    )
+    fields.update(overrides)
+    return ActiveTimer(**fields)
+
+
+def _stored_hash(timer):
+    """What store_timer_states() writes for a timer"""
+    pipe = MagicMock()
+    with patch.object(timer_state, 'redis_client') as client:
+        client.pipeline.return_value = pipe
+        timer_state.store_timer_states([timer], family_id=1)
+    return pipe.hset.call_args.kwargs['mapping']
+
+
+def _read_back(mapping):
+    """Run get_family_timer_states() against a Redis holding one timer hash"""
+    stored = {key: str(value) for key, value in mapping.items()}
+    pipe = MagicMock()
+    pipe.execute.return_value = [stored]
+    with patch.object(timer_state, 'redis_client') as client:
+        client.smembers.return_value = {stored['id']}
+        client.pipeline.return_value = pipe
+        return timer_state.get_family_timer_states(1)
+
+
+class TestTimerStateShape:
+    """Redis-served timers must look exactly like ActiveTimer.to_dict()"""
+
+    def test_running_timer_matches_to_dict(self):
+        timer = _timer()
+        [state] = _read_back(_stored_hash(timer))
+
+        expected = timer.to_dict()
+        assert list(state) == list(expected)
+        for key in expected:
+            if key == 'remaining_time':
+                # Computed at read time; allow for a second ticking over
+                assert abs(state[key] - expected[key]) <= 1
+            else:
+                assert state[key] == expected[key], key
+
+    def test_paused_timer_matches_to_dict(self):
+        timer = _timer(paused_at=datetime.utcnow().replace(microsecond=0), remaining_time=240)
+        [state] = _read_back(_stored_hash(timer))
+
+        assert state == timer.to_dict()
+        assert state['remaining_time'] == 240
+        assert state['is_paused'] and not state['is_running']
+
+    def test_completed_timer_is_removed(self):
+        timer = _timer(completed_at=datetime.utcnow(), is_active=False)
+        pipe = MagicMock()
+        with patch.object(timer_state, 'redis_client') as client:
+            client.pipeline.return_value = pipe
+            timer_state.store_timer_states([timer], family_id=1)
+
+        pipe.delete.assert_called_once_with('timer:5')
+        pipe.srem.assert_called_once_with('family:1:timers', 5)
+        pipe.hset.assert_not_called()
+
+    def test_old_hash_layout_defers_to_database(self):
+        mapping = _stored_hash(_timer())
+        del mapping['created_at']
+
+        assert _read_back(mapping) is None
@@ -0,0 +1,21 @@
+"""
+Timer completion worker
+Polls the Redis due-timer set and completes cooking timers as they expire.
+
+Run alongside the web workers (several instances are safe):
+    python timer_worker.py
+"""
+from app.config import settings
+
+if settings.socketio_async_mode == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+
+from app import create_app
+from app.services.timer_service import run_timer_scheduler
+
+app = create_app()
+
+if __name__ == '__main__':
+    with app.app_context():
+        run_timer_scheduler()
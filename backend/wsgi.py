@@ -1,6 +1,15 @@
 """
 WSGI entry point for production deployment
+
+Run with a single eventlet worker per process:
+    gunicorn -c gunicorn.conf.py wsgi:app
 """
+from app.config import settings
+
+if settings.socketio_async_mode == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+
 from app import create_app, socketio
 
 app = create_app()